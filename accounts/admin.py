@@ -9,7 +9,9 @@ including dynamic field visibility based on user roles.
 
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.db import transaction
 from .models import User
+from .signals import evict_users
 
 
 class UserAdmin(BaseUserAdmin):
@@ -20,6 +22,7 @@ class UserAdmin(BaseUserAdmin):
     - Displays different fields depending on the user's role (e.g., only students have `varsity_id` and `session`).
     - Supports search, filtering, and ordering.
     - Customizes the add and change user forms.
+    - Bulk actions to deactivate or reactivate the selected users.
     """
 
     # Columns shown in the admin list view
@@ -81,6 +84,28 @@ class UserAdmin(BaseUserAdmin):
     # Prevent editing of `is_superuser` directly
     readonly_fields = ('is_superuser',)
 
+    actions = ('deactivate_users', 'activate_users')
+
+    @admin.action(description='Deactivate selected users')
+    def deactivate_users(self, request, queryset):
+        self._set_active(request, queryset, False)
+
+    @admin.action(description='Activate selected users')
+    def activate_users(self, request, queryset):
+        self._set_active(request, queryset, True)
+
+    def _set_active(self, request, queryset, is_active):
+        """
+        Updates is_active in one query. update() sends no signals, so the
+        users are evicted from the authentication cache explicitly.
+        """
+        with transaction.atomic():
+            user_ids = list(queryset.values_list('pk', flat=True))
+            updated = queryset.update(is_active=is_active)
+            evict_users(user_ids)
+        state = 'activated' if is_active else 'deactivated'
+        self.message_user(request, f'{updated} user(s) {state}.')
+
     def get_fieldsets(self, request, obj=None):
         """
         Adjust fieldsets based on the user's role.
@@ -15,4 +15,13 @@ class AccountsConfig(AppConfig):
     Configuration for the accounts application.
     """
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'accounts'
\ No newline at end of file
+    name = 'accounts'
+
+    def ready(self):
+        # Register signal handlers
+        from . import signals  # noqa: F401
+
+        # Periodic pruning of expired tokens, if TOKEN_PRUNING enables it
+        from django.core.signals import request_started
+        from .pruning import start_periodic_pruning
+        request_started.connect(start_periodic_pruning, dispatch_uid='accounts.token_pruning')
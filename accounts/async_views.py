@@ -0,0 +1,70 @@
+"""
+Async versions of the hot accounts endpoints, served by the ASGI deployment
+(see cupcp_backend/asgi_urls.py). Behaviour and responses match
+StudentLoginAPIView and UserRegistrationAPIView.get in accounts/views.py.
+"""
+
+# Relative Path: accounts/async_views.py
+
+from asgiref.sync import sync_to_async
+from rest_framework import status
+
+from cupcp_backend.asyncapi import AsyncAPIView
+from cupcp_backend.conditional import not_modified, weak_etag, with_etag
+
+from .hashing import verify_password
+from .models import User
+from .serializers import StudentLoginSerializer, UserDetailSerializer
+from .throttling import LOGIN_THROTTLES
+from .tokens import IndexedRefreshToken
+from .views import UserRegistrationAPIView
+
+
+class AsyncStudentLoginView(AsyncAPIView):
+    """
+    Authenticates a student using varsity_id and password.
+
+    The user lookup and token write use the async ORM; the PBKDF2 check
+    runs in a worker thread (or on the hashing pool) off the event loop.
+    """
+    authentication_required = False
+    throttle_classes = LOGIN_THROTTLES
+    throttle_scope = 'student_login'
+    throttle_identity_field = 'varsity_id'
+
+    async def post(self, request):
+        serializer = StudentLoginSerializer(data=request.data)
+        if not serializer.is_valid():
+            return self.respond(serializer.errors, status.HTTP_400_BAD_REQUEST)
+
+        varsity_id = serializer.validated_data['varsity_id']
+        password = serializer.validated_data['password']
+        try:
+            user = await User.objects.aget(varsity_id=varsity_id, role='student')
+        except User.DoesNotExist:
+            return self.respond({'error': 'Invalid credentials.'}, status.HTTP_401_UNAUTHORIZED)
+
+        if not await sync_to_async(verify_password, thread_sensitive=False)(user, password):
+            return self.respond({'error': 'Invalid credentials.'}, status.HTTP_401_UNAUTHORIZED)
+
+        refresh = await IndexedRefreshToken.afor_user(user)
+        return self.respond({
+            'refresh': str(refresh),
+            'access': str(refresh.access_token),
+            'role': user.role,
+        })
+
+
+class AsyncUserProfileView(AsyncAPIView):
+    """
+    GET: Retrieves the authenticated user's profile. POST and PUT are
+    served by the synchronous UserRegistrationAPIView.
+    """
+    sync_view = staticmethod(UserRegistrationAPIView.as_view())
+
+    async def get(self, request):
+        etag = weak_etag(request.user.pk, request.user.updated_at)
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+        return with_etag(self.respond(UserDetailSerializer(request.user).data), etag)
@@ -0,0 +1,205 @@
+"""
+JWT authentication with cached token validation and user resolution.
+
+Simple JWT decodes the token and runs a SELECT on accounts.User for every
+request. CachedJWTAuthentication keeps:
+
+- a bounded per-process LRU of validated tokens (entries expire with the token),
+- a short per-process TTL cache of users keyed by id, and
+- a longer-lived copy of each user in the ``shared`` cache, visible to all
+  workers on the host.
+
+User.save()/delete() invalidate both user layers (see accounts/signals.py),
+so password changes and deactivation reach this worker immediately and other
+workers within ``LOCAL_TTL`` seconds. Bulk writes send no signals; code that
+changes users with QuerySet.update() must call signals.evict_users().
+"""
+
+# Relative Path: accounts/authentication.py
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from .models import User
+
+
+# -----------------------------------------------------------------------------
+# Per-process LRU with expiry
+# -----------------------------------------------------------------------------
+class ExpiringLRUCache:
+    """
+    Thread-safe LRU mapping whose entries also carry an expiry timestamp.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, expires_at):
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+def _cache_settings():
+    return {
+        'TOKEN_CACHE_SIZE': 4096,
+        'USER_CACHE_SIZE': 4096,
+        'LOCAL_TTL': 5,
+        'SHARED_TTL': 300,
+        **getattr(settings, 'JWT_USER_CACHE', {}),
+    }
+
+
+_config = _cache_settings()
+_token_cache = ExpiringLRUCache(_config['TOKEN_CACHE_SIZE'])
+_user_cache = ExpiringLRUCache(_config['USER_CACHE_SIZE'])
+
+
+def _shared_key(user_id):
+    return f'auth:user:{user_id}'
+
+
+# -----------------------------------------------------------------------------
+# User cache helpers
+# -----------------------------------------------------------------------------
+def get_cached_user(user_id):
+    """
+    Returns the User with `user_id` from the local cache, the shared cache
+    or the database, in that order; None if no such user exists.
+    """
+    user = _user_cache.get(user_id)
+    if user is None:
+        shared = caches['shared']
+        user = shared.get(_shared_key(user_id))
+        if user is None:
+            try:
+                user = User.objects.get(**{api_settings.USER_ID_FIELD: user_id})
+            except User.DoesNotExist:
+                return None
+            shared.set(_shared_key(user_id), user, timeout=_config['SHARED_TTL'])
+        _user_cache.set(user_id, user, time.time() + _config['LOCAL_TTL'])
+    # Views may modify request.user, so never hand out the cached instance
+    return copy.copy(user)
+
+
+async def aget_cached_user(user_id):
+    """get_cached_user() for async views, using the async cache and ORM APIs."""
+    user = _user_cache.get(user_id)
+    if user is None:
+        shared = caches['shared']
+        user = await shared.aget(_shared_key(user_id))
+        if user is None:
+            try:
+                user = await User.objects.aget(**{api_settings.USER_ID_FIELD: user_id})
+            except User.DoesNotExist:
+                return None
+            await shared.aset(_shared_key(user_id), user, timeout=_config['SHARED_TTL'])
+        _user_cache.set(user_id, user, time.time() + _config['LOCAL_TTL'])
+    return copy.copy(user)
+
+
+def invalidate_cached_user(user_id):
+    """Drops a user from the local and shared caches."""
+    invalidate_cached_users([user_id])
+
+
+def invalidate_cached_users(user_ids):
+    """Drops several users from the local and shared caches at once."""
+    for user_id in user_ids:
+        _user_cache.delete(user_id)
+    caches['shared'].delete_many([_shared_key(user_id) for user_id in user_ids])
+
+
+# -----------------------------------------------------------------------------
+# Authentication class
+# -----------------------------------------------------------------------------
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    Drop-in replacement for JWTAuthentication backed by the caches above.
+    """
+
+    def get_validated_token(self, raw_token):
+        token = _token_cache.get(raw_token)
+        if token is not None:
+            return token
+        token = super().get_validated_token(raw_token)
+        expires_at = token.get('exp')
+        if expires_at is not None:
+            _token_cache.set(raw_token, token, expires_at)
+        return token
+
+    def get_user(self, validated_token):
+        """
+        Same checks as JWTAuthentication.get_user, with the user read through
+        the caches.
+        """
+        return self._check_user(get_cached_user(self._user_id(validated_token)), validated_token)
+
+    async def aauthenticate(self, request):
+        """authenticate() for async views."""
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+        user = await aget_cached_user(self._user_id(validated_token))
+        return self._check_user(user, validated_token), validated_token
+
+    def _user_id(self, validated_token):
+        try:
+            return validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+    def _check_user(self, user, validated_token):
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+            ) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+        return user
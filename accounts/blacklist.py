@@ -0,0 +1,157 @@
+"""
+In-memory pre-check for the refresh token blacklist.
+
+Each worker keeps a Bloom filter of blacklisted JTIs, built from the
+BlacklistedToken table and updated by every blacklist() call it serves.
+A JTI blacklisted by another worker is announced through a per-JTI flag in
+the ``shared`` cache (one writer per key, so no read-modify-write races).
+
+A lookup therefore costs no query in the common "not blacklisted" case;
+a Bloom filter hit or a shared flag is confirmed against the database.
+The filter also resyncs from the database every MAX_STALENESS seconds to
+pick up rows written elsewhere (e.g. the admin) or flags evicted from the
+shared cache.
+"""
+
+# Relative Path: accounts/blacklist.py
+
+import hashlib
+import math
+import threading
+import time
+
+from django.core.cache import caches
+from django.db import transaction
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+
+# Resync from the database at least this often (seconds)
+MAX_STALENESS = 30
+
+# Re-read this many ids below the high-water mark on every resync, to pick
+# up rows whose transactions committed out of id order.
+SYNC_LOOKBACK = 256
+
+
+def _flag_key(jti):
+    return f'auth:blacklisted:{jti}'
+
+
+# -----------------------------------------------------------------------------
+# Bloom Filter
+# -----------------------------------------------------------------------------
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings using double hashing of one
+    BLAKE2b digest.
+    """
+
+    def __init__(self, capacity, error_rate=0.001):
+        self.capacity = max(capacity, 1)
+        self.size = max(8, math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, item):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item):
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+
+# -----------------------------------------------------------------------------
+# Blacklist Index
+# -----------------------------------------------------------------------------
+class BlacklistIndex:
+    """
+    Per-worker Bloom filter of blacklisted JTIs kept in step with the
+    BlacklistedToken table.
+    """
+    min_capacity = 100_000
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._filter = None
+        self._loaded = 0
+        self._last_id = 0
+        self._synced_at = 0.0
+
+    def might_contain(self, jti):
+        """
+        False means the JTI is definitely not blacklisted; True means the
+        caller must confirm against the database.
+        """
+        self._sync()
+        if jti in self._filter:
+            return True
+        if caches['shared'].get(_flag_key(jti)):
+            with self._lock:
+                self._filter.add(jti)
+            return True
+        return False
+
+    def add(self, jti, expires_at):
+        """
+        Records a JTI blacklisted by this worker and, once the transaction
+        commits, flags it for the other workers until the token expires.
+        """
+        self._sync()
+        with self._lock:
+            self._filter.add(jti)
+
+        def announce():
+            timeout = max(1, math.ceil(expires_at - time.time()))
+            caches['shared'].set(_flag_key(jti), True, timeout=timeout)
+
+        transaction.on_commit(announce)
+
+    def reset(self):
+        with self._lock:
+            self._filter = None
+            self._loaded = 0
+            self._last_id = 0
+
+    def _sync(self):
+        if self._filter is not None and time.monotonic() - self._synced_at < MAX_STALENESS:
+            return
+        with self._lock:
+            if self._filter is None:
+                self._rebuild()
+            else:
+                rows = list(
+                    BlacklistedToken.objects.filter(id__gt=self._last_id - SYNC_LOOKBACK)
+                    .values_list('id', 'token__jti')
+                )
+                if self._loaded + len(rows) > self._filter.capacity:
+                    self._rebuild()
+                else:
+                    self._load(rows)
+            self._synced_at = time.monotonic()
+
+    def _rebuild(self):
+        rows = list(BlacklistedToken.objects.values_list('id', 'token__jti'))
+        self._filter = BloomFilter(max(self.min_capacity, len(rows) * 2))
+        self._loaded = 0
+        self._last_id = 0
+        self._load(rows)
+
+    def _load(self, rows):
+        for row_id, jti in rows:
+            if row_id > self._last_id:
+                self._loaded += 1
+            self._filter.add(jti)
+        if rows:
+            self._last_id = max(self._last_id, max(row_id for row_id, _ in rows))
+
+
+blacklist_index = BlacklistIndex()
@@ -0,0 +1,144 @@
+"""
+Off-thread password verification for the login endpoints.
+
+When ``settings.PASSWORD_HASH_POOL['ENABLED']`` is set, PBKDF2 checks run on
+a bounded process pool instead of the request thread. The number of pending
+verifications is capped; once the cap is reached new logins fail fast with
+503 instead of queueing behind the hashing backlog.
+"""
+
+# Relative Path: accounts/hashing.py
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import django
+from django.conf import settings
+from django.contrib.auth.hashers import check_password
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+# -----------------------------------------------------------------------------
+# Exceptions
+# -----------------------------------------------------------------------------
+class HashingPoolBusy(APIException):
+    """
+    Raised when the hashing pool is saturated or too slow to answer.
+    DRF renders it as 503 with a Retry-After header.
+    """
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = 'Login is temporarily busy, please retry shortly.'
+    default_code = 'hashing_pool_busy'
+    wait = 1
+
+
+# -----------------------------------------------------------------------------
+# Password Verifier
+# -----------------------------------------------------------------------------
+def _init_worker():
+    """Load Django settings (PASSWORD_HASHERS) in freshly spawned workers."""
+    django.setup()
+
+
+class PasswordVerifier:
+    """
+    Verifies passwords on a process pool with a bounded number of
+    in-flight checks.
+    """
+
+    def __init__(self, workers, max_pending, timeout):
+        self.workers = workers
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def _get_executor(self):
+        # Created lazily so the pool is spawned in the serving process,
+        # not in a pre-fork master. "spawn" avoids forking a threaded worker.
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context('spawn'),
+                        initializer=_init_worker,
+                    )
+        return self._executor
+
+    def verify(self, raw_password, encoded):
+        """
+        Returns True when `raw_password` matches the `encoded` hash.
+        Raises HashingPoolBusy when the pending limit is reached or the
+        check does not finish within the timeout.
+        """
+        if not self._slots.acquire(blocking=False):
+            raise HashingPoolBusy()
+        try:
+            future = self._get_executor().submit(check_password, raw_password, encoded)
+        except Exception:
+            self._slots.release()
+            raise
+        # The slot is held until the worker is done, even if we stop waiting
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            raise HashingPoolBusy()
+
+    def shutdown(self, wait=False):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait, cancel_futures=True)
+                self._executor = None
+
+
+_verifier = None
+_verifier_lock = threading.Lock()
+
+
+def get_password_verifier():
+    """
+    Returns the process-wide PasswordVerifier, or None when the pool is disabled.
+    """
+    global _verifier
+    config = getattr(settings, 'PASSWORD_HASH_POOL', {})
+    if not config.get('ENABLED'):
+        return None
+    if _verifier is None:
+        with _verifier_lock:
+            if _verifier is None:
+                _verifier = PasswordVerifier(
+                    workers=config.get('WORKERS', 2),
+                    max_pending=config.get('MAX_PENDING', 16),
+                    timeout=config.get('TIMEOUT', 5.0),
+                )
+    return _verifier
+
+
+def verify_password(user, raw_password):
+    """
+    Checks `raw_password` for `user`, on the pool when it is enabled.
+
+    The pool path does not upgrade outdated hashes; that still happens on
+    the next login served without the pool.
+    """
+    verifier = get_password_verifier()
+    if verifier is None:
+        return user.check_password(raw_password)
+    # Unusable hashes still cost one hash (check_password fakes the runtime)
+    return verifier.verify(raw_password, user.password)
+
+
+def verify_unknown_user(raw_password):
+    """
+    Spends one password check on a login naming no account, so response
+    times do not reveal which accounts exist. Always returns False.
+    """
+    verifier = get_password_verifier()
+    if verifier is None:
+        return check_password(raw_password, None)
+    return verifier.verify(raw_password, None)
@@ -0,0 +1,22 @@
+"""
+Management command to delete the per-worker /metrics snapshots, including
+those left behind by exited workers. Run it while the server is stopped;
+the counters start again from zero.
+
+Usage:
+    python manage.py clear_metrics
+"""
+
+# Relative Path: accounts/management/commands/clear_metrics.py
+
+from django.core.management.base import BaseCommand
+
+from cupcp_backend.metrics import clear_snapshots
+
+
+class Command(BaseCommand):
+    help = "Deletes the per-worker metrics snapshots in METRICS['DIR']."
+
+    def handle(self, *args, **options):
+        removed = clear_snapshots()
+        self.stdout.write(self.style.SUCCESS(f'Removed {removed} metrics snapshot(s).'))
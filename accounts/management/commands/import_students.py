@@ -0,0 +1,252 @@
+"""
+Management command to bulk-import students from the registrar's CSV.
+
+The file is read as a stream and processed in batches: rows are validated
+in Python, checked for duplicates against the database with one query per
+unique field, hashed across a process pool and inserted with bulk_create.
+Rejected rows are written to a CSV error report.
+
+Usage:
+    python manage.py import_students students.csv --batch-size 500 --workers 4
+
+Expected columns:
+    full_name, email, varsity_id, session, gender, phone_number, password
+"""
+
+# Relative Path: accounts/management/commands/import_students.py
+
+import csv
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.core.validators import validate_email
+from django.db import IntegrityError, transaction
+
+from accounts.models import (
+    GENDER_CHOICES,
+    PHONE_VALIDATOR,
+    SESSION_CHOICES,
+    VARSITY_ID_VALIDATOR,
+    User,
+)
+from accounts.serializers import PASSWORD_REGEX
+
+
+REQUIRED_COLUMNS = (
+    'full_name', 'email', 'varsity_id', 'session', 'gender', 'phone_number', 'password'
+)
+UNIQUE_FIELDS = ('email', 'varsity_id', 'phone_number')
+VALID_SESSIONS = {value for value, _ in SESSION_CHOICES}
+VALID_GENDERS = {value for value, _ in GENDER_CHOICES}
+
+
+def _init_worker():
+    """Make sure Django settings are loaded in pool workers (spawn start method)."""
+    django.setup()
+
+
+class Command(BaseCommand):
+    help = "Bulk-imports students from a CSV file with parallel password hashing."
+
+    def add_arguments(self, parser):
+        parser.add_argument('csv_path', help="Path to the CSV file, or '-' for stdin.")
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Rows validated, hashed and inserted together (default: 500).',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Password hashing processes; 0 hashes in this process (default: CPU count).',
+        )
+        parser.add_argument(
+            '--report',
+            default='import_students_errors.csv',
+            help='Where to write the per-row error report.',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Validate and check duplicates without hashing or inserting.',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError('--batch-size must be at least 1.')
+
+        started = time.monotonic()
+        self.created = self.rejected = 0
+        # Unique values already accepted from earlier rows of this file
+        self.seen = {field: set() for field in UNIQUE_FIELDS}
+
+        try:
+            source = sys.stdin if options['csv_path'] == '-' else open(
+                options['csv_path'], newline='', encoding='utf-8-sig'
+            )
+        except OSError as exc:
+            raise CommandError(str(exc))
+
+        self.workers = 0 if options['dry_run'] else options['workers']
+        executor = None
+        if self.workers > 0:
+            executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+
+        try:
+            with source, open(options['report'], 'w', newline='', encoding='utf-8') as report:
+                self.report = csv.writer(report)
+                self.report.writerow(['line', 'email', 'varsity_id', 'errors'])
+
+                reader = csv.DictReader(source)
+                missing = set(REQUIRED_COLUMNS) - set(reader.fieldnames or ())
+                if missing:
+                    raise CommandError(f"Missing column(s): {', '.join(sorted(missing))}")
+
+                batch = []
+                # Line 1 is the header, so data rows start at line 2
+                for line, row in enumerate(reader, start=2):
+                    batch.append((line, row))
+                    if len(batch) >= batch_size:
+                        self.import_batch(batch, executor, options['dry_run'])
+                        batch = []
+                if batch:
+                    self.import_batch(batch, executor, options['dry_run'])
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        verb = 'Validated' if options['dry_run'] else 'Imported'
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {self.created} student(s), rejected {self.rejected} row(s) "
+            f"in {time.monotonic() - started:.2f}s. Report: {options['report']}"
+        ))
+
+    # -------------------------------------------------------------------------
+    # Batch processing
+    # -------------------------------------------------------------------------
+    def import_batch(self, batch, executor, dry_run):
+        """
+        Validates, de-duplicates, hashes and inserts one batch of rows.
+        """
+        valid = []
+        for line, row in batch:
+            cleaned, errors = self.clean_row(row)
+            if errors:
+                self.reject(line, row, errors)
+            else:
+                valid.append((line, cleaned))
+
+        valid = self.drop_duplicates(valid)
+        if not valid or dry_run:
+            self.created += len(valid)
+            return
+
+        passwords = [cleaned.pop('password') for _, cleaned in valid]
+        if executor is not None:
+            chunksize = max(1, len(passwords) // (self.workers * 4))
+            hashes = list(executor.map(make_password, passwords, chunksize=chunksize))
+        else:
+            hashes = [make_password(password) for password in passwords]
+
+        users = [
+            User(role='student', password=encoded, **cleaned)
+            for (_, cleaned), encoded in zip(valid, hashes)
+        ]
+        try:
+            with transaction.atomic():
+                User.objects.bulk_create(users)
+            self.created += len(users)
+        except IntegrityError:
+            # A concurrent writer took one of the values; retry row by row
+            for (line, cleaned), user in zip(valid, users):
+                try:
+                    with transaction.atomic():
+                        User.objects.bulk_create([user])
+                    self.created += 1
+                except IntegrityError as exc:
+                    self.reject(line, cleaned, [f'Database rejected row: {exc}'])
+
+    def clean_row(self, row):
+        """
+        Applies the User model's field rules without touching the database.
+        Returns (cleaned_values, errors).
+        """
+        cleaned = {field: (row.get(field) or '').strip() for field in REQUIRED_COLUMNS}
+        cleaned['gender'] = cleaned['gender'].lower()
+        errors = []
+
+        if not cleaned['full_name']:
+            errors.append('full_name: This field is required.')
+        elif len(cleaned['full_name']) > 255:
+            errors.append('full_name: Ensure this value has at most 255 characters.')
+        cleaned['full_name'] = cleaned['full_name'].upper()
+
+        try:
+            validate_email(cleaned['email'])
+            cleaned['email'] = User.objects.normalize_email(cleaned['email'])
+        except ValidationError as exc:
+            errors.append(f"email: {' '.join(exc.messages)}")
+
+        for field, validator in (
+            ('varsity_id', VARSITY_ID_VALIDATOR),
+            ('phone_number', PHONE_VALIDATOR),
+        ):
+            try:
+                validator(cleaned[field])
+            except ValidationError as exc:
+                errors.append(f"{field}: {' '.join(exc.messages)}")
+
+        if cleaned['session'] not in VALID_SESSIONS:
+            errors.append(f"session: '{cleaned['session']}' is not a valid session.")
+        if cleaned['gender'] not in VALID_GENDERS:
+            errors.append(f"gender: '{cleaned['gender']}' is not a valid gender.")
+        if not PASSWORD_REGEX.match(cleaned['password']):
+            errors.append(
+                'password: Password must be at least 6 characters, '
+                'include a lowercase letter and a number.'
+            )
+        return cleaned, errors
+
+    def drop_duplicates(self, valid):
+        """
+        Rejects rows whose unique values already exist in the database
+        (one query per field for the whole batch) or earlier in the file.
+        """
+        existing = {
+            field: set(
+                User.objects.filter(
+                    **{f'{field}__in': [cleaned[field] for _, cleaned in valid]}
+                ).values_list(field, flat=True)
+            )
+            for field in UNIQUE_FIELDS
+        } if valid else {}
+
+        accepted = []
+        for line, cleaned in valid:
+            errors = []
+            for field in UNIQUE_FIELDS:
+                value = cleaned[field]
+                if value in existing[field]:
+                    errors.append(f'{field}: A user with this {field} already exists.')
+                elif value in self.seen[field]:
+                    errors.append(f'{field}: Duplicate {field} earlier in the file.')
+            if errors:
+                self.reject(line, cleaned, errors)
+                continue
+            for field in UNIQUE_FIELDS:
+                self.seen[field].add(cleaned[field])
+            accepted.append((line, cleaned))
+        return accepted
+
+    def reject(self, line, row, errors):
+        self.rejected += 1
+        self.report.writerow([line, row.get('email', ''), row.get('varsity_id', ''), '; '.join(errors)])
@@ -0,0 +1,53 @@
+"""
+Management command to delete expired refresh tokens from the
+OutstandingToken and BlacklistedToken tables in bounded batches.
+
+Usage:
+    python manage.py prune_tokens --batch-size 1000
+    python manage.py prune_tokens --dry-run
+"""
+
+# Relative Path: accounts/management/commands/prune_tokens.py
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.pruning import prune_expired_tokens
+
+
+class Command(BaseCommand):
+    help = "Deletes expired outstanding and blacklisted refresh tokens in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of tokens deleted per transaction (default: 1000).',
+        )
+        parser.add_argument(
+            '--pause',
+            type=float,
+            default=0.0,
+            help='Seconds to sleep between batches (default: 0).',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only count the rows that would be deleted.',
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be at least 1.')
+
+        result = prune_expired_tokens(
+            batch_size=options['batch_size'],
+            dry_run=options['dry_run'],
+            pause=options['pause'],
+        )
+        verb = 'Would delete' if options['dry_run'] else 'Deleted'
+        self.stdout.write(self.style.SUCCESS(
+            f'{verb} {result.outstanding} outstanding and {result.blacklisted} '
+            f'blacklisted token(s) in {result.batches} batch(es), '
+            f'{result.seconds:.2f}s.'
+        ))
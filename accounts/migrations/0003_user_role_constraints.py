@@ -0,0 +1,83 @@
+# Generated by Django 5.2 on 2026-10-17 03:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0002_user_updated_at"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="user",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    models.Q(
+                        ("role", "student"),
+                        ("varsity_id__isnull", False),
+                        models.Q(("varsity_id", ""), _negated=True),
+                    ),
+                    models.Q(
+                        ("role", "teacher"),
+                        models.Q(
+                            ("varsity_id__isnull", False),
+                            models.Q(("varsity_id", ""), _negated=True),
+                            _negated=True,
+                        ),
+                    ),
+                    models.Q(("role__in", ["student", "teacher"]), _negated=True),
+                    _connector="OR",
+                ),
+                name="user_varsity_id_matches_role",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="user",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    models.Q(
+                        ("role", "student"),
+                        ("session__isnull", False),
+                        models.Q(("session", ""), _negated=True),
+                    ),
+                    models.Q(
+                        ("role", "teacher"),
+                        models.Q(
+                            ("session__isnull", False),
+                            models.Q(("session", ""), _negated=True),
+                            _negated=True,
+                        ),
+                    ),
+                    models.Q(("role__in", ["student", "teacher"]), _negated=True),
+                    _connector="OR",
+                ),
+                name="user_session_matches_role",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="user",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    models.Q(
+                        ("role", "student"),
+                        ("gender__isnull", False),
+                        models.Q(("gender", ""), _negated=True),
+                    ),
+                    models.Q(
+                        ("role", "teacher"),
+                        models.Q(
+                            ("gender__isnull", False),
+                            models.Q(("gender", ""), _negated=True),
+                            _negated=True,
+                        ),
+                    ),
+                    models.Q(("role__in", ["student", "teacher"]), _negated=True),
+                    _connector="OR",
+                ),
+                name="user_gender_matches_role",
+            ),
+        ),
+    ]
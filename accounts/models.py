@@ -3,6 +3,11 @@ Django models for the accounts app.
 
 Defines a custom user model with role-based fields, managers,
 validators, and lifecycle hooks for data integrity and formatting.
+
+Uniqueness and the role rules are enforced by the database (unique indexes
+and CHECK constraints). User.save() only runs the in-memory checks and maps
+an IntegrityError back to field errors, so a save issues no validation
+queries.
 """
 
 # Relative Path: accounts/models.py
@@ -10,7 +15,8 @@ validators, and lifecycle hooks for data integrity and formatting.
 from django.core.exceptions import ValidationError
 from django.core.validators import RegexValidator
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
-from django.db import models
+from django.db import IntegrityError, models, router, transaction
+from django.db.models import Q
 
 
 # -----------------------------------------------------------------------------
@@ -34,7 +40,7 @@ class UserManager(BaseUserManager):
     ):
         """
         Creates and saves a User with the given email, name, role, and optional fields.
-        Validates data before saving.
+        Validated by User.save() and the database constraints.
         """
         if not email:
             raise ValueError("An email is required")
@@ -50,7 +56,6 @@ class UserManager(BaseUserManager):
             **extra_fields
         )
         user.set_password(password)
-        user.full_clean()
         user.save(using=self._db)
         return user
 
@@ -59,11 +64,13 @@ class UserManager(BaseUserManager):
         Creates and returns a superuser with admin privileges and 'teacher' role.
         """
         extra_fields.setdefault('role', 'teacher')
+        extra_fields.setdefault('is_staff', True)
+        extra_fields.setdefault('is_superuser', True)
         full_name = extra_fields.pop('full_name', 'Admin')
         phone_number = extra_fields.pop('phone_number', None)
         role = extra_fields.pop('role')
 
-        user = self.create_user(
+        return self.create_user(
             email=email,
             full_name=full_name,
             role=role,
@@ -73,10 +80,6 @@ class UserManager(BaseUserManager):
             password=password,
             **extra_fields
         )
-        user.is_staff = True
-        user.is_superuser = True
-        user.save(using=self._db)
-        return user
 
 
 # -----------------------------------------------------------------------------
@@ -108,6 +111,19 @@ GENDER_CHOICES = (
 )
 
 
+def _role_rule(field):
+    """
+    CHECK condition mirroring User.clean(): students must fill `field`,
+    teachers must leave it empty.
+    """
+    filled = Q(**{f'{field}__isnull': False}) & ~Q(**{field: ''})
+    return (
+        (Q(role='student') & filled)
+        | (Q(role='teacher') & ~filled)
+        | ~Q(role__in=['student', 'teacher'])
+    )
+
+
 # -----------------------------------------------------------------------------
 # Custom User Model
 # -----------------------------------------------------------------------------
@@ -156,11 +172,23 @@ class User(AbstractBaseUser, PermissionsMixin):
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
 
+    # Bumped on every save; used for the profile ETag
+    updated_at = models.DateTimeField(auto_now=True)
+
     objects = UserManager()
 
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['full_name', 'phone_number']
 
+    class Meta:
+        constraints = [
+            models.CheckConstraint(
+                condition=_role_rule(field),
+                name=f'user_{field}_matches_role',
+            )
+            for field in ('varsity_id', 'session', 'gender')
+        ]
+
     def __str__(self):
         return f"{self.full_name} ({self.get_role_display()})"
 
@@ -189,8 +217,32 @@ class User(AbstractBaseUser, PermissionsMixin):
     def save(self, *args, **kwargs):
         """
         Overrides save to enforce uppercase full_name and validate before persisting.
+
+        Runs the query-free checks (field validators, choices, clean()) and
+        leaves uniqueness and the role rules to the database; a violation is
+        re-raised as the ValidationError full_clean() would have produced.
         """
         if self.full_name:
             self.full_name = self.full_name.upper()
-        self.full_clean()
-        super().save(*args, **kwargs)
+        self.clean_fields()
+        self.clean()
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
+        try:
+            with transaction.atomic(using=using):
+                super().save(*args, **kwargs)
+        except IntegrityError as exc:
+            raise self._integrity_error_as_validation_error(exc) from exc
+
+    def _integrity_error_as_validation_error(self, exc):
+        """
+        Works out which field(s) caused `exc` by running the uniqueness and
+        constraint checks it skipped, only now that a write has failed.
+        Returns `exc` itself when the checks find nothing (e.g. the clashing
+        row was removed in the meantime).
+        """
+        try:
+            self.validate_unique()
+            self.validate_constraints()
+        except ValidationError as error:
+            return error
+        return exc
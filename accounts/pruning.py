@@ -0,0 +1,140 @@
+"""
+Removal of expired refresh tokens from the Simple JWT blacklist tables.
+
+Every login adds an OutstandingToken row and every rotation or logout adds
+a BlacklistedToken row. Once a token has expired neither row is needed:
+the token fails signature/expiry validation before the blacklist is read.
+
+prune_expired_tokens() deletes them in small batches, each in its own short
+transaction, so no lock is held for long. It backs the ``prune_tokens``
+command and, when ``settings.TOKEN_PRUNING['INTERVAL']`` is set, a daemon
+thread in each worker; a lock in the ``shared`` cache lets only one worker
+on the host prune per interval.
+"""
+
+# Relative Path: accounts/pruning.py
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+
+logger = logging.getLogger(__name__)
+
+LOCK_KEY = 'token_prune:lock'
+
+
+@dataclass
+class PruneResult:
+    outstanding: int = 0
+    blacklisted: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+
+
+# -----------------------------------------------------------------------------
+# Batched deletion
+# -----------------------------------------------------------------------------
+def prune_expired_tokens(batch_size=1000, dry_run=False, pause=0.0, now=None):
+    """
+    Deletes OutstandingToken rows that expired before `now`, together with
+    their BlacklistedToken rows, `batch_size` tokens per transaction.
+
+    With `dry_run` nothing is deleted and the result holds the row counts
+    that would have been removed. `pause` sleeps between batches to leave
+    room for other writers.
+    """
+    now = now or timezone.now()
+    started = time.monotonic()
+    result = PruneResult()
+    expired = OutstandingToken.objects.filter(expires_at__lt=now)
+
+    if dry_run:
+        result.outstanding = expired.count()
+        result.blacklisted = BlacklistedToken.objects.filter(token__expires_at__lt=now).count()
+        result.batches = -(-result.outstanding // batch_size)
+        result.seconds = time.monotonic() - started
+        return result
+
+    while True:
+        with transaction.atomic():
+            ids = list(expired.order_by('id').values_list('id', flat=True)[:batch_size])
+            if not ids:
+                break
+            result.blacklisted += BlacklistedToken.objects.filter(token_id__in=ids).delete()[0]
+            result.outstanding += OutstandingToken.objects.filter(id__in=ids).delete()[0]
+        result.batches += 1
+        if pause:
+            time.sleep(pause)
+
+    result.seconds = time.monotonic() - started
+    return result
+
+
+# -----------------------------------------------------------------------------
+# Periodic in-process pruning
+# -----------------------------------------------------------------------------
+def _pruning_settings():
+    return {
+        'INTERVAL': 0,
+        'BATCH_SIZE': 1000,
+        'PAUSE': 0.05,
+        **getattr(settings, 'TOKEN_PRUNING', {}),
+    }
+
+
+def _run_periodically(stop, interval, batch_size, pause):
+    while not stop.wait(interval):
+        # Only one worker on the host prunes per interval
+        if not caches['shared'].add(LOCK_KEY, os.getpid(), timeout=interval):
+            continue
+        try:
+            result = prune_expired_tokens(batch_size=batch_size, pause=pause)
+            logger.info(
+                'Pruned %d outstanding and %d blacklisted token(s) in %.2fs',
+                result.outstanding, result.blacklisted, result.seconds,
+            )
+        except Exception:
+            logger.exception('Token pruning failed')
+        finally:
+            close_old_connections()
+
+
+_pruner_pid = None
+_pruner_lock = threading.Lock()
+
+
+def start_periodic_pruning(**kwargs):
+    """
+    Starts the pruning thread for this process if it is enabled and not
+    already running. Connected to request_started, so under a pre-forking
+    server the thread starts in each worker rather than the master.
+    """
+    global _pruner_pid
+    config = _pruning_settings()
+    if config['INTERVAL'] <= 0 or _pruner_pid == os.getpid():
+        return None
+    with _pruner_lock:
+        if _pruner_pid == os.getpid():
+            return None
+        _pruner_pid = os.getpid()
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=_run_periodically,
+            args=(stop, config['INTERVAL'], config['BATCH_SIZE'], config['PAUSE']),
+            name='token-pruner',
+            daemon=True,
+        )
+        thread.start()
+    return stop
@@ -10,9 +10,16 @@ with field-specific validation and clear creation workflows.
 import re
 
 from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
 
+from .authentication import get_cached_user
 from .models import User
+from .tokens import IndexedRefreshToken
 
 
 # -----------------------------------------------------------------------------
@@ -24,10 +31,36 @@ VARSITY_ID_REGEX = re.compile(r'^\d{8}$')
 PASSWORD_REGEX = re.compile(r'^(?=.*[a-z])(?=.*\d)[A-Za-z\d]{6,}$')
 
 
+# -----------------------------------------------------------------------------
+# Constraint-backed Writes
+# -----------------------------------------------------------------------------
+class ConstraintValidatedMixin:
+    """
+    Leaves uniqueness to the database instead of one SELECT per unique
+    field: UniqueValidators are dropped, and the ValidationError User.save()
+    raises for a violated constraint is reported as a normal 400.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        for field in fields.values():
+            field.validators = [
+                validator for validator in field.validators
+                if not isinstance(validator, UniqueValidator)
+            ]
+        return fields
+
+    def save(self, **kwargs):
+        try:
+            return super().save(**kwargs)
+        except DjangoValidationError as exc:
+            raise serializers.ValidationError(serializers.as_serializer_error(exc))
+
+
 # -----------------------------------------------------------------------------
 # Student Registration
 # -----------------------------------------------------------------------------
-class StudentRegistrationSerializer(serializers.ModelSerializer):
+class StudentRegistrationSerializer(ConstraintValidatedMixin, serializers.ModelSerializer):
     """
     Handles student signup, enforcing varsity ID, session, gender, and password rules.
     """
@@ -81,7 +114,7 @@ class StudentRegistrationSerializer(serializers.ModelSerializer):
 # -----------------------------------------------------------------------------
 # Teacher Registration
 # -----------------------------------------------------------------------------
-class TeacherRegistrationSerializer(serializers.ModelSerializer):
+class TeacherRegistrationSerializer(ConstraintValidatedMixin, serializers.ModelSerializer):
     """
     Handles teacher signup, enforcing allowed email whitelist and password rules.
     """
@@ -152,10 +185,43 @@ class LogoutSerializer(serializers.Serializer):
         return attrs
 
 
+class IndexedTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    TokenRefreshSerializer using IndexedRefreshToken and the cached user
+    lookup, so a refresh only writes the rotation rows.
+    """
+    token_class = IndexedRefreshToken
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs['refresh'])
+
+        user_id = refresh.payload.get(api_settings.USER_ID_CLAIM)
+        if user_id:
+            user = get_cached_user(user_id)
+            if user is None or not api_settings.USER_AUTHENTICATION_RULE(user):
+                raise AuthenticationFailed(
+                    self.error_messages['no_active_account'],
+                    'no_active_account',
+                )
+
+        data = {'access': str(refresh.access_token)}
+
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION:
+                refresh.blacklist()
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            refresh.outstand()
+            data['refresh'] = str(refresh)
+
+        return data
+
+
 # -----------------------------------------------------------------------------
 # General User Serializers
 # -----------------------------------------------------------------------------
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(ConstraintValidatedMixin, serializers.ModelSerializer):
     """
     Serializer for viewing and updating user details, with password handling.
     """
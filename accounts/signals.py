@@ -0,0 +1,32 @@
+"""
+Signal handlers for the accounts app.
+
+Keeps the authentication user cache honest: any saved or deleted user is
+evicted so password changes and deactivation take effect promptly.
+QuerySet.update() sends no signal, so callers evict with evict_users().
+"""
+
+# Relative Path: accounts/signals.py
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .authentication import invalidate_cached_users
+from .models import User
+
+
+def evict_users(user_ids):
+    """
+    Evicts the users now and again after commit, so a request that re-caches
+    an old row before the transaction commits does not keep it.
+    """
+    user_ids = list(user_ids)
+    invalidate_cached_users(user_ids)
+    transaction.on_commit(lambda: invalidate_cached_users(user_ids))
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def evict_cached_user(sender, instance, **kwargs):
+    evict_users([instance.pk])
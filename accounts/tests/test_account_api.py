@@ -6,6 +6,7 @@ Covers registration, login, and logout for both students and teachers.
 
 # Relative Path: tests/test_account_api.py
 
+from django.core.cache import caches
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -18,6 +19,7 @@ class AccountAPITests(APITestCase):
         """
         Set up URLs and a valid teacher email for tests.
         """
+        caches['shared'].clear()  # reset throttle buckets
         self.valid_teacher_email = settings.ALLOWED_TEACHER_EMAILS[0]
         self.student_reg_url = reverse('student-register')
         self.teacher_reg_url = reverse('teacher-register')
@@ -0,0 +1,70 @@
+"""
+Tests for the async student login and profile views served under ASGI.
+"""
+
+# Relative Path: accounts/tests/test_async_views.py
+
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+from accounts import authentication
+from accounts.models import User
+
+
+@override_settings(ROOT_URLCONF='cupcp_backend.asgi_urls')
+class AsyncAccountViewsTests(TestCase):
+    def setUp(self):
+        caches['shared'].clear()
+        authentication._user_cache.clear()
+        self.user = User.objects.create_user(
+            email="asynclogin@student.com", full_name="Async Login",
+            role="student", phone_number="01922222222",
+            varsity_id="32222222", session="2024-25",
+            gender="female", password="async123"
+        )
+
+    async def _login(self, password):
+        return await self.async_client.post(
+            reverse('student-login'),
+            {'varsity_id': '32222222', 'password': password},
+            content_type='application/json',
+        )
+
+    async def test_login_and_profile(self):
+        response = await self._login('async123')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['role'], 'student')
+        self.assertEqual(await OutstandingToken.objects.filter(user=self.user).acount(), 1)
+
+        headers = {'Authorization': f"Bearer {response.json()['access']}"}
+        profile = await self.async_client.get(reverse('user-profile'), headers=headers)
+        self.assertEqual(profile.status_code, 200)
+        self.assertEqual(profile.json()['varsity_id'], '32222222')
+
+        # POST is delegated to the synchronous view
+        created = await self.async_client.post(
+            reverse('user-profile'),
+            {
+                'email': 'delegated@student.com', 'full_name': 'Delegated',
+                'role': 'student', 'phone_number': '01933333333',
+                'varsity_id': '33333333', 'session': '2024-25', 'gender': 'male',
+                'password': 'deleg123', 'confirm_password': 'deleg123',
+            },
+            content_type='application/json', headers=headers,
+        )
+        self.assertEqual(created.status_code, 201)
+        self.assertTrue(await User.objects.filter(email='delegated@student.com').aexists())
+
+    async def test_wrong_password(self):
+        response = await self._login('wrong123')
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json(), {'error': 'Invalid credentials.'})
+
+    async def test_login_is_throttled_per_identity(self):
+        for _ in range(5):
+            await self._login('wrong123')
+        response = await self._login('async123')
+        self.assertEqual(response.status_code, 429)
+        self.assertIn('Retry-After', response)
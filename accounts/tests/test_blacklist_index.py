@@ -0,0 +1,76 @@
+"""
+Tests for the in-memory refresh token blacklist check.
+"""
+
+# Relative Path: accounts/tests/test_blacklist_index.py
+
+import time
+
+from django.core.cache import caches
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+
+from accounts import authentication
+from accounts.blacklist import BloomFilter, blacklist_index
+from accounts.models import User
+from accounts.serializers import IndexedTokenRefreshSerializer
+from accounts.tokens import IndexedRefreshToken
+
+
+class BloomFilterTests(APITestCase):
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(1000)
+        items = [f'jti-{i}' for i in range(1000)]
+        for item in items:
+            bloom.add(item)
+        self.assertTrue(all(item in bloom for item in items))
+        false_hits = sum(f'other-{i}' in bloom for i in range(10000))
+        self.assertLess(false_hits, 50)
+
+
+class BlacklistIndexTests(APITestCase):
+    def setUp(self):
+        caches['shared'].clear()
+        authentication._user_cache.clear()
+        blacklist_index.reset()
+        self.user = User.objects.create_user(
+            email="bloom@student.com", full_name="Bloom Student",
+            role="student", phone_number="01411111111",
+            varsity_id="71111111", session="2024-25",
+            gender="male", password="bloom123"
+        )
+
+    def _refresh_queries(self, serializer_class):
+        token = str(IndexedRefreshToken.for_user(self.user))
+        with CaptureQueriesContext(connection) as ctx:
+            serializer = serializer_class(data={'refresh': token})
+            serializer.is_valid(raise_exception=True)
+        return len(ctx.captured_queries)
+
+    def test_refresh_runs_fewer_queries_than_stock(self):
+        self._refresh_queries(IndexedTokenRefreshSerializer)  # warm caches
+        stock = self._refresh_queries(TokenRefreshSerializer)
+        indexed = self._refresh_queries(IndexedTokenRefreshSerializer)
+        self.assertLess(indexed, stock)
+
+    def test_rotated_token_is_rejected(self):
+        url = reverse('token_refresh')
+        token = str(IndexedRefreshToken.for_user(self.user))
+        first = self.client.post(url, {'refresh': token}, format='json')
+        second = self.client.post(url, {'refresh': token}, format='json')
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_blacklist_from_other_worker_is_seen(self):
+        """A JTI flagged in the shared cache is rejected by a fresh index."""
+        token = IndexedRefreshToken.for_user(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            token.blacklist()
+        # Simulate another worker: a fresh filter that never saw the row
+        blacklist_index._filter = BloomFilter(blacklist_index.min_capacity)
+        blacklist_index._synced_at = time.monotonic()
+        self.assertTrue(blacklist_index.might_contain(token['jti']))
@@ -0,0 +1,66 @@
+"""
+Tests for the browser-only middleware: API paths skip sessions, CSRF,
+auth and messages; the admin keeps them.
+"""
+
+# Relative Path: accounts/tests/test_browser_middleware.py
+
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+
+from cupcp_backend.browser_middleware import (
+    BrowserAuthenticationMiddleware,
+    BrowserCsrfViewMiddleware,
+    BrowserMessageMiddleware,
+    BrowserSessionMiddleware,
+)
+
+
+@override_settings(API_PATH_PREFIXES=('/auth/', '/student-manager/'))
+class BrowserOnlyMiddlewareTests(SimpleTestCase):
+    def _chain(self, seen):
+        def view(request):
+            seen.update(
+                session=hasattr(request, 'session'),
+                user=hasattr(request, 'user'),
+                messages=hasattr(request, '_messages'),
+            )
+            return HttpResponse()
+
+        handler = view
+        for middleware in (
+            BrowserMessageMiddleware,
+            BrowserAuthenticationMiddleware,
+            BrowserCsrfViewMiddleware,
+            BrowserSessionMiddleware,
+        ):
+            handler = middleware(handler)
+        return handler
+
+    def test_api_paths_skip_browser_middleware(self):
+        seen = {}
+        self._chain(seen)(RequestFactory().get('/student-manager/exam-registration/my/'))
+        self.assertEqual(seen, {'session': False, 'user': False, 'messages': False})
+
+    def test_other_paths_keep_them(self):
+        seen = {}
+        self._chain(seen)(RequestFactory().get('/admin/login/'))
+        self.assertEqual(seen, {'session': True, 'user': True, 'messages': True})
+
+    def test_csrf_is_only_enforced_outside_the_api(self):
+        csrf = BrowserCsrfViewMiddleware(lambda request: HttpResponse())
+
+        def view(request):
+            return HttpResponse()
+
+        api = RequestFactory().post('/auth/user/')
+        self.assertIsNone(csrf.process_view(api, view, (), {}))
+        browser = RequestFactory().post('/admin/login/')
+        self.assertEqual(csrf.process_view(browser, view, (), {}).status_code, 403)
+
+
+class AdminKeepsFullStackTests(TestCase):
+    def test_admin_login_sets_csrf_cookie(self):
+        response = self.client.get('/admin/login/')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('csrftoken', response.cookies)
@@ -0,0 +1,80 @@
+"""
+Tests for CachedJWTAuthentication: cache hits skip the user query and
+user changes are picked up immediately.
+"""
+
+# Relative Path: accounts/tests/test_cached_authentication.py
+
+from django.core.cache import caches
+from django.test import Client
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts import authentication
+from accounts.models import User
+
+
+class CachedJWTAuthenticationTests(APITestCase):
+    def setUp(self):
+        caches['shared'].clear()
+        authentication._token_cache.clear()
+        authentication._user_cache.clear()
+        self.user = User.objects.create_user(
+            email="cache@student.com", full_name="Cache Student",
+            role="student", phone_number="01311111111",
+            varsity_id="81111111", session="2024-25",
+            gender="female", password="cache123"
+        )
+        self.url = reverse('user-profile')
+
+    def _authorize(self):
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def test_repeat_requests_skip_user_query(self):
+        self._authorize()
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response.data['email'], 'cache@student.com')
+
+    def test_profile_change_is_visible_immediately(self):
+        self._authorize()
+        self.client.get(self.url)
+        self.user.full_name = 'Renamed Student'
+        self.user.save()
+        self.assertEqual(self.client.get(self.url).data['full_name'], 'RENAMED STUDENT')
+
+    def test_deactivation_revokes_access(self):
+        self._authorize()
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_admin_bulk_deactivation_revokes_access(self):
+        """QuerySet.update() sends no signal; the admin action evicts explicitly."""
+        self._authorize()
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+        admin = User.objects.create_superuser(
+            email="admin@example.com", full_name="Admin", role="teacher",
+            phone_number="01311112222", password="admin123"
+        )
+        browser = Client()
+        browser.force_login(admin)
+        response = browser.post(
+            reverse('admin:accounts_user_changelist'),
+            {'action': 'deactivate_users', '_selected_action': [self.user.pk]},
+        )
+        self.assertEqual(response.status_code, status.HTTP_302_FOUND)
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_password_change_evicts_cached_user(self):
+        self._authorize()
+        self.client.get(self.url)
+        self.user.set_password('changed123')
+        self.user.save()
+        cached = authentication.get_cached_user(self.user.pk)
+        self.assertTrue(cached.check_password('changed123'))
@@ -0,0 +1,76 @@
+"""
+Tests for the orjson-backed renderer and parser: same bytes as DRF's
+JSONRenderer, and a clean fallback without orjson.
+"""
+
+# Relative Path: accounts/tests/test_fastjson.py
+
+import datetime
+import io
+import uuid
+from decimal import Decimal
+from unittest import mock
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ErrorDetail, ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnDict
+
+from cupcp_backend import fastjson
+
+
+PAYLOAD = {
+    'created_at': datetime.datetime(2025, 3, 1, 8, 30, 5, 123456, tzinfo=datetime.timezone.utc),
+    'naive': datetime.datetime(2025, 3, 1, 8, 30),
+    'offset': datetime.datetime(
+        2025, 3, 1, 14, 30, tzinfo=datetime.timezone(datetime.timedelta(hours=6))
+    ),
+    'date': datetime.date(2025, 3, 1),
+    'time': datetime.time(9, 15),
+    'duration': datetime.timedelta(minutes=90),
+    'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+    'fee': Decimal('1250.50'),
+    'label': gettext_lazy('Invalid credentials.'),
+    'error': ErrorDetail('This field is required.', code='required'),
+    'name': 'রহিম – O’Neil \u2028 line \u2029',
+    'counts': {2024: 3, 2025: 5},
+    'rows': [ReturnDict({'hall': 'Alaol Hall', 'paid': True, 'slip': None}, serializer=None)],
+}
+
+
+class FastJSONRendererTests(SimpleTestCase):
+    def test_same_bytes_as_drf(self):
+        self.assertEqual(
+            fastjson.FastJSONRenderer().render(PAYLOAD), JSONRenderer().render(PAYLOAD)
+        )
+
+    def test_falls_back_without_orjson(self):
+        with mock.patch.object(fastjson, 'orjson', None):
+            self.assertEqual(
+                fastjson.FastJSONRenderer().render(PAYLOAD), JSONRenderer().render(PAYLOAD)
+            )
+
+    def test_indented_and_unencodable_output_use_drf(self):
+        renderer = fastjson.FastJSONRenderer()
+        pretty = renderer.render({'a': [1]}, 'application/json; indent=4')
+        self.assertEqual(pretty, JSONRenderer().render({'a': [1]}, 'application/json; indent=4'))
+        self.assertEqual(renderer.render({'big': 2 ** 70}), b'{"big":1180591620717411303424}')
+        self.assertEqual(renderer.render(None), b'')
+
+
+class FastJSONParserTests(SimpleTestCase):
+    def _parse(self, body, parser=None):
+        return (parser or fastjson.FastJSONParser()).parse(io.BytesIO(body))
+
+    def test_same_result_as_drf(self):
+        body = '{"courses": ["CSE-101"], "name": "রহিম", "fee": 12.5, "n": null}'.encode()
+        self.assertEqual(self._parse(body), self._parse(body, JSONParser()))
+
+    def test_invalid_json_is_a_parse_error(self):
+        for body in (b'{"courses": [', b'{"fee": NaN}'):
+            with self.assertRaises(ParseError):
+                self._parse(body)
+        with mock.patch.object(fastjson, 'orjson', None), self.assertRaises(ParseError):
+            self._parse(b'{"courses": [')
@@ -0,0 +1,67 @@
+"""
+Tests for the /healthz and /readyz probes.
+"""
+
+# Relative Path: accounts/tests/test_health.py
+
+import tempfile
+from unittest import mock
+
+from django.db import OperationalError
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from cupcp_backend import health, metrics
+
+
+class LivenessTests(SimpleTestCase):
+    def test_answers_without_touching_the_database(self):
+        # SimpleTestCase fails any query; an unknown host would get a 400
+        response = self.client.get('/healthz', HTTP_HOST='10.0.0.7')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['status'], 'ok')
+        self.assertIn('uptime_s', response.json())
+        self.assertEqual(response['Cache-Control'], 'no-store')
+
+    def test_probes_are_not_recorded_as_metrics(self):
+        with tempfile.TemporaryDirectory() as directory, \
+                override_settings(METRICS={'DIR': directory}):
+            metrics.registry.reset()
+            self.addCleanup(metrics.registry.reset)
+            self.client.get('/healthz')
+            self.assertEqual(metrics.collect(), ({}, {}))
+
+    async def test_async_handler(self):
+        response = await self.async_client.get('/healthz')
+        self.assertEqual(response.status_code, 200)
+
+
+class ReadinessTests(TestCase):
+    def test_ready_when_database_answers_and_migrations_applied(self):
+        with self.assertNumQueries(3):  # SELECT 1, migrations table check, applied rows
+            response = self.client.get('/readyz', HTTP_HOST='10.0.0.7')
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body['status'], 'ok')
+        self.assertTrue(body['databases']['default']['ok'])
+        self.assertEqual(body['migrations']['pending'], 0)
+        self.assertIn('ms', body)
+
+    def test_unavailable_while_migrations_are_pending(self):
+        on_disk = health._migrations_on_disk() | {('accounts', '9999_not_applied')}
+        with mock.patch.object(health, '_migrations_on_disk', return_value=on_disk):
+            response = self.client.get('/readyz')
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()['migrations']['pending'], 1)
+
+    def test_unavailable_when_database_is_unreachable(self):
+        with mock.patch(
+            'django.db.backends.utils.CursorWrapper.execute',
+            side_effect=OperationalError('connection refused'),
+        ):
+            response = self.client.get('/readyz')
+        self.assertEqual(response.status_code, 503)
+        body = response.json()
+        self.assertEqual(body['databases']['default'], {
+            'ok': False, 'error': 'OperationalError', 'ms': body['databases']['default']['ms'],
+        })
+        self.assertNotIn('migrations', body)
@@ -0,0 +1,119 @@
+"""
+Tests for Idempotency-Key replay of mutating requests.
+"""
+
+# Relative Path: accounts/tests/test_idempotency.py
+
+import hashlib
+
+from django.core.cache import caches
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import User
+from student_manager.models import ExamRegistration
+
+
+class IdempotencyKeyTests(APITestCase):
+    def setUp(self):
+        caches['shared'].clear()
+        self.register_url = reverse('student-register')
+        self.payload = {
+            'email': 'idem@student.com', 'full_name': 'Idem Student',
+            'phone_number': '01711112222', 'varsity_id': '91111111',
+            'session': '2024-25', 'gender': 'male',
+            'password': 'idem123', 'confirm_password': 'idem123',
+        }
+
+    def _register(self, key, **overrides):
+        return self.client.post(
+            self.register_url, {**self.payload, **overrides},
+            format='json', HTTP_IDEMPOTENCY_KEY=key
+        )
+
+    def test_retry_is_replayed(self):
+        first = self._register('key-1')
+        with self.assertNumQueries(0):
+            retry = self._register('key-1')
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(retry.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(retry.content, first.content)
+        self.assertEqual(retry['Idempotent-Replayed'], 'true')
+        self.assertEqual(User.objects.filter(email='idem@student.com').count(), 1)
+
+    def test_new_key_runs_again(self):
+        self._register('key-1')
+        again = self._register('key-2')
+        self.assertEqual(again.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_key_reused_with_different_body(self):
+        self._register('key-1')
+        response = self._register('key-1', full_name='Someone Else')
+        self.assertEqual(response.status_code, 422)
+
+    @override_settings(IDEMPOTENCY={'WAIT': 0.1, 'POLL_INTERVAL': 0.01})
+    def test_duplicate_of_in_flight_request_waits_then_conflicts(self):
+        """A duplicate never runs the view while the first holds the key."""
+        scope = '\n'.join(('POST', self.register_url, '', 'key-busy'))
+        digest = hashlib.sha256(scope.encode('utf-8')).hexdigest()
+        caches['shared'].add(f'idempotency:{digest}:lock', True)
+
+        response = self._register('key-busy')
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertFalse(User.objects.filter(email='idem@student.com').exists())
+
+    def test_exam_registration_retry(self):
+        self._register('key-1')
+        user = User.objects.get(email='idem@student.com')
+        token = RefreshToken.for_user(user).access_token
+        headers = {
+            'HTTP_AUTHORIZATION': f'Bearer {token}',
+            'HTTP_IDEMPOTENCY_KEY': 'exam-1',
+        }
+        data = {
+            'payment_status': 'Yes', 'payment_slip': 'IDEM-1',
+            'student_status': 'regular', 'courses': ['CSE101'],
+        }
+        url = reverse('my-exam-registration')
+        first = self.client.post(url, data, format='json', **headers)
+        retry = self.client.post(url, data, format='json', **headers)
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(retry.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(retry.content, first.content)
+        self.assertEqual(ExamRegistration.objects.count(), 1)
+
+    def _stored(self, path, key):
+        scope = '\n'.join(('POST', path, '', key))
+        digest = hashlib.sha256(scope.encode('utf-8')).hexdigest()
+        return caches['shared'].get(f'idempotency:{digest}')
+
+    def test_token_responses_are_never_stored(self):
+        """Login and refresh responses carry JWTs; they are not cached for replay."""
+        self._register('key-1')
+        login_url = reverse('student-login')
+        credentials = {'varsity_id': '91111111', 'password': 'idem123'}
+        headers = {'HTTP_IDEMPOTENCY_KEY': 'login-1'}
+        first = self.client.post(login_url, credentials, format='json', **headers)
+        retry = self.client.post(login_url, credentials, format='json', **headers)
+        self.assertEqual(retry.status_code, status.HTTP_200_OK)
+        self.assertNotIn('Idempotent-Replayed', retry)
+        self.assertIsNone(self._stored(login_url, 'login-1'))
+
+        refresh_url = reverse('token_refresh')
+        response = self.client.post(
+            refresh_url, {'refresh': first.json()['refresh']},
+            format='json', HTTP_IDEMPOTENCY_KEY='refresh-1'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(self._stored(refresh_url, 'refresh-1'))
+
+    async def test_retry_is_replayed_under_asgi(self):
+        kwargs = {'content_type': 'application/json', 'headers': {'Idempotency-Key': 'async-1'}}
+        first = await self.async_client.post(self.register_url, self.payload, **kwargs)
+        retry = await self.async_client.post(self.register_url, self.payload, **kwargs)
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(retry.content, first.content)
+        self.assertEqual(retry['Idempotent-Replayed'], 'true')
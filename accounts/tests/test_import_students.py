@@ -0,0 +1,81 @@
+"""
+Tests for the import_students management command.
+
+Covers bulk creation, per-row validation, duplicate detection against the
+database and within the file, and the error report.
+"""
+
+# Relative Path: accounts/tests/test_import_students.py
+
+import csv
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from accounts.models import User
+
+
+HEADER = ['full_name', 'email', 'varsity_id', 'session', 'gender', 'phone_number', 'password']
+
+
+class ImportStudentsCommandTests(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.csv_path = os.path.join(self.tmpdir.name, 'students.csv')
+        self.report_path = os.path.join(self.tmpdir.name, 'errors.csv')
+
+        User.objects.create_user(
+            email="existing@student.com", full_name="Existing Student",
+            role="student", phone_number="01900000000",
+            varsity_id="50000000", session="2024-25", gender="male",
+        )
+
+    def _write_csv(self, rows):
+        with open(self.csv_path, 'w', newline='') as handle:
+            writer = csv.writer(handle)
+            writer.writerow(HEADER)
+            writer.writerows(rows)
+
+    def _run(self, *extra):
+        call_command(
+            'import_students', self.csv_path, '--report', self.report_path, *extra,
+            stdout=StringIO(),
+        )
+        with open(self.report_path, newline='') as handle:
+            return list(csv.DictReader(handle))
+
+    def test_imports_valid_rows_and_reports_rejects(self):
+        """Valid rows are created; invalid and duplicate rows are reported by line."""
+        self._write_csv([
+            ['Alice Import', 'alice@import.com', '50000001', '2024-25', 'Female', '01900000001', 'abc123'],
+            ['Bad Id', 'badid@import.com', 'ABC', '2024-25', 'male', '01900000002', 'abc123'],
+            ['Dup Db', 'dupdb@import.com', '50000000', '2024-25', 'male', '01900000003', 'abc123'],
+            ['Dup File', 'alice@import.com', '50000004', '2024-25', 'male', '01900000004', 'abc123'],
+            ['Bob Import', 'bob@import.com', '50000005', '2023-24', 'male', '01900000005', 'xyz789'],
+        ])
+
+        report = self._run('--workers', '2', '--batch-size', '10')
+
+        alice = User.objects.get(email='alice@import.com')
+        self.assertEqual(alice.full_name, 'ALICE IMPORT')
+        self.assertEqual(alice.role, 'student')
+        self.assertEqual(alice.gender, 'female')
+        self.assertTrue(alice.check_password('abc123'))
+        self.assertTrue(User.objects.filter(email='bob@import.com').exists())
+
+        self.assertEqual([row['line'] for row in report], ['3', '4', '5'])
+        self.assertIn('varsity_id', report[0]['errors'])
+        self.assertIn('already exists', report[1]['errors'])
+        self.assertIn('earlier in the file', report[2]['errors'])
+
+    def test_dry_run_creates_nothing(self):
+        self._write_csv([
+            ['Carol Import', 'carol@import.com', '50000006', '2024-25', 'female', '01900000006', 'abc123'],
+        ])
+        report = self._run('--dry-run')
+        self.assertEqual(report, [])
+        self.assertFalse(User.objects.filter(email='carol@import.com').exists())
@@ -0,0 +1,129 @@
+"""
+Tests for the per-view request metrics and the /metrics endpoint.
+"""
+
+# Relative Path: accounts/tests/test_metrics.py
+
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.cache import caches
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from cupcp_backend import metrics
+
+
+class MetricsTests(APITestCase):
+    def setUp(self):
+        caches['shared'].clear()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.dir = directory.name
+        override = override_settings(
+            METRICS={'DIR': self.dir, 'FLUSH_INTERVAL': 60, 'TOKEN': 'scrape-secret'}
+        )
+        override.enable()
+        self.addCleanup(override.disable)
+        metrics.registry.reset()
+        self.addCleanup(metrics.registry.reset)
+
+    def _scrape(self):
+        response = self.client.get(
+            reverse('metrics'), HTTP_AUTHORIZATION='Bearer scrape-secret'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.content.decode()
+
+    def test_records_view_latency_and_queries(self):
+        self.client.post(
+            reverse('student-login'),
+            {'varsity_id': '12345678', 'password': 'wrong1'},
+            format='json',
+        )
+        body = self._scrape()
+        self.assertIn(
+            'http_requests_total{view="student-login",method="POST",status="401"} 1', body
+        )
+        self.assertIn(
+            'http_request_duration_seconds_bucket{view="student-login",le="+Inf"} 1', body
+        )
+        self.assertIn('http_request_duration_seconds_count{view="student-login"} 1', body)
+        # The failed lookup is one query
+        self.assertIn('http_request_db_queries_total{view="student-login"} 1', body)
+        self.assertNotIn('view="metrics"', body)
+
+    def test_unmatched_paths_share_one_label(self):
+        self.client.get('/no-such-page/')
+        self.assertIn('view="<unmatched>",method="GET",status="404"', self._scrape())
+
+    def test_merges_snapshots_of_other_workers(self):
+        other = {
+            'requests': [['student-login', 'POST', 200, 5]],
+            'views': {'student-login': [5] + [0] * len(metrics.LATENCY_BUCKETS) + [0.01, 5, 10, 0.002]},
+        }
+        with open(os.path.join(self.dir, '999999.json'), 'w') as handle:
+            json.dump(other, handle)
+        self.client.post(
+            reverse('student-login'),
+            {'varsity_id': '12345678', 'password': 'wrong1'},
+            format='json',
+        )
+        body = self._scrape()
+        self.assertIn(
+            'http_requests_total{view="student-login",method="POST",status="200"} 5', body
+        )
+        self.assertIn('http_request_duration_seconds_count{view="student-login"} 6', body)
+        self.assertIn('http_request_db_queries_total{view="student-login"} 11', body)
+
+    def test_restarted_worker_keeps_totals(self):
+        self.client.get('/no-such-page/')
+        metrics.registry.flush()
+        metrics.registry.reset()  # as if the worker restarted with the same pid
+        self.client.get('/no-such-page/')
+        self.assertIn('view="<unmatched>",method="GET",status="404"} 2', self._scrape())
+
+    def test_token_is_required(self):
+        response = self.client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        response = self.client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer wrong')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_no_token_hides_metrics_outside_debug(self):
+        with self.settings(METRICS={'DIR': self.dir, 'TOKEN': ''}):
+            with self.settings(DEBUG=False):
+                response = self.client.get(reverse('metrics'))
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+            with self.settings(DEBUG=True):
+                response = self.client.get(reverse('metrics'))
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_malformed_snapshots_are_ignored(self):
+        bad = [
+            {'requests': [['student-login', 'POST', 200, 5]]},  # no "views"
+            {'requests': [], 'views': {'student-login': [1, 2]}},  # short row
+            ['not', 'a', 'snapshot'],
+        ]
+        for pid, snapshot in enumerate(bad, start=999990):
+            with open(os.path.join(self.dir, f'{pid}.json'), 'w') as handle:
+                json.dump(snapshot, handle)
+        self.client.get('/no-such-page/')
+        body = self._scrape()
+        self.assertIn('view="<unmatched>",method="GET",status="404"} 1', body)
+        self.assertNotIn('student-login', body)
+
+    def test_clear_metrics_removes_snapshots(self):
+        self.client.get('/no-such-page/')
+        metrics.registry.flush()
+        with open(os.path.join(self.dir, '999999.json'), 'w') as handle:
+            json.dump({'requests': [], 'views': {}}, handle)
+
+        out = StringIO()
+        call_command('clear_metrics', stdout=out)
+        self.assertIn('Removed 2 metrics snapshot(s).', out.getvalue())
+        self.assertEqual(os.listdir(self.dir), [])
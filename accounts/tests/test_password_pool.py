@@ -0,0 +1,88 @@
+"""
+Tests for off-thread password verification on the login endpoints.
+"""
+
+# Relative Path: accounts/tests/test_password_pool.py
+
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import caches
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts import hashing
+from accounts.models import User
+
+
+def _pool_settings(**overrides):
+    config = {'ENABLED': True, 'WORKERS': 1, 'MAX_PENDING': 4, 'TIMEOUT': 30.0}
+    config.update(overrides)
+    return override_settings(PASSWORD_HASH_POOL=config)
+
+
+class PasswordPoolLoginTests(APITestCase):
+    def setUp(self):
+        caches['shared'].clear()  # reset throttle buckets
+        User.objects.create_user(
+            email="pool@student.com", full_name="Pool Student",
+            role="student", phone_number="01511111111",
+            varsity_id="61111111", session="2024-25",
+            gender="male", password="pool123"
+        )
+        self.teacher_email = settings.ALLOWED_TEACHER_EMAILS[0]
+        User.objects.create_user(
+            email=self.teacher_email, full_name="Pool Teacher",
+            role="teacher", phone_number="01522222222",
+            password="teach12"
+        )
+        self.addCleanup(self._reset_verifier)
+
+    def _reset_verifier(self):
+        if hashing._verifier is not None:
+            hashing._verifier.shutdown()
+        hashing._verifier = None
+
+    def test_logins_verified_on_pool(self):
+        """Correct and wrong passwords are judged by the pool workers."""
+        with _pool_settings():
+            ok = self.client.post(
+                reverse('student-login'),
+                {'varsity_id': '61111111', 'password': 'pool123'}, format='json'
+            )
+            bad = self.client.post(
+                reverse('student-login'),
+                {'varsity_id': '61111111', 'password': 'wrong123'}, format='json'
+            )
+            teacher = self.client.post(
+                reverse('teacher-login'),
+                {'email': self.teacher_email, 'password': 'teach12'}, format='json'
+            )
+        self.assertEqual(ok.status_code, status.HTTP_200_OK)
+        self.assertEqual(bad.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(teacher.status_code, status.HTTP_200_OK)
+        self.assertIsNotNone(hashing._verifier)
+
+    def test_saturated_pool_returns_503(self):
+        """With no free slots the login fails fast with Retry-After."""
+        with _pool_settings(MAX_PENDING=0):
+            response = self.client.post(
+                reverse('student-login'),
+                {'varsity_id': '61111111', 'password': 'pool123'}, format='json'
+            )
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response['Retry-After'], '1')
+
+    def test_unknown_teacher_email_still_hashes(self):
+        """A miss costs one hash on the pool, so timing does not reveal accounts."""
+        with _pool_settings(), mock.patch.object(
+            hashing.PasswordVerifier, 'verify', return_value=False
+        ) as verify:
+            response = self.client.post(
+                reverse('teacher-login'),
+                {'email': 'nobody@domain.com', 'password': 'teach12'}, format='json'
+            )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        verify.assert_called_once_with('teach12', None)
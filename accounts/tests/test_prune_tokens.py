@@ -0,0 +1,57 @@
+"""
+Tests for the prune_tokens management command.
+"""
+
+# Relative Path: accounts/tests/test_prune_tokens.py
+
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+from accounts.models import User
+
+
+class PruneTokensCommandTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(
+            email="prune@student.com", full_name="Prune Student",
+            role="student", phone_number="01611111111",
+            varsity_id="51111111", session="2024-25",
+            gender="male", password="prune123"
+        )
+        now = timezone.now()
+        for i in range(5):
+            token = OutstandingToken.objects.create(
+                user=user, jti=f'expired-{i}', token='x',
+                created_at=now - timedelta(days=2), expires_at=now - timedelta(days=1),
+            )
+            if i % 2 == 0:
+                BlacklistedToken.objects.create(token=token)
+        live = OutstandingToken.objects.create(
+            user=user, jti='live', token='x',
+            created_at=now, expires_at=now + timedelta(days=1),
+        )
+        BlacklistedToken.objects.create(token=live)
+
+    def _run(self, *args):
+        out = StringIO()
+        call_command('prune_tokens', *args, stdout=out)
+        return out.getvalue()
+
+    def test_dry_run_only_counts(self):
+        output = self._run('--dry-run')
+        self.assertIn('Would delete 5 outstanding and 3 blacklisted', output)
+        self.assertEqual(OutstandingToken.objects.count(), 6)
+
+    def test_deletes_expired_tokens_in_batches(self):
+        output = self._run('--batch-size', '2')
+        self.assertIn('Deleted 5 outstanding and 3 blacklisted token(s) in 3 batch(es)', output)
+        self.assertEqual(list(OutstandingToken.objects.values_list('jti', flat=True)), ['live'])
+        self.assertEqual(BlacklistedToken.objects.count(), 1)
@@ -0,0 +1,203 @@
+"""
+Enforces cupcp_backend/query_budgets.py: every named route is called with
+cold caches at two dataset sizes and must stay within its query budget,
+without growing faster than its per-row allowance.
+"""
+
+# Relative Path: accounts/tests/test_query_budgets.py
+
+from itertools import count
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.cache import caches
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts import authentication
+from accounts.models import User
+from accounts.tokens import IndexedRefreshToken
+from cupcp_backend.query_budgets import QUERY_BUDGETS, queries_without_savepoints
+from student_manager.models import ExamRegistration
+from student_manager.seeding import build_registration, build_student
+
+
+PASSWORD = 'budget123'
+COURSE = 'CSE-101'
+SIZES = (3, 12)
+
+
+def _route_names(patterns):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            if pattern.app_name != 'admin':
+                yield from _route_names(pattern.url_patterns)
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            yield pattern.name
+
+
+class QueryBudgetTests(APITestCase):
+    def setUp(self):
+        self.sequence = count()
+        self.rows = 0
+        self.password_hash = make_password(PASSWORD)
+        self.teacher = User.objects.create_user(
+            email='budget.teacher@example.com', full_name='Budget Teacher',
+            role='teacher', phone_number='01299999998', password=PASSWORD,
+        )
+        self._grow(1)
+        self.student = User.objects.filter(role='student').order_by('id').first()
+
+    def _grow(self, rows):
+        """Adds seeded students with one registration each, all taking COURSE."""
+        numbers = range(self.rows, rows)
+        students = User.objects.bulk_create(
+            [build_student(i, 0, self.password_hash) for i in numbers]
+        )
+        registrations = [build_registration(i, 0, user) for i, user in zip(numbers, students)]
+        for registration in registrations:
+            registration.courses = [COURSE] + registration.courses
+        ExamRegistration.objects.bulk_register(registrations)
+        self.rows = rows
+
+    def _unique(self):
+        return next(self.sequence)
+
+    def _bearer(self, user):
+        return {'HTTP_AUTHORIZATION': f'Bearer {RefreshToken.for_user(user).access_token}'}
+
+    def _fresh_student(self):
+        i = self._unique()
+        return User.objects.create_user(
+            email=f'fresh{i}@example.com', full_name=f'Fresh Student {i}', role='student',
+            phone_number=f'010{i:08d}', varsity_id=f'9{i:07d}', session='2024-25',
+            gender='male', password=PASSWORD,
+        )
+
+    # -------------------------------------------------------------------------
+    # One call per (URL name, method): returns (args, data, headers)
+    # -------------------------------------------------------------------------
+    def _student_register(self):
+        i = self._unique()
+        return (), {
+            'full_name': f'Budget Register {i}', 'email': f'register{i}@example.com',
+            'varsity_id': f'8{i:07d}', 'session': '2024-25', 'gender': 'female',
+            'phone_number': f'012{i:08d}', 'password': PASSWORD, 'confirm_password': PASSWORD,
+        }, {}
+
+    def _teacher_register(self):
+        i = self._unique()
+        return (), {
+            'full_name': f'Budget Teacher {i}', 'email': f'teacher{i}@example.com',
+            'phone_number': f'011{i:08d}', 'password': PASSWORD, 'confirm_password': PASSWORD,
+        }, {}
+
+    def _student_login(self):
+        return (), {'varsity_id': self.student.varsity_id, 'password': PASSWORD}, {}
+
+    def _teacher_login(self):
+        return (), {'email': self.teacher.email, 'password': PASSWORD}, {}
+
+    def _logout(self):
+        refresh = str(IndexedRefreshToken.for_user(self.student))
+        return (), {'refresh': refresh}, self._bearer(self.student)
+
+    def _token_refresh(self):
+        return (), {'refresh': str(IndexedRefreshToken.for_user(self.student))}, {}
+
+    def _as(self, user, *args):
+        return lambda: (args, None, self._bearer(user))
+
+    def _profile_put(self):
+        # A throwaway user: the update replaces the password
+        return (), {
+            'full_name': 'Budget Student Renamed', 'password': PASSWORD,
+            'confirm_password': PASSWORD,
+        }, self._bearer(self._fresh_student())
+
+    def _my_registration_post(self):
+        user = self._fresh_student()
+        return (), {
+            'payment_status': 'Yes', 'payment_slip': f'FRESH{user.pk:08d}',
+            'student_status': 'regular', 'courses': [COURSE, 'MAT-201'],
+            'hall_name': 'Alaol Hall',
+        }, self._bearer(user)
+
+    def _calls(self):
+        teacher = lambda *args: self._as(self.teacher, *args)  # noqa: E731
+        return {
+            ('home', 'GET'): lambda: ((), None, {}),
+            ('metrics', 'GET'): lambda: ((), None, {'HTTP_AUTHORIZATION': 'Bearer budget'}),
+            ('student-register', 'POST'): self._student_register,
+            ('teacher-register', 'POST'): self._teacher_register,
+            ('student-login', 'POST'): self._student_login,
+            ('teacher-login', 'POST'): self._teacher_login,
+            ('token-logout', 'POST'): self._logout,
+            ('user-profile', 'GET'): self._as(self.student),
+            ('user-profile', 'PUT'): self._profile_put,
+            ('token_obtain_pair', 'POST'): self._teacher_login,
+            ('token_refresh', 'POST'): self._token_refresh,
+            ('my-exam-registration', 'GET'): self._as(self.student),
+            ('my-exam-registration', 'POST'): self._my_registration_post,
+            ('exam-reg-summary', 'GET'): teacher(),
+            ('exam-reg-export', 'GET'): teacher('csv'),
+            ('exam-reg-stats', 'GET'): teacher(),
+            ('course-roster', 'GET'): teacher(COURSE),
+            ('course-count', 'GET'): teacher(COURSE),
+        }
+
+    def _cold_queries(self, name, method, call):
+        """Queries of one successful call with every cache emptied first."""
+        for alias in ('default', 'shared'):
+            caches[alias].clear()
+        authentication._token_cache.clear()
+        authentication._user_cache.clear()
+        args, data, headers = call()
+        request = getattr(self.client, method.lower())
+        with CaptureQueriesContext(connection) as captured:
+            response = request(reverse(name, args=args), data, format='json', **headers)
+            body = b''.join(response.streaming_content) if response.streaming else response.content
+        self.assertLess(
+            response.status_code, 400, f'{method} {name} returned {response.status_code}: {body[:200]!r}'
+        )
+        return len(queries_without_savepoints(captured))
+
+    # -------------------------------------------------------------------------
+    # Tests
+    # -------------------------------------------------------------------------
+    def test_every_named_route_has_a_budget(self):
+        names = set(_route_names(get_resolver().url_patterns))
+        self.assertEqual(names - set(QUERY_BUDGETS), set(), 'Routes without a query budget')
+        self.assertEqual(set(QUERY_BUDGETS) - names, set(), 'Budgets for unknown routes')
+
+    def test_routes_stay_within_budget_as_rows_grow(self):
+        calls = self._calls()
+        measured = {}
+        with self.settings(
+            ALLOWED_TEACHER_EMAILS=[f'teacher{i}@example.com' for i in range(100)],
+            METRICS={**settings.METRICS, 'TOKEN': 'budget'},
+        ):
+            for rows in SIZES:
+                self._grow(rows)
+                for name, methods in QUERY_BUDGETS.items():
+                    for method in methods:
+                        self.assertIn((name, method), calls, f'No test call for {method} {name}')
+                        measured.setdefault((name, method), []).append(
+                            self._cold_queries(name, method, calls[name, method])
+                        )
+
+        small, large = SIZES
+        for (name, method), (few, many) in measured.items():
+            budget = QUERY_BUDGETS[name][method]
+            with self.subTest(route=f'{method} {name}'):
+                self.assertTrue(
+                    budget.allows(many, large),
+                    f'{many} queries at {large} rows exceed the budget of {budget}',
+                )
+                self.assertLessEqual(
+                    many - few, budget.max_queries_per_row * (large - small),
+                    f'queries grew from {few} to {many} between {small} and {large} rows',
+                )
@@ -0,0 +1,123 @@
+"""
+Tests for the fixed-window throttles on the authentication endpoints.
+"""
+
+# Relative Path: accounts/tests/test_throttling.py
+
+import threading
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import caches
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.parsers import JSONParser
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from accounts.throttling import ScopedIdentityThrottle
+
+
+def _rates(num_proxies=0, **rates):
+    return override_settings(REST_FRAMEWORK={
+        **settings.REST_FRAMEWORK,
+        'DEFAULT_THROTTLE_RATES': rates,
+        'NUM_PROXIES': num_proxies,
+    })
+
+
+class LoginThrottleTests(APITestCase):
+    def setUp(self):
+        caches['shared'].clear()
+        self.url = reverse('student-login')
+        # Pin the clock mid-window so a test never straddles two windows
+        clock = mock.patch('accounts.throttling.time')
+        clock.start().time.return_value = 1_700_000_010.0
+        self.addCleanup(clock.stop)
+
+    def _attempt(self, varsity_id, **extra):
+        return self.client.post(
+            self.url, {'varsity_id': varsity_id, 'password': 'wrong1'}, format='json', **extra
+        )
+
+    def test_identity_limit_blocks_before_any_query(self):
+        """Once an account hits its limit, attempts are rejected without DB work."""
+        with _rates(student_login='100/min', student_login_identity='2/min'):
+            for _ in range(2):
+                self.assertEqual(
+                    self._attempt('12345678').status_code, status.HTTP_401_UNAUTHORIZED
+                )
+            with self.assertNumQueries(0):
+                response = self._attempt('12345678')
+            self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+            self.assertEqual(response['Retry-After'], '30')
+
+            # Other accounts keep their own counter
+            self.assertEqual(self._attempt('87654321').status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_ip_limit_spans_identities(self):
+        """The per-IP limit stops one address from spraying many accounts."""
+        with _rates(student_login='2/min', student_login_identity='100/min'):
+            self._attempt('11111111')
+            self._attempt('22222222')
+            self.assertEqual(
+                self._attempt('33333333').status_code, status.HTTP_429_TOO_MANY_REQUESTS
+            )
+            response = self._attempt('33333333', REMOTE_ADDR='10.0.0.2')
+            self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_spoofed_forwarded_for_shares_the_ip_limit(self):
+        """Behind one proxy only the address it appended counts, not client-sent ones."""
+        with _rates(num_proxies=1, student_login='2/min', student_login_identity='100/min'):
+            responses = [
+                self._attempt(f'1111111{i}', HTTP_X_FORWARDED_FOR=f'198.51.100.{i}, 10.0.0.9')
+                for i in range(3)
+            ]
+        self.assertEqual(
+            [response.status_code for response in responses],
+            [status.HTTP_401_UNAUTHORIZED] * 2 + [status.HTTP_429_TOO_MANY_REQUESTS],
+        )
+
+    def test_unconfigured_scope_is_not_throttled(self):
+        with _rates():
+            for _ in range(3):
+                self.assertEqual(self._attempt('12345678').status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_next_window_starts_a_new_count(self):
+        with _rates(student_login='100/min', student_login_identity='1/min'):
+            self._attempt('12345678')
+            self.assertEqual(
+                self._attempt('12345678').status_code, status.HTTP_429_TOO_MANY_REQUESTS
+            )
+            with mock.patch('accounts.throttling.time') as clock:
+                clock.time.return_value = 1_700_000_070.0
+                response = self._attempt('12345678')
+            self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_concurrent_requests_cannot_exceed_the_limit(self):
+        """Requests racing on one identity are counted atomically."""
+        view = mock.Mock(throttle_scope='student_login', throttle_identity_field='varsity_id')
+        factory = APIRequestFactory()
+        requests = []
+        for _ in range(20):
+            request = Request(
+                factory.post(self.url, {'varsity_id': '12345678'}, format='json'),
+                parsers=[JSONParser()],
+            )
+            request.data  # parse up front; only the throttle runs in the threads
+            requests.append(request)
+        barrier = threading.Barrier(len(requests))
+        allowed = []
+
+        def attempt(request):
+            barrier.wait()
+            allowed.append(ScopedIdentityThrottle().allow_request(request, view))
+
+        with _rates(student_login_identity='5/min'):
+            threads = [threading.Thread(target=attempt, args=(r,)) for r in requests]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(allowed.count(True), 5)
@@ -0,0 +1,110 @@
+"""
+Tests for the constraint-backed User save path: role CHECK constraints,
+IntegrityError mapped to field errors, and the query budget of
+registration and profile update.
+"""
+
+# Relative Path: accounts/tests/test_user_constraints.py
+
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts import authentication
+from accounts.models import User
+
+
+STUDENT = {
+    'email': 'budget@student.com',
+    'full_name': 'Budget Student',
+    'role': 'student',
+    'phone_number': '01755556666',
+    'varsity_id': '55556666',
+    'session': '2024-25',
+    'gender': 'female',
+}
+
+
+class UserConstraintTests(TestCase):
+    def test_role_rules_hold_without_save(self):
+        """bulk_create skips User.save(); the CHECK constraints still apply."""
+        teacher = User(
+            email='t@example.com', full_name='T', role='teacher',
+            phone_number='01700000001', varsity_id='12345678',
+        )
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            User.objects.bulk_create([teacher])
+
+        student = User(**{**STUDENT, 'gender': None})
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            User.objects.bulk_create([student])
+
+    def test_duplicate_becomes_field_error(self):
+        User.objects.create_user(**STUDENT)
+        with self.assertRaises(ValidationError) as caught:
+            User.objects.create_user(**{**STUDENT, 'email': 'other@student.com'})
+        self.assertEqual(
+            set(caught.exception.message_dict), {'phone_number', 'varsity_id'}
+        )
+
+    def test_create_user_budget(self):
+        # SAVEPOINT + INSERT + RELEASE; no uniqueness SELECTs
+        with self.assertNumQueries(3):
+            User.objects.create_user(**STUDENT)
+
+    def test_create_superuser_saves_once(self):
+        with self.assertNumQueries(3):
+            admin = User.objects.create_superuser(
+                'admin@example.com', password='admin123', phone_number='01700000002'
+            )
+        self.assertTrue(admin.is_staff and admin.is_superuser)
+
+
+class UserWriteBudgetTests(APITestCase):
+    def setUp(self):
+        caches['shared'].clear()
+        authentication._user_cache.clear()
+
+    def _payload(self, **overrides):
+        data = {key: value for key, value in STUDENT.items() if key != 'role'}
+        return {**data, 'password': 'abc123', 'confirm_password': 'abc123', **overrides}
+
+    def test_registration_budget(self):
+        with self.assertNumQueries(3):
+            response = self.client.post(
+                reverse('student-register'), self._payload(), format='json'
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_duplicate_registration_is_400(self):
+        self.client.post(reverse('student-register'), self._payload(), format='json')
+        response = self.client.post(
+            reverse('student-register'),
+            self._payload(phone_number='01799998888', varsity_id='99998888'),
+            format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(list(response.data), ['email'])
+
+    def test_profile_update_budget(self):
+        user = User.objects.create_user(**STUDENT)
+        headers = {
+            'HTTP_AUTHORIZATION': f'Bearer {RefreshToken.for_user(user).access_token}'
+        }
+        # Warm the authentication cache so only the write is counted
+        self.client.get(reverse('user-profile'), **headers)
+        # SAVEPOINT, UPDATE user, UPDATE registration snapshots, RELEASE
+        with self.assertNumQueries(4):
+            response = self.client.put(
+                reverse('user-profile'),
+                {'full_name': 'Renamed', 'password': 'abc123', 'confirm_password': 'abc123'},
+                format='json',
+                **headers,
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['full_name'], 'RENAMED')
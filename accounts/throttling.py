@@ -0,0 +1,166 @@
+"""
+Fixed-window throttles for the authentication endpoints.
+
+Counters live in the ``shared`` cache so every worker process on the host
+sees the same counts. Throttles run in APIView.initial(), before the view
+touches the database or hashes a password.
+
+Rates come from ``REST_FRAMEWORK['DEFAULT_THROTTLE_RATES']`` using the usual
+DRF syntax (``'10/min'``): at most 10 requests per identity in each
+clock-aligned minute. A view opts in by setting ``throttle_scope``; the
+identity throttle additionally reads ``throttle_identity_field`` from the
+request body.
+
+Each request is one ``cache.add()`` plus ``cache.incr()`` on the window's
+counter, so concurrent requests can never all read the same count: that
+is atomic on Redis, the shared cache outside DEBUG. The file-based
+development cache implements incr() as get() + set(), so there requests
+are serialized per process only.
+"""
+
+# Relative Path: accounts/throttling.py
+
+import hashlib
+import math
+import threading
+import time
+from contextlib import nullcontext
+
+from asgiref.sync import sync_to_async
+from django.core.cache import caches
+from django.core.cache.backends.filebased import FileBasedCache
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+# Serializes add()/incr() within a process on backends whose incr() is get + set
+_local_lock = threading.Lock()
+
+
+def _has_atomic_incr(cache):
+    return not isinstance(cache, FileBasedCache)
+
+
+def parse_rate(rate):
+    """
+    Parses 'N/period' into (limit, period_seconds); period may be
+    s, sec, m, min, h, hour, d or day.
+    """
+    num, period = rate.split('/')
+    return int(num), PERIODS[period[0]]
+
+
+class FixedWindowThrottle(BaseThrottle):
+    """
+    Base class: one counter per (scope, identity, window) in the shared cache.
+    """
+    cache_alias = 'shared'
+    scope_suffix = ''
+
+    def get_identity(self, request, view):
+        """Returns the value requests are bucketed by, or None to skip."""
+        raise NotImplementedError('.get_identity() must be overridden')
+
+    def get_rate(self, view):
+        scope = getattr(view, 'throttle_scope', None)
+        if not scope:
+            return None, None
+        scope = f'{scope}{self.scope_suffix}'
+        return scope, api_settings.DEFAULT_THROTTLE_RATES.get(scope)
+
+    def _window(self, request, view):
+        """Returns (cache key, limit, seconds left in the window) or None when not throttled."""
+        scope, rate = self.get_rate(view)
+        if rate is None:
+            return None
+        identity = self.get_identity(request, view)
+        if identity is None:
+            return None
+        limit, period = parse_rate(rate)
+        now = time.time()
+        window = int(now // period)
+        digest = hashlib.sha256(identity.encode('utf-8')).hexdigest()
+        return f'throttle:{scope}:{digest}:{window}', limit, (window + 1) * period - now
+
+    def _decide(self, count, limit, remaining):
+        if count <= limit:
+            self.wait_seconds = None
+            return True
+        self.wait_seconds = remaining
+        return False
+
+    @staticmethod
+    def _timeout(remaining):
+        # Keep the counter a little past the end of its window
+        return math.ceil(remaining) + 1
+
+    def _hit(self, cache, key, remaining):
+        """Counts one request in the window; returns the new count."""
+        lock = _local_lock if not _has_atomic_incr(cache) else nullcontext()
+        with lock:
+            cache.add(key, 0, timeout=self._timeout(remaining))
+            try:
+                return cache.incr(key)
+            except ValueError:  # expired between add() and incr()
+                cache.set(key, 1, timeout=self._timeout(remaining))
+                return 1
+
+    def allow_request(self, request, view):
+        window = self._window(request, view)
+        if window is None:
+            return True
+        key, limit, remaining = window
+        count = self._hit(caches[self.cache_alias], key, remaining)
+        return self._decide(count, limit, remaining)
+
+    async def aallow_request(self, request, view):
+        """allow_request() for async views."""
+        window = self._window(request, view)
+        if window is None:
+            return True
+        key, limit, remaining = window
+        cache = caches[self.cache_alias]
+        if not _has_atomic_incr(cache):
+            count = await sync_to_async(self._hit)(cache, key, remaining)
+            return self._decide(count, limit, remaining)
+        await cache.aadd(key, 0, timeout=self._timeout(remaining))
+        try:
+            count = await cache.aincr(key)
+        except ValueError:  # expired between aadd() and aincr()
+            await cache.aset(key, 1, timeout=self._timeout(remaining))
+            count = 1
+        return self._decide(count, limit, remaining)
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class ScopedIPThrottle(FixedWindowThrottle):
+    """
+    Buckets requests by client IP under the view's ``throttle_scope``.
+    """
+
+    def get_identity(self, request, view):
+        return self.get_ident(request)
+
+
+class ScopedIdentityThrottle(FixedWindowThrottle):
+    """
+    Buckets requests by the account they target (e.g. varsity_id or email),
+    under ``<throttle_scope>_identity``.
+    """
+    scope_suffix = '_identity'
+
+    def get_identity(self, request, view):
+        field = getattr(view, 'throttle_identity_field', None)
+        data = request.data
+        value = data.get(field) if field and hasattr(data, 'get') else None
+        if not isinstance(value, str) or not value.strip():
+            return None
+        return value.strip().lower()
+
+
+# Throttles applied to the login endpoints
+LOGIN_THROTTLES = [ScopedIPThrottle, ScopedIdentityThrottle]
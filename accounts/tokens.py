@@ -0,0 +1,74 @@
+"""
+Refresh tokens whose blacklist check is answered from memory.
+
+RefreshToken.check_blacklist() runs an EXISTS query for every refresh, and
+blacklist()/outstand() each load the User only to attach it to the
+OutstandingToken row. This subclass consults accounts.blacklist first and
+only queries BlacklistedToken when the filter reports a possible hit, and
+writes OutstandingToken rows by user id.
+"""
+
+# Relative Path: accounts/tokens.py
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from rest_framework_simplejwt.tokens import BlacklistMixin, RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from .blacklist import blacklist_index
+
+
+class IndexedRefreshToken(RefreshToken):
+    """
+    RefreshToken checked against the in-memory blacklist index.
+    """
+
+    def check_blacklist(self):
+        jti = self.payload[api_settings.JTI_CLAIM]
+        if not blacklist_index.might_contain(jti):
+            return
+        if BlacklistedToken.objects.filter(token__jti=jti).exists():
+            raise TokenError(_("Token is blacklisted"))
+
+    def _outstanding_defaults(self):
+        return {
+            'user_id': self.payload.get(api_settings.USER_ID_CLAIM),
+            'created_at': self.current_time,
+            'token': str(self),
+            'expires_at': datetime_from_epoch(self.payload['exp']),
+        }
+
+    def blacklist(self):
+        jti = self.payload[api_settings.JTI_CLAIM]
+        token, _ = OutstandingToken.objects.get_or_create(
+            jti=jti, defaults=self._outstanding_defaults()
+        )
+        result = BlacklistedToken.objects.get_or_create(token=token)
+        blacklist_index.add(jti, self.payload['exp'])
+        return result
+
+    @classmethod
+    async def afor_user(cls, user):
+        """for_user() for async views; records the token with the async ORM."""
+        # Skip BlacklistMixin.for_user, which writes the row synchronously
+        token = super(BlacklistMixin, cls).for_user(user)
+        await OutstandingToken.objects.acreate(
+            user=user,
+            jti=token[api_settings.JTI_CLAIM],
+            token=str(token),
+            created_at=token.current_time,
+            expires_at=datetime_from_epoch(token['exp']),
+        )
+        return token
+
+    def outstand(self):
+        # Called right after set_jti(), so the row cannot exist yet
+        token = OutstandingToken.objects.create(
+            jti=self.payload[api_settings.JTI_CLAIM], **self._outstanding_defaults()
+        )
+        return token, True
@@ -8,7 +8,7 @@ using Django REST Framework and Simple JWT views.
 # Relative Path: accounts/urls.py
 
 from django.urls import path
-from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+from rest_framework_simplejwt.views import TokenRefreshView
 
 from .views import (
     StudentRegisterAPIView,
@@ -17,6 +17,7 @@ from .views import (
     TeacherLoginAPIView,
     LogoutAPIView,
     UserRegistrationAPIView,
+    ThrottledTokenObtainPairView,
 )
 
 # -----------------------------------------------------------------------------
@@ -68,7 +69,7 @@ urlpatterns = [
     # JWT Token Management
     path(
         'api/token/',
-        TokenObtainPairView.as_view(),
+        ThrottledTokenObtainPairView.as_view(),
         name='token_obtain_pair'
     ),
     path(
@@ -13,8 +13,11 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.exceptions import TokenError
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.views import TokenObtainPairView
 
+from cupcp_backend.conditional import not_modified, weak_etag, with_etag
+
+from .hashing import get_password_verifier, verify_password, verify_unknown_user
 from .models import User
 from .serializers import (
     StudentRegistrationSerializer,
@@ -24,6 +27,8 @@ from .serializers import (
     UserSerializer,
     UserDetailSerializer,
 )
+from .throttling import LOGIN_THROTTLES, ScopedIPThrottle
+from .tokens import IndexedRefreshToken
 
 
 # -----------------------------------------------------------------------------
@@ -35,6 +40,9 @@ class StudentRegisterAPIView(APIView):
 
     POST: Validates and creates a new student user.
     """
+    throttle_classes = [ScopedIPThrottle]
+    throttle_scope = 'register'
+
     def post(self, request):
         serializer = StudentRegistrationSerializer(data=request.data)
         if serializer.is_valid():
@@ -52,6 +60,9 @@ class TeacherRegisterAPIView(APIView):
 
     POST: Validates against email whitelist and creates a new teacher user.
     """
+    throttle_classes = [ScopedIPThrottle]
+    throttle_scope = 'register'
+
     def post(self, request):
         serializer = TeacherRegistrationSerializer(data=request.data)
         if serializer.is_valid():
@@ -71,7 +82,13 @@ class StudentLoginAPIView(APIView):
     Authenticates a student using varsity_id and password.
 
     POST: Returns JWT tokens upon successful authentication.
+    Returns 503 when the password hashing pool is enabled and saturated.
+    Throttled per client IP and per varsity_id before any lookup or hashing.
     """
+    throttle_classes = LOGIN_THROTTLES
+    throttle_scope = 'student_login'
+    throttle_identity_field = 'varsity_id'
+
     def post(self, request):
         serializer = StudentLoginSerializer(data=request.data)
         if serializer.is_valid():
@@ -82,10 +99,10 @@ class StudentLoginAPIView(APIView):
             except User.DoesNotExist:
                 return Response({'error': 'Invalid credentials.'}, status=status.HTTP_401_UNAUTHORIZED)
 
-            if not user.check_password(password):
+            if not verify_password(user, password):
                 return Response({'error': 'Invalid credentials.'}, status=status.HTTP_401_UNAUTHORIZED)
 
-            refresh = RefreshToken.for_user(user)
+            refresh = IndexedRefreshToken.for_user(user)
             return Response(
                 {
                     'refresh': str(refresh),
@@ -102,15 +119,30 @@ class TeacherLoginAPIView(APIView):
     Authenticates a teacher using email and password.
 
     POST: Returns JWT tokens upon successful authentication.
+    Returns 503 when the password hashing pool is enabled and saturated.
+    Throttled per client IP and per email before any lookup or hashing.
     """
+    throttle_classes = LOGIN_THROTTLES
+    throttle_scope = 'teacher_login'
+    throttle_identity_field = 'email'
+
     def post(self, request):
         serializer = TeacherLoginSerializer(data=request.data)
         if serializer.is_valid():
             email = serializer.validated_data['email']
             password = serializer.validated_data['password']
-            user = authenticate(request, username=email, password=password)
+            if get_password_verifier() is None:
+                user = authenticate(request, username=email, password=password)
+            else:
+                # Same checks as ModelBackend, with the hash verified on the pool;
+                # misses and inactive users cost one hash too, like authenticate()
+                user = User.objects.filter(email=email).first()
+                if user is None:
+                    verify_unknown_user(password)
+                elif not (verify_password(user, password) and user.is_active):
+                    user = None
             if user and user.role == 'teacher':
-                refresh = RefreshToken.for_user(user)
+                refresh = IndexedRefreshToken.for_user(user)
                 return Response(
                     {
                         'refresh': str(refresh),
@@ -123,6 +155,16 @@ class TeacherLoginAPIView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+class ThrottledTokenObtainPairView(TokenObtainPairView):
+    """
+    Simple JWT's token obtain view with the login throttles applied,
+    since it hashes a password on every attempt as well.
+    """
+    throttle_classes = LOGIN_THROTTLES
+    throttle_scope = 'token_obtain'
+    throttle_identity_field = 'email'
+
+
 # -----------------------------------------------------------------------------
 # Logout View
 # -----------------------------------------------------------------------------
@@ -139,7 +181,7 @@ class LogoutAPIView(APIView):
         if not refresh_token:
             return Response({'detail': 'Refresh token is required.'}, status=status.HTTP_400_BAD_REQUEST)
         try:
-            token = RefreshToken(refresh_token)
+            token = IndexedRefreshToken(refresh_token)
             token.blacklist()
             return Response({'detail': 'Logout successful.'}, status=status.HTTP_205_RESET_CONTENT)
         except TokenError:
@@ -151,15 +193,20 @@ class LogoutAPIView(APIView):
 # -----------------------------------------------------------------------------
 class UserRegistrationAPIView(APIView):
     """
-    GET: Retrieves the authenticated user's profile.
+    GET: Retrieves the authenticated user's profile (with a weak ETag).
     POST: Creates a new generic user (any role).
     PUT: Updates the authenticated user's profile partially.
     """
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
+        # The user comes from the auth cache, so a 304 needs no query at all
+        etag = weak_etag(request.user.pk, request.user.updated_at)
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
         serializer = UserDetailSerializer(request.user)
-        return Response(serializer.data)
+        return with_etag(Response(serializer.data), etag)
 
     def post(self, request):
         serializer = UserSerializer(data=request.data)
@@ -0,0 +1,198 @@
+"""
+Concurrent-connection capacity of the ASGI deployment versus WSGI.
+
+Drives GET /student-manager/exam-registration/my/ in-process through
+``cupcp_backend.asgi.application`` (async view) and
+``cupcp_backend.wsgi.application`` (DRF view on a fixed pool of worker
+threads, like a gthread worker), from the same set of concurrent clients.
+Each client sends requests back to back on its own "connection".
+
+``--db-latency`` adds a sleep to every query to model a database on another
+host; that wait is where the WSGI pool runs out of threads while the event
+loop keeps accepting connections.
+
+The async path is not free: Django's MiddlewareMixin middleware and the
+async ORM both hop to a thread per call, so with few cores and a fast local
+database WSGI can still come out ahead. Compare runs with the latency of
+the real database.
+
+Usage:
+    python -m benchmarks.async_capacity --clients 10 50 200 --wsgi-threads 8 --db-latency 5
+"""
+
+# Relative Path: benchmarks/async_capacity.py
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.common import benchmark_database, percentile, setup_django
+
+
+PATH = '/student-manager/exam-registration/my/'
+
+
+def create_registrations(count):
+    from accounts.models import User
+    from student_manager.models import ExamRegistration
+
+    users = User.objects.bulk_create(
+        User(
+            email=f'async{i}@example.com',
+            full_name=f'ASYNC STUDENT {i}',
+            role='student',
+            phone_number=f'0170{i:07d}',
+            varsity_id=f'6{i:07d}',
+            session='2024-25',
+            gender='female',
+        )
+        for i in range(count)
+    )
+    for user in users:
+        ExamRegistration.objects.create(
+            user=user,
+            payment_status='Yes',
+            student_status='regular',
+            courses=['CSE101', 'CSE102'],
+            hall_name='Alaol Hall',
+        )
+    return users
+
+
+def add_query_latency(seconds):
+    """Delays every query on every connection opened from now on."""
+    from django.db.backends.signals import connection_created
+
+    def delay(execute, sql, params, many, context):
+        time.sleep(seconds)
+        return execute(sql, params, many, context)
+
+    def install(sender, connection, **kwargs):
+        connection.execute_wrappers.append(delay)
+
+    connection_created.connect(install, weak=False)
+
+
+def asgi_caller(application):
+    async def call(token):
+        scope = {
+            'type': 'http',
+            'asgi': {'version': '3.0'},
+            'http_version': '1.1',
+            'method': 'GET',
+            'scheme': 'http',
+            'path': PATH,
+            'raw_path': PATH.encode(),
+            'query_string': b'',
+            'headers': [(b'host', b'testserver'), (b'authorization', f'Bearer {token}'.encode())],
+            'client': ('127.0.0.1', 50000),
+            'server': ('testserver', 80),
+        }
+        sent_request = False
+        disconnected = asyncio.Event()
+        status = None
+
+        async def receive():
+            nonlocal sent_request
+            if not sent_request:
+                sent_request = True
+                return {'type': 'http.request', 'body': b'', 'more_body': False}
+            await disconnected.wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+
+        await application(scope, receive, send)
+        disconnected.set()
+        return status
+
+    return call
+
+
+def wsgi_caller(application, threads):
+    from django.test import RequestFactory
+
+    pool = ThreadPoolExecutor(max_workers=threads)
+    factory = RequestFactory()
+
+    def handle(token):
+        environ = factory.get(PATH, HTTP_AUTHORIZATION=f'Bearer {token}').environ
+        status = []
+        body = application(environ, lambda s, headers, exc_info=None: status.append(s))
+        b''.join(body)
+        body.close()
+        return int(status[0].split()[0])
+
+    async def call(token):
+        return await asyncio.get_running_loop().run_in_executor(pool, handle, token)
+
+    return call, pool
+
+
+async def run_clients(call, tokens, clients, duration):
+    """Returns (completed, errors, latencies_ms) for `clients` concurrent clients."""
+    deadline = time.monotonic() + duration
+    latencies, errors = [], 0
+
+    async def client(n):
+        nonlocal errors
+        token = tokens[n % len(tokens)]
+        while time.monotonic() < deadline:
+            started = time.perf_counter()
+            status = await call(token)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if status != 200:
+                errors += 1
+
+    await asyncio.gather(*(client(n) for n in range(clients)))
+    return len(latencies), errors, latencies
+
+
+def report(label, clients, completed, errors, latencies, duration):
+    print(
+        f'{label:<5} clients={clients:<5} req/s={completed / duration:8.1f}  '
+        f'p50={percentile(latencies, 50):8.1f}ms  p99={percentile(latencies, 99):8.1f}ms  '
+        f'errors={errors}'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--clients', type=int, nargs='+', default=[10, 50, 200])
+    parser.add_argument('--duration', type=float, default=5.0, help='Seconds per run.')
+    parser.add_argument('--wsgi-threads', type=int, default=8, help='WSGI worker threads.')
+    parser.add_argument('--db-latency', type=float, default=5.0, help='Milliseconds per query.')
+    parser.add_argument('--students', type=int, default=100)
+    args = parser.parse_args()
+
+    setup_django()
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    from cupcp_backend.asgi import application as asgi_application
+    from cupcp_backend.wsgi import application as wsgi_application
+
+    with benchmark_database():
+        users = create_registrations(args.students)
+        tokens = [str(AccessToken.for_user(user)) for user in users]
+        if args.db_latency:
+            add_query_latency(args.db_latency / 1000)
+
+        asgi_call = asgi_caller(asgi_application)
+        wsgi_call, pool = wsgi_caller(wsgi_application, args.wsgi_threads)
+        try:
+            for clients in args.clients:
+                for label, call in (('wsgi', wsgi_call), ('asgi', asgi_call)):
+                    completed, errors, latencies = asyncio.run(
+                        run_clients(call, tokens, clients, args.duration)
+                    )
+                    report(label, clients, completed, errors, latencies, args.duration)
+        finally:
+            pool.shutdown()
+
+
+if __name__ == '__main__':
+    main()
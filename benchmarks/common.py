@@ -0,0 +1,54 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Benchmarks run against a throwaway test database created from the current
+settings, with local-memory caches, so they never touch real data. Run them
+from the project root, e.g.:
+
+    python -m benchmarks.login_throughput
+"""
+
+# Relative Path: benchmarks/common.py
+
+import os
+from contextlib import contextmanager
+
+import django
+
+
+def setup_django():
+    """Configure Django for a standalone benchmark process."""
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'cupcp_backend.settings')
+    django.setup()
+
+
+@contextmanager
+def benchmark_database():
+    """
+    Creates a fresh test database (and test environment, with every cache
+    replaced by a local-memory cache) for the duration of the block, then
+    destroys it.
+    """
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    from cupcp_backend.test_runner import local_caches
+
+    setup_test_environment()
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+    try:
+        with local_caches():
+            yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of `values` (0 < pct <= 100); nan when empty."""
+    if not values:
+        return float('nan')
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
@@ -0,0 +1,410 @@
+"""
+Per-endpoint latency, query and allocation benchmark with stored baselines.
+
+Calls every route of accounts/urls.py and student_manager/urls.py through
+the full WSGI stack (test client) at each dataset size. For each route
+and size it reports p50/p95/p99 latency, queries per request and peak
+allocation per request (tracemalloc, measured in a separate pass so
+tracing does not skew the latencies), after one untimed warm-up call.
+Every measured call starts with the caches emptied (as in
+accounts.tests.test_query_budgets), so cached routes such as the summary
+and the profile are timed doing their full work, not as cache hits.
+The dataset grows from one size to
+the next, so 1k, 10k and 100k registrations are built only once.
+
+Results are written as JSON with --output. With --baseline, the run
+exits non-zero when a route at some size regressed against the stored
+run:
+  - p95 latency or allocations beyond --threshold (a fraction),
+  - or any increase in queries per request.
+--save writes this run as the new baseline. Latencies only compare
+between runs on the same machine.
+
+Usage:
+    python -m benchmarks.endpoints --sizes 1000 10000 100000 --output results.json
+    python -m benchmarks.endpoints --sizes 1000 --baseline benchmarks/baseline.json --save
+    python -m benchmarks.endpoints --sizes 1000 --baseline benchmarks/baseline.json --threshold 0.25
+"""
+
+# Relative Path: benchmarks/endpoints.py
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from itertools import count
+from typing import Callable
+
+from benchmarks.common import benchmark_database, percentile, setup_django
+
+
+PASSWORD = 'bench123'
+TEACHER_EMAIL = 'bench.teacher@example.com'
+
+
+@dataclass
+class Route:
+    """
+    One benchmarked call. `prepare(env, n)` returns the kwargs of `n` calls,
+    built before timing so fresh tokens and unique payloads are not measured.
+    """
+    name: str
+    method: str
+    prepare: Callable
+    args: tuple = ()
+
+
+# -----------------------------------------------------------------------------
+# Dataset
+# -----------------------------------------------------------------------------
+def grow_dataset(size, state):
+    """
+    Adds seeded students with one registration each (student_manager.seeding)
+    until there are `size` registrations.
+    """
+    from django.contrib.auth.hashers import make_password
+
+    from student_manager.seeding import seed_dataset
+
+    state.setdefault('password', make_password(PASSWORD))
+    added = size - state['registrations']
+    if added > 0:
+        seed_dataset(added, added, offset=state['registrations'], password=PASSWORD)
+        state['registrations'] = size
+
+
+class Env:
+    """Users and unique-value sources shared by the route preparers."""
+
+    def __init__(self, state):
+        from accounts.models import User
+
+        self.state = state
+        self.sequence = count(state.setdefault('next_fresh', 0))
+        self.teacher = User.objects.filter(email=TEACHER_EMAIL).first() or User.objects.create_user(
+            email=TEACHER_EMAIL, full_name='Bench Teacher', role='teacher',
+            phone_number='01299999999', password=PASSWORD,
+        )
+        self.student = User.objects.filter(role='student').order_by('id').first()
+
+    def unique(self):
+        value = next(self.sequence)
+        self.state['next_fresh'] = value + 1
+        return value
+
+    def bearer(self, user):
+        from rest_framework_simplejwt.tokens import RefreshToken
+
+        return {'HTTP_AUTHORIZATION': f'Bearer {RefreshToken.for_user(user).access_token}'}
+
+    def refresh(self, user):
+        from accounts.tokens import IndexedRefreshToken
+
+        return str(IndexedRefreshToken.for_user(user))
+
+    def fresh_student(self):
+        """A new student without a registration."""
+        from accounts.models import User
+
+        i = self.unique()
+        return User(
+            email=f'fresh{i}@example.com', full_name=f'Fresh Student {i}', role='student',
+            phone_number=f'010{i:08d}', varsity_id=f'9{i:07d}', session='2024-25',
+            gender='male',
+        )
+
+
+# -----------------------------------------------------------------------------
+# Routes
+# -----------------------------------------------------------------------------
+def _student_payload(env):
+    i = env.unique()
+    return {
+        'full_name': f'Bench Register {i}', 'email': f'register{i}@example.com',
+        'varsity_id': f'8{i:07d}', 'session': '2024-25', 'gender': 'female',
+        'phone_number': f'012{i:08d}', 'password': PASSWORD, 'confirm_password': PASSWORD,
+    }
+
+
+def _fresh_students(env, n):
+    from accounts.models import User
+
+    users = [env.fresh_student() for _ in range(n)]
+    for user in users:
+        user.password = env.state['password']
+    return User.objects.bulk_create(users)
+
+
+def prepare_student_register(env, n):
+    return [{'data': _student_payload(env)} for _ in range(n)]
+
+
+def prepare_teacher_register(env, n):
+    # Emails are allowed through the ALLOWED_TEACHER_EMAILS override in run()
+    calls = []
+    for _ in range(n):
+        i = env.unique()
+        email = f'teacher{i}@example.com'
+        env.state['teacher_emails'].append(email)
+        calls.append({'data': {
+            'full_name': f'Bench Teacher {i}', 'email': email,
+            'phone_number': f'011{i:08d}', 'password': PASSWORD, 'confirm_password': PASSWORD,
+        }})
+    return calls
+
+
+def prepare_student_login(env, n):
+    return [
+        {'data': {'varsity_id': env.student.varsity_id, 'password': PASSWORD}}
+        for _ in range(n)
+    ]
+
+
+def prepare_teacher_login(env, n):
+    return [{'data': {'email': TEACHER_EMAIL, 'password': PASSWORD}} for _ in range(n)]
+
+
+def prepare_token_obtain(env, n):
+    return [{'data': {'email': TEACHER_EMAIL, 'password': PASSWORD}} for _ in range(n)]
+
+
+def prepare_token_refresh(env, n):
+    return [{'data': {'refresh': env.refresh(env.student)}} for _ in range(n)]
+
+
+def prepare_logout(env, n):
+    headers = env.bearer(env.student)
+    return [{'data': {'refresh': env.refresh(env.student)}, **headers} for _ in range(n)]
+
+
+def prepare_profile_get(env, n):
+    headers = env.bearer(env.student)
+    return [dict(headers) for _ in range(n)]
+
+
+def prepare_profile_put(env, n):
+    return [
+        {'data': {'full_name': 'Bench Student Renamed', 'password': PASSWORD,
+                  'confirm_password': PASSWORD}, **env.bearer(user)}
+        for user in _fresh_students(env, n)
+    ]
+
+
+def prepare_my_registration_get(env, n):
+    headers = env.bearer(env.student)
+    return [dict(headers) for _ in range(n)]
+
+
+def prepare_my_registration_post(env, n):
+    return [
+        {'data': {'payment_status': 'Yes', 'payment_slip': f'FRESH{user.pk:08d}',
+                  'student_status': 'regular', 'courses': ['CSE101', 'MAT201'],
+                  'hall_name': 'Alaol Hall'}, **env.bearer(user)}
+        for user in _fresh_students(env, n)
+    ]
+
+
+def prepare_teacher_get(env, n):
+    headers = env.bearer(env.teacher)
+    return [dict(headers) for _ in range(n)]
+
+
+ROUTES = [
+    # accounts/urls.py
+    Route('student-register', 'post', prepare_student_register),
+    Route('teacher-register', 'post', prepare_teacher_register),
+    Route('student-login', 'post', prepare_student_login),
+    Route('teacher-login', 'post', prepare_teacher_login),
+    Route('token-logout', 'post', prepare_logout),
+    Route('user-profile', 'get', prepare_profile_get),
+    Route('user-profile', 'put', prepare_profile_put),
+    Route('token_obtain_pair', 'post', prepare_token_obtain),
+    Route('token_refresh', 'post', prepare_token_refresh),
+    # student_manager/urls.py
+    Route('my-exam-registration', 'get', prepare_my_registration_get),
+    Route('my-exam-registration', 'post', prepare_my_registration_post),
+    Route('exam-reg-summary', 'get', prepare_teacher_get),
+    Route('exam-reg-export', 'get', prepare_teacher_get, ('csv',)),
+    Route('exam-reg-stats', 'get', prepare_teacher_get),
+    Route('course-roster', 'get', prepare_teacher_get, ('CSE-101',)),
+    Route('course-count', 'get', prepare_teacher_get, ('CSE-101',)),
+]
+
+
+def route_label(route):
+    return f'{route.method.upper()} {route.name}'
+
+
+# -----------------------------------------------------------------------------
+# Measurement
+# -----------------------------------------------------------------------------
+def call(client, route, kwargs):
+    from django.urls import reverse
+
+    kwargs = dict(kwargs)
+    data = kwargs.pop('data', None)
+    method = getattr(client, route.method)
+    response = method(reverse(route.name, args=route.args), data, format='json', **kwargs)
+    if response.streaming:
+        b''.join(response.streaming_content)
+    if response.status_code >= 400:
+        raise RuntimeError(
+            f'{route_label(route)} returned {response.status_code}: {response.content[:200]!r}'
+        )
+    return response
+
+
+def empty_caches():
+    """Empties the shared and per-process caches, outside any timed region."""
+    from django.core.cache import caches
+
+    from accounts import authentication
+
+    for alias in ('default', 'shared'):
+        caches[alias].clear()
+    authentication._token_cache.clear()
+    authentication._user_cache.clear()
+
+
+def measure(route, env, requests, alloc_requests):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from rest_framework.test import APIClient
+
+    client = APIClient()
+    calls = route.prepare(env, requests + 1)
+    # One untimed call loads per-process state (imports, blacklist index)
+    call(client, route, calls.pop(0))
+    latencies, queries = [], []
+    for kwargs in calls:
+        empty_caches()
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            call(client, route, kwargs)
+            latencies.append((time.perf_counter() - started) * 1000)
+        queries.append(len(captured))
+
+    allocations = []
+    tracemalloc.start()
+    try:
+        for kwargs in route.prepare(env, alloc_requests):
+            empty_caches()
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            call(client, route, kwargs)
+            allocations.append((tracemalloc.get_traced_memory()[1] - baseline) / 1024)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'p50_ms': round(percentile(latencies, 50), 3),
+        'p95_ms': round(percentile(latencies, 95), 3),
+        'p99_ms': round(percentile(latencies, 99), 3),
+        'queries': max(queries),
+        'alloc_kib': round(statistics.median(allocations), 1) if allocations else None,
+    }
+
+
+def compare(results, baseline, threshold):
+    """Returns a list of regression messages of `results` against `baseline`."""
+    regressions = []
+    for size, routes in results.items():
+        for label, current in routes.items():
+            previous = baseline.get(size, {}).get(label)
+            if previous is None:
+                continue
+            if current['queries'] > previous['queries']:
+                regressions.append(
+                    f'{label} @ {size}: queries {previous["queries"]} -> {current["queries"]}'
+                )
+            for metric in ('p95_ms', 'alloc_kib'):
+                if current.get(metric) is None or not previous.get(metric):
+                    continue
+                if current[metric] > previous[metric] * (1 + threshold):
+                    regressions.append(
+                        f'{label} @ {size}: {metric} {previous[metric]} -> {current[metric]}'
+                    )
+    return regressions
+
+
+def report(size, label, result):
+    print(
+        f'{size:>7} {label:<28} p50={result["p50_ms"]:8.2f}ms  p95={result["p95_ms"]:8.2f}ms  '
+        f'p99={result["p99_ms"]:8.2f}ms  queries={result["queries"]:<3} '
+        f'alloc={result["alloc_kib"]:9.1f}KiB'
+    )
+
+
+def run(args):
+    from django.conf import settings
+    from django.test import override_settings
+
+    state = {'registrations': 0, 'teacher_emails': []}
+    # Throttles would cap repeated calls; teacher signup needs whitelisted emails
+    overrides = override_settings(
+        REST_FRAMEWORK={**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': {}},
+        ALLOWED_TEACHER_EMAILS=state['teacher_emails'],
+    )
+    selected = [
+        route for route in ROUTES
+        if not args.routes or route.name in args.routes
+    ]
+    results = {}
+    with benchmark_database(), overrides:
+        for size in sorted(args.sizes):
+            started = time.perf_counter()
+            grow_dataset(size, state)
+            print(f'Dataset: {size} registrations ({time.perf_counter() - started:.1f}s)')
+            env = Env(state)
+            results[str(size)] = {}
+            for route in selected:
+                result = measure(route, env, args.requests, args.alloc_requests)
+                results[str(size)][route_label(route)] = result
+                report(size, route_label(route), result)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help='Registration counts to benchmark at.')
+    parser.add_argument('--requests', type=int, default=30, help='Timed calls per route.')
+    parser.add_argument('--alloc-requests', type=int, default=3,
+                        help='Calls per route traced for allocations.')
+    parser.add_argument('--routes', nargs='*', help='Only these URL names.')
+    parser.add_argument('--output', help='Write the results to this JSON file.')
+    parser.add_argument('--baseline', help='Baseline JSON file to compare against.')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='Allowed p95/allocation growth over the baseline (fraction).')
+    parser.add_argument('--save', action='store_true',
+                        help='Store this run as the baseline instead of comparing.')
+    args = parser.parse_args()
+
+    setup_django()
+    results = run(args)
+
+    if args.output:
+        with open(args.output, 'w') as handle:
+            json.dump(results, handle, indent=2, sort_keys=True)
+    if not args.baseline:
+        return
+    if args.save:
+        with open(args.baseline, 'w') as handle:
+            json.dump(results, handle, indent=2, sort_keys=True)
+        print(f'Baseline written to {args.baseline}')
+        return
+
+    with open(args.baseline) as handle:
+        regressions = compare(results, json.load(handle), args.threshold)
+    for message in regressions:
+        print(f'REGRESSION {message}')
+    if regressions:
+        sys.exit(1)
+    print('No regressions against the baseline.')
+
+
+if __name__ == '__main__':
+    main()
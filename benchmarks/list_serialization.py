@@ -0,0 +1,70 @@
+"""
+ExamRegistrationSerializer(many=True): model instances versus the
+ValuesListSerializer .values() path.
+
+For each size, times fetching and serializing every registration both
+ways (query included, rendering excluded) and checks that the rendered
+JSON is byte-identical.
+
+Usage:
+    python -m benchmarks.list_serialization --sizes 1000 10000 50000
+"""
+
+# Relative Path: benchmarks/list_serialization.py
+
+import argparse
+import statistics
+import time
+
+from benchmarks.common import benchmark_database, setup_django
+
+
+def best_of(func, rounds):
+    """Median milliseconds of `rounds` calls, and the last result."""
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 50000])
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+    from rest_framework.renderers import JSONRenderer
+    from rest_framework.serializers import ListSerializer
+
+    from student_manager.models import ExamRegistration
+    from student_manager.seeding import seed_dataset
+    from student_manager.serializers import ExamRegistrationSerializer
+
+    def instances(queryset):
+        # What many=True did before: one model instance and field walk per row
+        return ListSerializer(child=ExamRegistrationSerializer(), instance=list(queryset)).data
+
+    def values(queryset):
+        return ExamRegistrationSerializer(queryset, many=True).data
+
+    with benchmark_database():
+        seeded = 0
+        for size in sorted(args.sizes):
+            seed_dataset(size - seeded, size - seeded, offset=seeded, batch_size=10000)
+            seeded = size
+            queryset = ExamRegistration.objects.order_by('created_at', 'id')
+            # .all() so no round reuses another's result cache
+            slow, slow_data = best_of(lambda: instances(queryset.all()), args.rounds)
+            fast, fast_data = best_of(lambda: values(queryset.all()), args.rounds)
+            identical = JSONRenderer().render(slow_data) == JSONRenderer().render(fast_data)
+            print(
+                f'{size:>7} rows  instances {slow:9.1f}ms  values {fast:9.1f}ms  '
+                f'speedup {slow / fast:4.1f}x  identical={identical}'
+            )
+
+
+if __name__ == '__main__':
+    main()
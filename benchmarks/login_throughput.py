@@ -0,0 +1,170 @@
+"""
+Login throughput with and without the password hashing pool.
+
+Runs the student login endpoint from several client threads inside one
+server process, first with hashing on the request threads and then with
+``PASSWORD_HASH_POOL`` enabled, while a probe thread measures the latency
+of a cheap authenticated endpoint to show how much hashing stalls it.
+
+Usage:
+    python -m benchmarks.login_throughput --threads 8 --duration 10 --pool-workers 2
+"""
+
+# Relative Path: benchmarks/login_throughput.py
+
+import argparse
+import os
+import resource
+import statistics
+import threading
+import time
+
+from benchmarks.common import benchmark_database, setup_django
+
+
+PASSWORD = 'bench123'
+
+
+def create_students(count):
+    from django.contrib.auth.hashers import make_password
+
+    from accounts.models import User
+
+    encoded = make_password(PASSWORD)
+    User.objects.bulk_create(
+        User(
+            email=f'bench{i}@example.com',
+            full_name=f'BENCH STUDENT {i}',
+            role='student',
+            phone_number=f'0160{i:07d}',
+            varsity_id=f'7{i:07d}',
+            session='2024-25',
+            gender='male',
+            password=encoded,
+        )
+        for i in range(count)
+    )
+
+
+def run_phase(threads, duration, students):
+    """
+    Hammers student-login for `duration` seconds and probes user-profile.
+    Returns (logins, errors, probe_latencies_ms).
+    """
+    from django.db import connections
+    from django.urls import reverse
+    from rest_framework.test import APIClient
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    from accounts.models import User
+
+    login_url = reverse('student-login')
+    profile_url = reverse('user-profile')
+    probe_token = str(RefreshToken.for_user(User.objects.first()).access_token)
+    deadline = time.monotonic() + duration
+    counts = {'ok': 0, 'error': 0}
+    lock = threading.Lock()
+    probe_latencies = []
+
+    def login_worker(offset):
+        client = APIClient()
+        i = offset
+        while time.monotonic() < deadline:
+            response = client.post(
+                login_url,
+                {'varsity_id': f'7{i % students:07d}', 'password': PASSWORD},
+                format='json',
+            )
+            with lock:
+                counts['ok' if response.status_code == 200 else 'error'] += 1
+            i += threads
+        connections.close_all()
+
+    def probe_worker():
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {probe_token}')
+        while time.monotonic() < deadline:
+            started = time.perf_counter()
+            client.get(profile_url)
+            probe_latencies.append((time.perf_counter() - started) * 1000)
+            time.sleep(0.01)
+        connections.close_all()
+
+    workers = [threading.Thread(target=login_worker, args=(n,)) for n in range(threads)]
+    workers.append(threading.Thread(target=probe_worker))
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return counts['ok'], counts['error'], probe_latencies
+
+
+def cpu_seconds():
+    """CPU time used by this process and its reaped children (pool workers)."""
+    total = 0.0
+    for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN):
+        usage = resource.getrusage(who)
+        total += usage.ru_utime + usage.ru_stime
+    return total
+
+
+def report(label, logins, errors, probe, duration, cpu):
+    """
+    Prints throughput; "per core" is logins per CPU-second actually consumed,
+    which includes pool workers once they have exited.
+    """
+    probe_p50 = statistics.median(probe) if probe else float('nan')
+    probe_max = max(probe) if probe else float('nan')
+    print(
+        f'{label:<14} logins/s={logins / duration:8.1f}  '
+        f'logins/cpu-s={logins / cpu if cpu else float("nan"):8.1f}  errors={errors:<5} '
+        f'probe p50={probe_p50:7.1f}ms max={probe_max:7.1f}ms'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--threads', type=int, default=8, help='Concurrent login clients.')
+    parser.add_argument('--duration', type=float, default=10.0, help='Seconds per phase.')
+    parser.add_argument('--pool-workers', type=int, default=os.cpu_count() or 2)
+    parser.add_argument('--students', type=int, default=200)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.test import override_settings
+
+    from accounts import hashing
+
+    # Login throttles would cap the measurement, so switch them off
+    unthrottled = override_settings(
+        REST_FRAMEWORK={**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': {}}
+    )
+    with benchmark_database(), unthrottled:
+        create_students(args.students)
+
+        with override_settings(PASSWORD_HASH_POOL={'ENABLED': False}):
+            started = cpu_seconds()
+            logins, errors, probe = run_phase(args.threads, args.duration, args.students)
+            cpu = cpu_seconds() - started
+        report('request-thread', logins, errors, probe, args.duration, cpu)
+
+        pool = {
+            'ENABLED': True,
+            'WORKERS': args.pool_workers,
+            'MAX_PENDING': args.threads * 2,
+            'TIMEOUT': 30.0,
+        }
+        with override_settings(PASSWORD_HASH_POOL=pool):
+            # Warm the pool so worker start-up is not measured
+            hashing.get_password_verifier().verify(PASSWORD, 'unusable')
+            started = cpu_seconds()
+            logins, errors, probe = run_phase(args.threads, args.duration, args.students)
+            # Reap the workers so their CPU time shows up in RUSAGE_CHILDREN
+            hashing.get_password_verifier().shutdown(wait=True)
+            cpu = cpu_seconds() - started
+        report('process-pool', logins, errors, probe, args.duration, cpu)
+
+
+if __name__ == '__main__':
+    main()
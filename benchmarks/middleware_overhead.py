@@ -0,0 +1,116 @@
+"""
+Per-request cost of the browser-only middleware on the JWT API routes.
+
+Measures two things, with API_PATH_PREFIXES empty (full stack on every
+path, as before) and with the configured prefixes (session, CSRF, auth
+and messages skipped for the APIs):
+
+- "stack": the four middleware alone, wrapped around a no-op view;
+- "endpoint": GET /auth/user/ through the whole WSGI handler with a warm
+  user cache (no queries), i.e. what a client actually sees.
+
+Usage:
+    python -m benchmarks.middleware_overhead --requests 20000
+"""
+
+# Relative Path: benchmarks/middleware_overhead.py
+
+import argparse
+import statistics
+import time
+
+from benchmarks.common import benchmark_database, setup_django
+
+
+PATH = '/auth/user/'
+BROWSER_MIDDLEWARE = (
+    'BrowserSessionMiddleware',
+    'BrowserCsrfViewMiddleware',
+    'BrowserAuthenticationMiddleware',
+    'BrowserMessageMiddleware',
+)
+
+
+def per_request_us(func, requests, rounds=5):
+    """Median over `rounds` of the mean microseconds per call."""
+    func()
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(requests):
+            func()
+        samples.append((time.perf_counter() - start) / requests * 1e6)
+    return statistics.median(samples)
+
+
+def stack_call(prefixes):
+    from django.http import HttpResponse
+    from django.test import RequestFactory, override_settings
+
+    from cupcp_backend import browser_middleware
+
+    with override_settings(API_PATH_PREFIXES=prefixes):
+        def view(request):
+            return HttpResponse()
+
+        handler = view
+        for name in reversed(BROWSER_MIDDLEWARE):
+            handler = getattr(browser_middleware, name)(handler)
+        csrf = handler.get_response  # the handler also calls its process_view
+    factory = RequestFactory()
+
+    def call():
+        request = factory.get(PATH)
+        csrf.process_view(request, view, (), {})
+        handler(request)
+
+    return call
+
+
+def endpoint_call(prefixes, headers):
+    from django.test import Client, override_settings
+
+    client = Client()
+    with override_settings(API_PATH_PREFIXES=prefixes):
+        client.get(PATH, **headers)  # builds the middleware chain under the override
+
+    def call():
+        response = client.get(PATH, **headers)
+        assert response.status_code == 200, response.status_code
+
+    return call
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--requests', type=int, default=20000, help='Calls per round.')
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    with benchmark_database():
+        from accounts.models import User
+
+        user = User.objects.create_user(
+            email='bench.mw@example.com', full_name='Bench Middleware', role='student',
+            phone_number='01311111119', varsity_id='71111119', session='2024-25',
+            gender='female', password='bench123',
+        )
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {AccessToken.for_user(user)}'}
+        configured = tuple(settings.API_PATH_PREFIXES)
+        for label, build, requests in (
+            ('stack', lambda prefixes: stack_call(prefixes), args.requests),
+            ('endpoint', lambda prefixes: endpoint_call(prefixes, headers), args.requests // 10),
+        ):
+            full = per_request_us(build(()), requests)
+            slim = per_request_us(build(configured), requests)
+            print(
+                f'{label:<9} full stack {full:8.1f}us  api stack {slim:8.1f}us  '
+                f'saved {full - slim:7.1f}us/request ({(full - slim) / full:5.1%})'
+            )
+
+
+if __name__ == '__main__':
+    main()
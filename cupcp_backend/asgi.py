@@ -2,6 +2,8 @@
 ASGI config for cupcp_backend project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Requests served through it are routed with cupcp_backend/asgi_urls.py, which
+maps the hot student endpoints to their async implementations.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
@@ -9,8 +11,24 @@ https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
 
 import os
 
-from django.core.asgi import get_asgi_application
+import django
+from django.core.handlers.asgi import ASGIHandler
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "cupcp_backend.settings")
 
-application = get_asgi_application()
+ASGI_URLCONF = "cupcp_backend.asgi_urls"
+
+
+class AsyncRoutingASGIHandler(ASGIHandler):
+    """ASGIHandler that resolves requests against ASGI_URLCONF."""
+
+    def create_request(self, scope, body_file):
+        request, error_response = super().create_request(scope, body_file)
+        if request is not None:
+            request.urlconf = ASGI_URLCONF
+        return request, error_response
+
+
+# Same set-up as django.core.asgi.get_asgi_application()
+django.setup(set_prefix=False)
+application = AsyncRoutingASGIHandler()
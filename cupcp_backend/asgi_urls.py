@@ -0,0 +1,31 @@
+"""
+URL configuration used by the ASGI entry point (cupcp_backend/asgi.py).
+
+The hot student endpoints are served by their async implementations; every
+other route falls through to the regular URLconf, so URL names and reverse()
+are unchanged.
+"""
+
+# Relative Path: cupcp_backend/asgi_urls.py
+
+from django.urls import include, path
+
+from accounts.async_views import AsyncStudentLoginView, AsyncUserProfileView
+from student_manager.async_views import AsyncMyExamRegistration
+
+# -----------------------------------------------------------------------------
+# URL Patterns
+# -----------------------------------------------------------------------------
+urlpatterns = [
+    # Same names as the sync routes, so metrics and reverse() agree
+    path('auth/students/login/', AsyncStudentLoginView.as_view(), name='student-login'),
+    path('auth/user/', AsyncUserProfileView.as_view(), name='user-profile'),
+    path(
+        'student-manager/exam-registration/my/',
+        AsyncMyExamRegistration.as_view(),
+        name='my-exam-registration'
+    ),
+
+    # Everything else: the synchronous URLconf
+    path('', include('cupcp_backend.urls')),
+]
@@ -0,0 +1,104 @@
+"""
+Minimal async counterpart of DRF's APIView for the ASGI deployment.
+
+DRF views are synchronous, so under an ASGI server every request is handed
+to a thread. AsyncAPIView is a plain async Django view that reproduces the
+parts of APIView the hot endpoints rely on:
+
+- request bodies parsed by DRF's parsers (``request.data``),
+- JWT authentication through the cached user lookup,
+- fixed-window throttles (accounts/throttling.py),
+- DRF's exception handling and JSON rendering, so responses are
+  byte-for-byte the same as from the WSGI views.
+
+Handlers are ``async def`` methods named after the HTTP verb and return
+``self.respond(data, status)``. Views are routed through
+cupcp_backend/asgi_urls.py, which only the ASGI entry point uses.
+"""
+
+# Relative Path: cupcp_backend/asyncapi.py
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions, status
+from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.request import Request
+from rest_framework.views import exception_handler
+
+from accounts.authentication import CachedJWTAuthentication
+from cupcp_backend.fastjson import FastJSONParser, FastJSONRenderer
+
+
+@method_decorator(csrf_exempt, name='dispatch')  # JWT only, like the DRF views
+class AsyncAPIView(View):
+    """
+    Base class for async API views.
+
+    ``authentication_required`` replaces ``permission_classes = [IsAuthenticated]``;
+    ``throttle_classes``/``throttle_scope`` work as on APIView.
+    Methods with no async handler go to ``sync_view`` when it is set.
+    """
+    authentication_required = True
+    throttle_classes = []
+    parser_classes = [FastJSONParser, FormParser, MultiPartParser]
+    renderer = FastJSONRenderer()
+    # Optional sync view (``SomeAPIView.as_view()``) for the other methods
+    sync_view = None
+
+    async def dispatch(self, request, *args, **kwargs):
+        handler = getattr(self, request.method.lower(), None)
+        if handler is None and self.sync_view is not None:
+            # Methods without an async handler are served by the DRF view
+            return await sync_to_async(self.sync_view)(request, *args, **kwargs)
+        if request.method.lower() not in self.http_method_names or handler is None:
+            return self.respond(
+                {'detail': f'Method "{request.method}" not allowed.'},
+                status.HTTP_405_METHOD_NOT_ALLOWED,
+            )
+
+        # DRF's Request wrapper is only used to parse the body; with ASGI the
+        # body is already buffered, so this does not block the event loop.
+        drf_request = Request(request, parsers=[parser() for parser in self.parser_classes])
+        try:
+            request.data = drf_request.data
+            await self.authenticate(request)
+            for throttle in self.throttle_classes:
+                throttle = throttle()
+                if not await throttle.aallow_request(drf_request, self):
+                    raise exceptions.Throttled(throttle.wait())
+            return await handler(request, *args, **kwargs)
+        except Exception as exc:
+            return self.handle_exception(request, exc)
+
+    async def authenticate(self, request):
+        authenticator = CachedJWTAuthentication()
+        result = await authenticator.aauthenticate(request)
+        if result is not None:
+            request.user, request.auth = result
+        elif self.authentication_required:
+            raise exceptions.NotAuthenticated()
+
+    def handle_exception(self, request, exc):
+        """Renders `exc` the way APIView.handle_exception would."""
+        if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+            exc.auth_header = CachedJWTAuthentication().authenticate_header(request)
+        response = exception_handler(exc, {'view': self, 'request': request})
+        if response is None:
+            raise exc
+        headers = {}
+        if getattr(exc, 'auth_header', None):
+            headers['WWW-Authenticate'] = exc.auth_header
+        if 'Retry-After' in response:
+            headers['Retry-After'] = response['Retry-After']
+        return self.respond(response.data, response.status_code, headers)
+
+    def respond(self, data, status_code=status.HTTP_200_OK, headers=None):
+        return HttpResponse(
+            self.renderer.render(data),
+            status=status_code,
+            content_type='application/json',
+            headers=headers,
+        )
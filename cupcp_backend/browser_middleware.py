@@ -0,0 +1,64 @@
+"""
+Session, CSRF, authentication and messages middleware that skip API paths.
+
+The ``auth/`` and ``student-manager/`` APIs authenticate with JWT only
+(CachedJWTAuthentication) and their views are CSRF-exempt, so loading a
+session, checking CSRF, resolving ``request.user`` and setting up message
+storage is wasted work for them. The classes here are drop-in
+replacements for the Django middleware in ``settings.MIDDLEWARE``:
+
+- requests whose path starts with one of ``settings.API_PATH_PREFIXES`` go
+  straight to the next middleware,
+- everything else (``admin/``, the home page) gets the full behaviour.
+
+They subclass the Django classes, so the admin's system checks for
+sessions, auth and messages middleware still pass.
+"""
+
+# Relative Path: cupcp_backend/browser_middleware.py
+
+from django.conf import settings
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.middleware.csrf import CsrfViewMiddleware
+
+
+class BrowserOnlyMixin:
+    """
+    Bypasses the wrapped middleware for API requests. The prefixes are read
+    once, when the middleware chain is built.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.api_prefixes = tuple(getattr(settings, 'API_PATH_PREFIXES', ()))
+
+    def is_api_request(self, request):
+        return request.path_info.startswith(self.api_prefixes)
+
+    def __call__(self, request):
+        # In async mode get_response returns an awaitable, like MiddlewareMixin
+        if self.api_prefixes and self.is_api_request(request):
+            return self.get_response(request)
+        return super().__call__(request)
+
+
+class BrowserSessionMiddleware(BrowserOnlyMixin, SessionMiddleware):
+    pass
+
+
+class BrowserCsrfViewMiddleware(BrowserOnlyMixin, CsrfViewMiddleware):
+    def process_view(self, request, callback, callback_args, callback_kwargs):
+        # The handler calls process_view directly, outside __call__
+        if self.api_prefixes and self.is_api_request(request):
+            return None
+        return super().process_view(request, callback, callback_args, callback_kwargs)
+
+
+class BrowserAuthenticationMiddleware(BrowserOnlyMixin, AuthenticationMiddleware):
+    pass
+
+
+class BrowserMessageMiddleware(BrowserOnlyMixin, MessageMiddleware):
+    pass
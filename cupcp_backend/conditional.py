@@ -0,0 +1,38 @@
+"""
+Weak ETags and conditional GET helpers for the API views.
+
+Views build an ETag from row versions (``updated_at``, ids, counts) before
+serializing anything, answer a matching ``If-None-Match`` with 304 via
+``not_modified()``, and otherwise attach the ETag to the full response.
+"""
+
+# Relative Path: cupcp_backend/conditional.py
+
+import hashlib
+
+from django.utils.cache import get_conditional_response
+
+
+def weak_etag(*parts):
+    """Weak ETag over `parts` (datetimes, ids, strings)."""
+    raw = '|'.join('' if part is None else str(part) for part in parts)
+    return f'W/"{hashlib.sha1(raw.encode("utf-8")).hexdigest()}"'
+
+
+def wants_revalidation(request):
+    """True when the client sent If-None-Match, i.e. a 304 is possible."""
+    return 'HTTP_IF_NONE_MATCH' in request.META
+
+
+def not_modified(request, etag):
+    """
+    Returns a 304 response when `etag` matches the request's If-None-Match
+    (or 412 for a failed If-Match), else None.
+    """
+    # DRF's Request wraps the HttpRequest that Django's helper expects
+    return get_conditional_response(getattr(request, '_request', request), etag=etag)
+
+
+def with_etag(response, etag):
+    response['ETag'] = etag
+    return response
@@ -0,0 +1,84 @@
+"""
+JSON renderer and parser backed by orjson, with a clean fallback.
+
+FastJSONRenderer and FastJSONParser are drop-in replacements for DRF's
+JSONRenderer and JSONParser, selected in ``REST_FRAMEWORK``. When orjson
+is installed they encode straight to UTF-8 bytes in C, with datetime,
+date, time and UUID handled natively and Decimal converted to a float the
+way DRF's encoder does. Other types (lazy strings, querysets, ...) go
+through DRF's JSONEncoder.default. Without orjson, or for output orjson
+cannot produce (indented or ASCII-only JSON, non-string dict keys,
+integers beyond 64 bits), they defer to the DRF classes. The output is the same bytes either way,
+with one difference: NaN and Infinity render as null instead of raising.
+"""
+
+# Relative Path: cupcp_backend/fastjson.py
+
+from decimal import Decimal
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+_encoder = JSONEncoder()
+
+# Escaped like DRF's renderer, so the output is also valid JavaScript
+_LINE_SEPARATORS = ((b'\xe2\x80\xa8', b'\\u2028'), (b'\xe2\x80\xa9', b'\\u2029'))
+
+
+def _default(obj):
+    if isinstance(obj, Decimal):
+        return float(obj)
+    return _encoder.default(obj)
+
+
+# "Z" for UTC like DRF. Non-string dict keys are left out (OPT_NON_STR_KEYS
+# slows every dump by a third); such payloads fall back to DRF.
+OPTIONS = orjson.OPT_UTC_Z if orjson is not None else 0
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer that encodes with orjson when it is available."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if orjson is None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            # Pretty printing (e.g. the browsable API) is rare; keep DRF's exact indent
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=_default, option=OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Single-byte memchr first; multi-byte searches cost ~1us per KiB
+        if b'\xe2' in ret:
+            for raw, escaped in _LINE_SEPARATORS:
+                if raw in ret:
+                    ret = ret.replace(raw, escaped)
+        return ret
+
+
+class FastJSONParser(JSONParser):
+    """JSONParser that decodes UTF-8 bodies with orjson when it is available."""
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        if orjson is None or encoding.lower().replace('_', '-') not in ('utf-8', 'utf8'):
+            return super().parse(stream, media_type, parser_context)
+        try:
+            # Rejects NaN/Infinity like DRF's strict mode
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
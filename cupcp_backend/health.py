@@ -0,0 +1,124 @@
+"""
+Liveness and readiness probes for load balancers and orchestrators.
+
+HealthCheckMiddleware is the first middleware, so ``/healthz`` and
+``/readyz`` are answered before CORS, sessions, CSRF, authentication,
+ALLOWED_HOSTS checks and URL resolution run, and they never show up in
+the request metrics. Both return compact JSON with timings:
+
+- ``GET /healthz``: the process is up and serving; reports its uptime. No I/O.
+- ``GET /readyz``: runs a timed ``SELECT 1`` on every configured database
+  and compares the applied migrations with the ones on disk. Responds 503
+  when a database is unreachable or migrations are pending.
+"""
+
+# Relative Path: cupcp_backend/health.py
+
+import time
+from functools import cache
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.db import DatabaseError, connections
+from django.db.migrations.loader import MigrationLoader
+from django.db.migrations.recorder import MigrationRecorder
+from django.http import JsonResponse
+
+
+LIVENESS_PATH = '/healthz'
+READINESS_PATH = '/readyz'
+
+PROBE_HEADERS = {'Cache-Control': 'no-store'}
+
+_STARTED = time.monotonic()
+
+
+def _ms(start):
+    return round((time.perf_counter() - start) * 1000, 3)
+
+
+@cache
+def _migrations_on_disk():
+    """(app_label, name) of every migration in the code. Read once per process."""
+    return frozenset(MigrationLoader(None, ignore_no_migrations=True).graph.nodes)
+
+
+# -----------------------------------------------------------------------------
+# Checks
+# -----------------------------------------------------------------------------
+def liveness():
+    return {'status': 'ok', 'uptime_s': round(time.monotonic() - _STARTED, 3)}, 200
+
+
+def readiness():
+    """Returns the readiness report and its HTTP status."""
+    start = time.perf_counter()
+    report = {'status': 'ok', 'databases': {}}
+
+    for alias in connections:
+        check_start = time.perf_counter()
+        try:
+            with connections[alias].cursor() as cursor:
+                cursor.execute('SELECT 1')
+                cursor.fetchone()
+        except DatabaseError as exc:
+            report['status'] = 'unavailable'
+            report['databases'][alias] = {
+                'ok': False, 'error': type(exc).__name__, 'ms': _ms(check_start),
+            }
+        else:
+            report['databases'][alias] = {'ok': True, 'ms': _ms(check_start)}
+
+    if report['databases'].get('default', {}).get('ok'):
+        check_start = time.perf_counter()
+        applied = MigrationRecorder(connections['default']).applied_migrations()
+        pending = len(_migrations_on_disk() - set(applied))
+        report['migrations'] = {'pending': pending, 'ms': _ms(check_start)}
+        if pending:
+            report['status'] = 'unavailable'
+
+    report['ms'] = _ms(start)
+    return report, 200 if report['status'] == 'ok' else 503
+
+
+# -----------------------------------------------------------------------------
+# Middleware
+# -----------------------------------------------------------------------------
+class HealthCheckMiddleware:
+    """
+    Answers the probe paths directly and passes every other request on.
+    Works in both the WSGI and the ASGI handler.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        path = request.path_info
+        if path == LIVENESS_PATH:
+            return self._respond(*liveness())
+        if path == READINESS_PATH:
+            return self._respond(*readiness())
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        path = request.path_info
+        if path == LIVENESS_PATH:
+            return self._respond(*liveness())
+        if path == READINESS_PATH:
+            # The ORM is sync-only; run on the thread that owns the connections
+            return self._respond(*await sync_to_async(readiness)())
+        return await self.get_response(request)
+
+    @staticmethod
+    def _respond(report, status):
+        return JsonResponse(
+            report, status=status, headers=PROBE_HEADERS,
+            json_dumps_params={'separators': (',', ':')},
+        )
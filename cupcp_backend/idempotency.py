@@ -0,0 +1,219 @@
+"""
+Idempotency-Key support for mutating requests.
+
+A POST/PUT/PATCH/DELETE carrying an ``Idempotency-Key`` header is executed
+once; the response (status, headers, body) is kept in the ``shared`` cache
+for ``settings.IDEMPOTENCY['TTL']`` seconds and replayed, marked with
+``Idempotent-Replayed: true``, for every retry with the same key, without
+reaching the view, serializers or database.
+
+Keys are scoped to the method, path and Authorization header. A retry
+whose body differs from the original is refused with 422. While the first
+request is still running, duplicates wait for its response (up to
+``WAIT`` seconds, then 409) instead of running the view again.
+
+Responses to 5xx and 429 are not stored, so those can be retried. Routes
+named in ``EXCLUDE`` (the login and token endpoints, whose responses carry
+fresh JWTs) are never stored either; the header is ignored there. The
+in-flight lock uses cache.add(), which is atomic on Redis/Memcached; with
+the file-based default two duplicates arriving in the same instant can
+both get through.
+"""
+
+# Relative Path: cupcp_backend/idempotency.py
+
+import asyncio
+import hashlib
+import time
+from dataclasses import dataclass
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse, JsonResponse
+from django.urls import Resolver404, resolve
+
+
+IDEMPOTENT_METHODS = {'POST', 'PUT', 'PATCH', 'DELETE'}
+
+# Response headers never stored with a replayed response
+SKIPPED_HEADERS = {'set-cookie', 'vary'}
+
+
+def _settings():
+    return {
+        'TTL': 86400,
+        'LOCK_TIMEOUT': 30,
+        'WAIT': 10,
+        'POLL_INTERVAL': 0.05,
+        'MAX_KEY_LENGTH': 255,
+        # URL names whose responses hold credentials and must not be cached
+        'EXCLUDE': ('student-login', 'teacher-login', 'token_obtain_pair', 'token_refresh'),
+        **getattr(settings, 'IDEMPOTENCY', {}),
+    }
+
+
+@dataclass
+class _Slot:
+    key: str
+    lock: str
+    fingerprint: str
+
+
+class IdempotencyMiddleware:
+    """
+    Stores and replays responses of requests sent with an Idempotency-Key.
+    Works in both the WSGI and the ASGI handler without thread hops.
+    """
+    sync_capable = True
+    async_capable = True
+    cache_alias = 'shared'
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    # -------------------------------------------------------------------------
+    # Request handling
+    # -------------------------------------------------------------------------
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        slot, error = self._slot(request)
+        if error is not None:
+            return error
+        if slot is None:
+            return self.get_response(request)
+
+        config = _settings()
+        cache = caches[self.cache_alias]
+        deadline = time.monotonic() + config['WAIT']
+        while True:
+            record = cache.get(slot.key)
+            if record is not None:
+                return self._replay(record, slot)
+            if cache.add(slot.lock, True, timeout=config['LOCK_TIMEOUT']):
+                break
+            if time.monotonic() >= deadline:
+                return self._in_progress()
+            time.sleep(config['POLL_INTERVAL'])
+
+        try:
+            # The first request may have finished between get() and add()
+            record = cache.get(slot.key)
+            if record is not None:
+                return self._replay(record, slot)
+            response = self.get_response(request)
+            record = self._record(response, slot)
+            if record is not None:
+                cache.set(slot.key, record, timeout=config['TTL'])
+            return response
+        finally:
+            cache.delete(slot.lock)
+
+    async def __acall__(self, request):
+        slot, error = self._slot(request)
+        if error is not None:
+            return error
+        if slot is None:
+            return await self.get_response(request)
+
+        config = _settings()
+        cache = caches[self.cache_alias]
+        deadline = time.monotonic() + config['WAIT']
+        while True:
+            record = await cache.aget(slot.key)
+            if record is not None:
+                return self._replay(record, slot)
+            if await cache.aadd(slot.lock, True, timeout=config['LOCK_TIMEOUT']):
+                break
+            if time.monotonic() >= deadline:
+                return self._in_progress()
+            await asyncio.sleep(config['POLL_INTERVAL'])
+
+        try:
+            record = await cache.aget(slot.key)
+            if record is not None:
+                return self._replay(record, slot)
+            response = await self.get_response(request)
+            record = self._record(response, slot)
+            if record is not None:
+                await cache.aset(slot.key, record, timeout=config['TTL'])
+            return response
+        finally:
+            await cache.adelete(slot.lock)
+
+    # -------------------------------------------------------------------------
+    # Helpers
+    # -------------------------------------------------------------------------
+    def _slot(self, request):
+        """
+        Returns (slot, None) for requests to deduplicate, (None, None) for
+        requests to pass through and (None, response) for invalid keys.
+        """
+        idempotency_key = request.headers.get('Idempotency-Key')
+        if not idempotency_key or request.method not in IDEMPOTENT_METHODS:
+            return None, None
+        config = _settings()
+        if self._excluded(request, config['EXCLUDE']):
+            return None, None
+        if len(idempotency_key) > config['MAX_KEY_LENGTH']:
+            return None, JsonResponse(
+                {'detail': 'Idempotency-Key is too long.'}, status=400
+            )
+        scope = '\n'.join((
+            request.method,
+            request.path,
+            request.headers.get('Authorization', ''),
+            idempotency_key,
+        ))
+        digest = hashlib.sha256(scope.encode('utf-8')).hexdigest()
+        return _Slot(
+            key=f'idempotency:{digest}',
+            lock=f'idempotency:{digest}:lock',
+            fingerprint=hashlib.sha256(request.body).hexdigest(),
+        ), None
+
+    def _excluded(self, request, url_names):
+        try:
+            match = resolve(request.path_info)
+        except Resolver404:
+            return False
+        return match.url_name in url_names
+
+    def _record(self, response, slot):
+        """The cache entry for `response`, or None if it must not be replayed."""
+        if response.streaming or response.status_code >= 500 or response.status_code == 429:
+            return None
+        return {
+            'fingerprint': slot.fingerprint,
+            'status': response.status_code,
+            'headers': [
+                (name, value) for name, value in response.items()
+                if name.lower() not in SKIPPED_HEADERS
+            ],
+            'content': response.content,
+        }
+
+    def _replay(self, record, slot):
+        if record['fingerprint'] != slot.fingerprint:
+            return JsonResponse(
+                {'detail': 'Idempotency-Key was already used for a different request.'},
+                status=422,
+            )
+        response = HttpResponse(record['content'], status=record['status'])
+        for name, value in record['headers']:
+            response[name] = value
+        response['Idempotent-Replayed'] = 'true'
+        return response
+
+    def _in_progress(self):
+        response = JsonResponse(
+            {'detail': 'A request with this Idempotency-Key is still in progress.'},
+            status=409,
+        )
+        response['Retry-After'] = '1'
+        return response
@@ -0,0 +1,346 @@
+"""
+Per-view request metrics in the Prometheus text format.
+
+MetricsMiddleware records, for every request, the resolved URL name, its
+latency, and the number and duration of the database queries it ran.
+Recording only updates in-process dicts. Each worker writes a snapshot of
+its totals to ``METRICS['DIR']/<pid>.json`` at most every
+``FLUSH_INTERVAL`` seconds. ``GET /metrics`` merges the snapshots of all
+workers, so every gunicorn worker serves the same totals. This is the same
+layout as prometheus_client's multiprocess mode, without the dependency.
+
+Snapshots survive worker restarts: a new process whose pid matches an old
+snapshot adopts its totals, so the counters never go backwards. Snapshots
+of exited workers are kept (their requests still count) until
+``manage.py clear_metrics`` deletes them all; run it while the server is
+stopped, e.g. on deploy, so DIR does not fill up with one file per pid.
+A snapshot that cannot be read or has the wrong shape is ignored.
+"""
+
+# Relative Path: cupcp_backend/metrics.py
+
+import json
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.http import HttpResponse
+
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0)
+
+UNMATCHED_VIEW = '<unmatched>'
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _settings():
+    return {
+        'ENABLED': True,
+        'DIR': str(Path(settings.BASE_DIR) / 'var' / 'metrics'),
+        'FLUSH_INTERVAL': 1.0,
+        'TOKEN': '',
+        **getattr(settings, 'METRICS', {}),
+    }
+
+
+# -----------------------------------------------------------------------------
+# Database Query Accounting
+# -----------------------------------------------------------------------------
+# [query count, query seconds] of the request running in this context;
+# contextvars follow the request into sync_to_async threads
+_db_stats = ContextVar('metrics_db_stats', default=None)
+
+
+def _time_query(execute, sql, params, many, context):
+    stats = _db_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats[0] += 1
+        stats[1] += time.perf_counter() - start
+
+
+@receiver(connection_created)
+def install_query_timer(sender, connection, **kwargs):
+    """Adds the query timer to every database connection once."""
+    if _time_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_time_query)
+
+
+# -----------------------------------------------------------------------------
+# Registry
+# -----------------------------------------------------------------------------
+class Registry:
+    """
+    Totals of one process, flushed to its snapshot file.
+
+    `requests` maps (view, method, status) to a count; `views` maps a view
+    to [latency bucket counts..., latency sum, request count, query count,
+    query seconds].
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = {}
+        self.views = {}
+        self.pid = None
+        self.next_flush = 0.0
+
+    def record(self, view, method, status, seconds, queries, query_seconds):
+        with self.lock:
+            key = (view, method, status)
+            self.requests[key] = self.requests.get(key, 0) + 1
+            row = self.views.get(view)
+            if row is None:
+                row = self.views[view] = [0] * (len(LATENCY_BUCKETS) + 1) + [0.0, 0, 0, 0.0]
+            row[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            row[-4] += seconds
+            row[-3] += 1
+            row[-2] += queries
+            row[-1] += query_seconds
+        if time.monotonic() >= self.next_flush:
+            self.flush()
+
+    def flush(self):
+        """Writes this process's totals to its snapshot file."""
+        config = _settings()
+        directory = Path(config['DIR'])
+        with self.lock:
+            if self.pid != os.getpid():
+                # First flush in this process (or after a fork)
+                self.pid = os.getpid()
+                self._adopt(directory / f'{self.pid}.json')
+            payload = json.dumps({
+                'requests': [[*key, count] for key, count in self.requests.items()],
+                'views': self.views,
+            })
+            self.next_flush = time.monotonic() + config['FLUSH_INTERVAL']
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w') as handle:
+            handle.write(payload)
+        os.replace(tmp, directory / f'{self.pid}.json')
+
+    def _adopt(self, path):
+        """Adds the totals of a previous process with the same pid."""
+        snapshot = _read(path)
+        if snapshot is not None:
+            _merge(self.requests, self.views, snapshot)
+
+    def reset(self):
+        with self.lock:
+            self.requests.clear()
+            self.views.clear()
+            self.pid = None
+            self.next_flush = 0.0
+
+
+registry = Registry()
+
+
+def _read(path):
+    """Returns the snapshot at `path`, or None if it is missing or malformed."""
+    try:
+        with open(path) as handle:
+            snapshot = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    return snapshot if _valid(snapshot) else None
+
+
+def _valid(snapshot):
+    def number(value):
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+    if not isinstance(snapshot, dict):
+        return False
+    requests, views = snapshot.get('requests'), snapshot.get('views')
+    if not isinstance(requests, list) or not isinstance(views, dict):
+        return False
+    row_length = len(LATENCY_BUCKETS) + 5
+    return (
+        all(
+            isinstance(entry, list) and len(entry) == 4 and number(entry[3])
+            and all(isinstance(label, (str, int)) for label in entry[:3])
+            for entry in requests
+        )
+        and all(
+            isinstance(row, list) and len(row) == row_length and all(map(number, row))
+            for row in views.values()
+        )
+    )
+
+
+def _merge(requests, views, snapshot):
+    for *key, count in snapshot['requests']:
+        key = tuple(key)
+        requests[key] = requests.get(key, 0) + count
+    for view, row in snapshot['views'].items():
+        if view in views:
+            views[view] = [a + b for a, b in zip(views[view], row)]
+        else:
+            views[view] = list(row)
+
+
+def clear_snapshots():
+    """
+    Deletes every snapshot (and leftover temporary file) in DIR. Returns the
+    number of snapshots removed.
+    """
+    directory = Path(_settings()['DIR'])
+    for path in directory.glob('*.tmp'):
+        path.unlink(missing_ok=True)
+    removed = 0
+    for path in directory.glob('*.json'):
+        path.unlink(missing_ok=True)
+        removed += 1
+    registry.reset()
+    return removed
+
+
+def collect():
+    """Merges the snapshots of all worker processes."""
+    registry.flush()
+    requests, views = {}, {}
+    for path in Path(_settings()['DIR']).glob('*.json'):
+        snapshot = _read(path)
+        if snapshot is not None:
+            _merge(requests, views, snapshot)
+    return requests, views
+
+
+# -----------------------------------------------------------------------------
+# Exposition
+# -----------------------------------------------------------------------------
+def _labels(**labels):
+    def escape(value):
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return '{' + ','.join(f'{name}="{escape(value)}"' for name, value in labels.items()) + '}'
+
+
+def render(requests, views):
+    """Returns the merged totals in the Prometheus text format."""
+    lines = [
+        '# HELP http_requests_total Requests handled, by view, method and status.',
+        '# TYPE http_requests_total counter',
+    ]
+    for (view, method, status), count in sorted(requests.items()):
+        lines.append(f'http_requests_total{_labels(view=view, method=method, status=status)} {count}')
+
+    lines += [
+        '# HELP http_request_duration_seconds Request latency by view.',
+        '# TYPE http_request_duration_seconds histogram',
+    ]
+    for view, row in sorted(views.items()):
+        cumulative = 0
+        for bound, count in zip((*LATENCY_BUCKETS, '+Inf'), row):
+            cumulative += count
+            lines.append(
+                f'http_request_duration_seconds_bucket{_labels(view=view, le=bound)} {cumulative}'
+            )
+        lines.append(f'http_request_duration_seconds_sum{_labels(view=view)} {row[-4]}')
+        lines.append(f'http_request_duration_seconds_count{_labels(view=view)} {row[-3]}')
+
+    lines += [
+        '# HELP http_request_db_queries_total Database queries run by view.',
+        '# TYPE http_request_db_queries_total counter',
+    ]
+    lines += [
+        f'http_request_db_queries_total{_labels(view=view)} {row[-2]}'
+        for view, row in sorted(views.items())
+    ]
+    lines += [
+        '# HELP http_request_db_seconds_total Time spent in database queries by view.',
+        '# TYPE http_request_db_seconds_total counter',
+    ]
+    lines += [
+        f'http_request_db_seconds_total{_labels(view=view)} {row[-1]}'
+        for view, row in sorted(views.items())
+    ]
+    return '\n'.join(lines) + '\n'
+
+
+def metrics_view(request):
+    """
+    Serves the merged metrics, requiring METRICS['TOKEN'] as a bearer token.
+    Without a token the endpoint only exists with DEBUG on, so a deployment
+    never publishes its traffic by accident.
+    """
+    token = _settings()['TOKEN']
+    if not token:
+        if not settings.DEBUG:
+            return HttpResponse(status=404)
+    elif request.headers.get('Authorization') != f'Bearer {token}':
+        return HttpResponse(status=401)
+    return HttpResponse(render(*collect()), content_type=CONTENT_TYPE)
+
+
+# -----------------------------------------------------------------------------
+# Middleware
+# -----------------------------------------------------------------------------
+class MetricsMiddleware:
+    """
+    Records latency and database usage per resolved URL name. Works in both
+    the WSGI and the ASGI handler without thread hops.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = _settings()['ENABLED']
+        # Connections opened before the middleware was loaded missed the signal
+        for connection in connections.all(initialized_only=True):
+            install_query_timer(sender=None, connection=connection)
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not self.enabled:
+            return self.get_response(request)
+        stats = [0, 0.0]
+        token = _db_stats.set(stats)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _db_stats.reset(token)
+        self._record(request, response, time.perf_counter() - start, stats)
+        return response
+
+    async def __acall__(self, request):
+        if not self.enabled:
+            return await self.get_response(request)
+        stats = [0, 0.0]
+        token = _db_stats.set(stats)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _db_stats.reset(token)
+        self._record(request, response, time.perf_counter() - start, stats)
+        return response
+
+    def _record(self, request, response, seconds, stats):
+        match = getattr(request, 'resolver_match', None)
+        view = (match.view_name if match else None) or UNMATCHED_VIEW
+        if view == 'metrics':
+            return
+        registry.record(view, request.method, response.status_code, seconds, *stats)
@@ -0,0 +1,61 @@
+"""
+Per-endpoint database query budgets.
+
+QUERY_BUDGETS maps every named URL to the most queries one request of
+each method may issue with cold caches (no cached user, summary page or
+throttle history), plus how many more queries each additional row in the
+dataset may add. List endpoints must stay flat, so ``max_queries_per_row``
+is 0 unless an endpoint is documented to scale with its rows.
+
+Savepoint statements are not counted: they come from the test's wrapping
+transaction, not from the endpoint. The budgets are enforced by
+accounts/tests/test_query_budgets.py, which calls every route at two
+dataset sizes; a new named URL without a budget fails that test.
+"""
+
+# Relative Path: cupcp_backend/query_budgets.py
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class QueryBudget:
+    max_queries: int
+    max_queries_per_row: float = 0
+
+    def allows(self, queries, rows):
+        return queries <= self.max_queries + self.max_queries_per_row * rows
+
+
+# URL name -> HTTP method -> budget
+QUERY_BUDGETS = {
+    # cupcp_backend/urls.py
+    'home': {'GET': QueryBudget(0)},
+    'metrics': {'GET': QueryBudget(0)},
+
+    # accounts/urls.py
+    'student-register': {'POST': QueryBudget(1)},
+    'teacher-register': {'POST': QueryBudget(1)},
+    'student-login': {'POST': QueryBudget(2)},
+    'teacher-login': {'POST': QueryBudget(2)},
+    'token-logout': {'POST': QueryBudget(5)},
+    'user-profile': {'GET': QueryBudget(1), 'PUT': QueryBudget(3)},
+    'token_obtain_pair': {'POST': QueryBudget(2)},
+    'token_refresh': {'POST': QueryBudget(5)},
+
+    # student_manager/urls.py
+    'my-exam-registration': {'GET': QueryBudget(2), 'POST': QueryBudget(8)},
+    'exam-reg-summary': {'GET': QueryBudget(3)},
+    'exam-reg-export': {'GET': QueryBudget(2)},
+    'exam-reg-stats': {'GET': QueryBudget(2)},
+    'course-roster': {'GET': QueryBudget(2)},
+    'course-count': {'GET': QueryBudget(2)},
+}
+
+
+def queries_without_savepoints(captured):
+    """The captured SQL statements, minus SAVEPOINT bookkeeping."""
+    return [
+        query for query in captured
+        if not query['sql'].upper().startswith(('SAVEPOINT', 'RELEASE SAVEPOINT', 'ROLLBACK TO'))
+    ]
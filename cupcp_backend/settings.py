@@ -11,6 +11,7 @@ import dj_database_url
 from datetime import timedelta
 from pathlib import Path
 
+from corsheaders.defaults import default_headers
 from decouple import Csv, config
 
 
@@ -61,16 +62,24 @@ INSTALLED_APPS = [
 # Middleware
 # -----------------------------------------------------------------------------
 MIDDLEWARE = [
+    'cupcp_backend.health.HealthCheckMiddleware',  # /healthz and /readyz; must stay first
+    'cupcp_backend.metrics.MetricsMiddleware',  # Per-view latency and query metrics
     'corsheaders.middleware.CorsMiddleware',  # CORS support
     'django.middleware.security.SecurityMiddleware',  # Security enhancements
-    'django.contrib.sessions.middleware.SessionMiddleware',  # Session management
+    'cupcp_backend.idempotency.IdempotencyMiddleware',  # Replays retried writes
+    # Session, CSRF, auth and messages are skipped for API_PATH_PREFIXES
+    'cupcp_backend.browser_middleware.BrowserSessionMiddleware',  # Session management
     'django.middleware.common.CommonMiddleware',  # Common HTTP middleware
-    'django.middleware.csrf.CsrfViewMiddleware',  # CSRF protection
-    'django.contrib.auth.middleware.AuthenticationMiddleware',  # Auth support
-    'django.contrib.messages.middleware.MessageMiddleware',  # Flash messages
+    'cupcp_backend.browser_middleware.BrowserCsrfViewMiddleware',  # CSRF protection
+    'cupcp_backend.browser_middleware.BrowserAuthenticationMiddleware',  # Auth support
+    'cupcp_backend.browser_middleware.BrowserMessageMiddleware',  # Flash messages
     'django.middleware.clickjacking.XFrameOptionsMiddleware',  # Clickjacking prevention
 ]
 
+# JWT-only APIs: no sessions, CSRF checks, request.user or messages
+# (see cupcp_backend/browser_middleware.py). admin/ keeps the full stack.
+API_PATH_PREFIXES = ('/auth/', '/student-manager/')
+
 
 # -----------------------------------------------------------------------------
 # URL Configuration
@@ -122,6 +131,41 @@ DATABASES = {
 }
 
 
+# -----------------------------------------------------------------------------
+# Caches
+# -----------------------------------------------------------------------------
+# 'default' is local to each worker process. 'shared' is visible to every
+# worker and holds state that must agree across workers, such as throttle
+# counters, so it needs atomic increments: Redis outside DEBUG. With DEBUG
+# on it falls back to files in var/cache, which is for development only
+# (incr() is not atomic across processes and every set() lists the whole
+# directory). Tests run on local-memory caches (cupcp_backend/test_runner.py).
+FILE_CACHE = 'django.core.cache.backends.filebased.FileBasedCache'
+REDIS_CACHE = 'django.core.cache.backends.redis.RedisCache'
+SHARED_CACHE = {
+    'BACKEND': config('SHARED_CACHE_BACKEND', default=FILE_CACHE if DEBUG else REDIS_CACHE),
+}
+if SHARED_CACHE['BACKEND'] == FILE_CACHE:
+    SHARED_CACHE['LOCATION'] = config(
+        'SHARED_CACHE_LOCATION', default=str(BASE_DIR / 'var' / 'cache')
+    )
+    SHARED_CACHE['OPTIONS'] = {'MAX_ENTRIES': 50000}
+else:
+    SHARED_CACHE['LOCATION'] = config(
+        'SHARED_CACHE_LOCATION', default='redis://127.0.0.1:6379/1'
+    )
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'shared': SHARED_CACHE,
+}
+
+# Runs the test suite against local-memory caches
+TEST_RUNNER = 'cupcp_backend.test_runner.LocalCacheTestRunner'
+
+
 # -----------------------------------------------------------------------------
 # Authentication
 # -----------------------------------------------------------------------------
@@ -132,6 +176,20 @@ AUTH_USER_MODEL = 'accounts.User'
 ALLOWED_TEACHER_EMAILS = config('ALLOWED_TEACHER_EMAILS', cast=Csv())
 
 
+# -----------------------------------------------------------------------------
+# Password Hashing Pool
+# -----------------------------------------------------------------------------
+# Optionally verify login passwords on a bounded process pool so PBKDF2 does
+# not tie up request threads. When MAX_PENDING checks are in flight, further
+# logins get an immediate 503 instead of queueing.
+PASSWORD_HASH_POOL = {
+    'ENABLED': config('PASSWORD_HASH_POOL_ENABLED', default=False, cast=bool),
+    'WORKERS': config('PASSWORD_HASH_POOL_WORKERS', default=2, cast=int),
+    'MAX_PENDING': config('PASSWORD_HASH_POOL_MAX_PENDING', default=16, cast=int),
+    'TIMEOUT': config('PASSWORD_HASH_POOL_TIMEOUT', default=5.0, cast=float),  # seconds
+}
+
+
 # -----------------------------------------------------------------------------
 # Password Validation
 # -----------------------------------------------------------------------------
@@ -165,6 +223,9 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 # -----------------------------------------------------------------------------
 CORS_ALLOWED_ORIGINS = config('CORS_ALLOWED_ORIGINS', cast=Csv())
 CORS_ALLOW_CREDENTIALS = True
+# Browsers may send Idempotency-Key on retried writes
+CORS_ALLOW_HEADERS = (*default_headers, 'idempotency-key')
+CORS_EXPOSE_HEADERS = ['Idempotent-Replayed', 'ETag']
 
 
 # -----------------------------------------------------------------------------
@@ -172,8 +233,35 @@ CORS_ALLOW_CREDENTIALS = True
 # -----------------------------------------------------------------------------
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'accounts.authentication.CachedJWTAuthentication',
+    ),
+    # orjson-backed JSON when installed, DRF's json.dumps otherwise
+    # (see cupcp_backend/fastjson.py)
+    'DEFAULT_RENDERER_CLASSES': (
+        'cupcp_backend.fastjson.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
     ),
+    'DEFAULT_PARSER_CLASSES': (
+        'cupcp_backend.fastjson.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
+    # Reverse proxies in front of the app (1 behind nginx). Per-IP throttles
+    # take the client address this many hops from the end of
+    # X-Forwarded-For; with 0 they use REMOTE_ADDR and ignore the header.
+    'NUM_PROXIES': config('NUM_PROXIES', default=0, cast=int),
+    # Requests per window per throttle scope (see accounts/throttling.py).
+    # Per-IP limits are generous because campus traffic shares NAT addresses;
+    # "_identity" scopes limit attempts against a single account.
+    'DEFAULT_THROTTLE_RATES': {
+        'student_login': config('THROTTLE_STUDENT_LOGIN', default='60/min'),
+        'student_login_identity': config('THROTTLE_STUDENT_LOGIN_IDENTITY', default='5/min'),
+        'teacher_login': config('THROTTLE_TEACHER_LOGIN', default='30/min'),
+        'teacher_login_identity': config('THROTTLE_TEACHER_LOGIN_IDENTITY', default='5/min'),
+        'token_obtain': config('THROTTLE_TOKEN_OBTAIN', default='30/min'),
+        'token_obtain_identity': config('THROTTLE_TOKEN_OBTAIN_IDENTITY', default='5/min'),
+        'register': config('THROTTLE_REGISTER', default='300/hour'),
+    },
 }
 
 SIMPLE_JWT = {
@@ -181,6 +269,59 @@ SIMPLE_JWT = {
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
     'ROTATE_REFRESH_TOKENS': True,
     'BLACKLIST_AFTER_ROTATION': True,
+    # Checks the blacklist through accounts.blacklist before the database
+    'TOKEN_REFRESH_SERIALIZER': 'accounts.serializers.IndexedTokenRefreshSerializer',
+}
+
+# Caching used by accounts.authentication.CachedJWTAuthentication. Users are
+# evicted on save/delete; other workers notice within LOCAL_TTL seconds.
+JWT_USER_CACHE = {
+    'TOKEN_CACHE_SIZE': 4096,  # validated tokens kept per worker
+    'USER_CACHE_SIZE': 4096,  # users kept per worker
+    'LOCAL_TTL': config('JWT_USER_CACHE_LOCAL_TTL', default=5, cast=int),  # seconds
+    'SHARED_TTL': config('JWT_USER_CACHE_SHARED_TTL', default=300, cast=int),  # seconds
+}
+
+# Responses to writes sent with an Idempotency-Key header are replayed on
+# retry for TTL seconds (cupcp_backend/idempotency.py). Duplicates arriving
+# while the first is running wait up to WAIT seconds for its response.
+IDEMPOTENCY = {
+    'TTL': config('IDEMPOTENCY_TTL', default=86400, cast=int),  # seconds
+    'LOCK_TIMEOUT': 30,  # seconds a request may hold its key
+    'WAIT': 10,  # seconds a duplicate waits for the first response
+    'POLL_INTERVAL': 0.05,
+    # Never stored: these responses carry access/refresh tokens
+    'EXCLUDE': ('student-login', 'teacher-login', 'token_obtain_pair', 'token_refresh'),
+}
+
+# Surge mode: POST exam-registration/my/ queues validated submissions (202 +
+# ticket) for `manage.py drain_registration_queue` instead of inserting them.
+REGISTRATION_SURGE_MODE = config('REGISTRATION_SURGE_MODE', default=False, cast=bool)
+
+# Rendered teacher summary pages, kept in the shared cache until a
+# registration write invalidates them or TTL (seconds) runs out.
+SUMMARY_CACHE = {
+    'TTL': config('SUMMARY_CACHE_TTL', default=300, cast=int),
+}
+
+# Per-view request metrics served at /metrics (cupcp_backend/metrics.py).
+# Each worker writes its totals to DIR at most every FLUSH_INTERVAL seconds;
+# a scrape merges all workers. Scrapes must send "Authorization: Bearer
+# <TOKEN>"; with no TOKEN, /metrics answers 404 unless DEBUG is on.
+# `manage.py clear_metrics` deletes the snapshots of exited workers.
+METRICS = {
+    'ENABLED': config('METRICS_ENABLED', default=True, cast=bool),
+    'DIR': config('METRICS_DIR', default=str(BASE_DIR / 'var' / 'metrics')),
+    'FLUSH_INTERVAL': 1.0,  # seconds
+    'TOKEN': config('METRICS_TOKEN', default=''),
+}
+
+# Expired refresh tokens are deleted by `manage.py prune_tokens`, or by a
+# background thread in each worker when INTERVAL (seconds) is above zero.
+TOKEN_PRUNING = {
+    'INTERVAL': config('TOKEN_PRUNING_INTERVAL', default=0, cast=int),
+    'BATCH_SIZE': 1000,  # tokens deleted per transaction
+    'PAUSE': 0.05,  # seconds between batches
 }
 
 
@@ -0,0 +1,50 @@
+"""
+Test runner that swaps every configured cache for a local-memory cache.
+
+Tests clear the shared cache freely; against the configured backend that
+would wipe a running dev server's var/cache (or a real Redis database),
+and parallel test processes would clear each other's entries. Each test
+process gets its own caches instead, and metrics snapshots go to a
+temporary directory rather than METRICS['DIR'].
+"""
+
+# Relative Path: cupcp_backend/test_runner.py
+
+import shutil
+import tempfile
+
+from django.conf import settings
+from django.test import override_settings
+from django.test.runner import DiscoverRunner
+
+
+def local_caches():
+    """override_settings() replacing every entry in CACHES with a LocMemCache."""
+    return override_settings(CACHES={
+        alias: {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': f'test-{alias}',
+            'OPTIONS': {'MAX_ENTRIES': 50000},
+        }
+        for alias in settings.CACHES
+    })
+
+
+class LocalCacheTestRunner(DiscoverRunner):
+    """DiscoverRunner with LocMemCache in place of every entry in CACHES."""
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._metrics_dir = tempfile.mkdtemp(prefix='metrics-')
+        self._overrides = [
+            local_caches(),
+            override_settings(METRICS={**settings.METRICS, 'DIR': self._metrics_dir}),
+        ]
+        for override in self._overrides:
+            override.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        for override in reversed(self._overrides):
+            override.disable()
+        shutil.rmtree(self._metrics_dir, ignore_errors=True)
+        super().teardown_test_environment(**kwargs)
@@ -11,13 +11,16 @@ from django.contrib import admin
 from django.urls import path, include
 from django.http import HttpResponse
 
+from cupcp_backend.metrics import metrics_view
+
+
 # -----------------------------------------------------------------------------
 # Health Check View
 # -----------------------------------------------------------------------------
 def home(request):  # Simple endpoint to verify server is running
     """
     Returns a basic HTML response indicating the server status.
-    Useful for quick health checks and debugging.
+    Useful for debugging; probes should use /healthz and /readyz (health.py).
     """
     return HttpResponse("<h1>Congrats, Your server is Running</h1>")
 
@@ -36,4 +39,7 @@ urlpatterns = [
 
     # Student Manager Endpoints: Exam registration and student operations
     path('student-manager/', include('student_manager.urls')),
+
+    # Prometheus scrape target: per-view request metrics
+    path('metrics', metrics_view, name='metrics'),
 ]
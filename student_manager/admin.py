@@ -1,14 +1,15 @@
 """
 Admin configuration for the student_manager app.
 
-Registers ExamRegistration model with the Django admin.
+Registers the ExamRegistration and RegistrationSubmission models with the
+Django admin.
 """
 
 # Relative Path: student_manager/admin.py
 
 from django.contrib import admin
 
-from .models import ExamRegistration
+from .models import ExamRegistration, RegistrationSubmission
 
 
 @admin.register(ExamRegistration)
@@ -42,3 +43,14 @@ class ExamRegistrationAdmin(admin.ModelAdmin):
 
     # Readonly fields for fields managed automatically
     readonly_fields = ('created_at',)
+
+
+@admin.register(RegistrationSubmission)
+class RegistrationSubmissionAdmin(admin.ModelAdmin):
+    """
+    ModelAdmin for queued registration submissions (surge mode).
+    """
+    list_display = ('ticket', 'user', 'status', 'created_at', 'processed_at')
+    list_filter = ('status',)
+    search_fields = ('ticket', 'user__email')
+    readonly_fields = ('ticket', 'created_at', 'processed_at', 'registration')
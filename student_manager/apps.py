@@ -16,4 +16,8 @@ class StudentManagerConfig(AppConfig):
     Sets default primary key type and identifies the app's module path.
     """
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'student_manager'
\ No newline at end of file
+    name = 'student_manager'
+
+    def ready(self):
+        # Register signal handlers
+        from . import signals  # noqa: F401
\ No newline at end of file
@@ -0,0 +1,135 @@
+"""
+Async version of MyExamRegistration, served by the ASGI deployment
+(see cupcp_backend/asgi_urls.py).
+
+Reads use the async ORM. Validation (payment_slip is unique) and saving
+run together in one sync_to_async call: ExamRegistration.save() updates the
+counters and course index in a transaction, which the async ORM cannot
+open.
+"""
+
+# Relative Path: student_manager/async_views.py
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from rest_framework import status
+
+from cupcp_backend.asyncapi import AsyncAPIView
+from cupcp_backend.conditional import not_modified, wants_revalidation, with_etag
+
+from .models import ExamRegistration, RegistrationSubmission
+from .serializers import ExamRegistrationSerializer
+from .submission_queue import AlreadyQueued, enqueue_submission, submission_status
+from .views import registration_etag
+
+
+def _validate_and_save(serializer, **kwargs):
+    """Returns True and saves when valid; the caller renders the errors otherwise."""
+    if not serializer.is_valid():
+        return False
+    serializer.save(**kwargs)
+    return True
+
+
+class AsyncMyExamRegistration(AsyncAPIView):
+    """
+    Same contract as views.MyExamRegistration:
+    - GET: View their current exam registration (if exists)
+    - POST: Submit a new exam registration (once only)
+    - PUT: Update their existing registration
+    """
+
+    async def get(self, request):
+        if wants_revalidation(request):
+            row = await (
+                ExamRegistration.objects.filter(user=request.user)
+                .values("id", "updated_at").afirst()
+            )
+            if row is not None:
+                response = not_modified(
+                    request,
+                    registration_etag(request.user, "registration", row["id"], row["updated_at"])
+                )
+                if response is not None:
+                    return response
+
+        user_data = {
+            "full_name": request.user.full_name,
+            "varsity_id": request.user.varsity_id,
+            "session": request.user.session,
+            "phone_number": request.user.phone_number,
+        }
+
+        try:
+            reg = await ExamRegistration.objects.aget(user=request.user)
+        except ExamRegistration.DoesNotExist:
+            data = {
+                "registered": False,
+                "user": user_data,
+            }
+            submission = await (
+                RegistrationSubmission.objects.filter(user=request.user)
+                .order_by("-id").afirst()
+            )
+            if submission is None:
+                etag = registration_etag(request.user)
+            else:
+                data["submission"] = submission_status(submission)
+                etag = registration_etag(
+                    request.user, "submission", submission.id, submission.status
+                )
+            return not_modified(request, etag) or with_etag(self.respond(data), etag)
+        return with_etag(
+            self.respond({
+                "registered": True,
+                "registration": ExamRegistrationSerializer(reg).data,
+                "user": user_data,
+            }),
+            registration_etag(request.user, "registration", reg.id, reg.updated_at)
+        )
+
+    async def post(self, request):
+        if await ExamRegistration.objects.filter(user=request.user).aexists():
+            return self.respond(
+                {"detail": "You have already registered."},
+                status.HTTP_400_BAD_REQUEST
+            )
+
+        serializer = ExamRegistrationSerializer(data=request.data)
+        if not settings.REGISTRATION_SURGE_MODE:
+            if await sync_to_async(_validate_and_save)(serializer, user=request.user):
+                return self.respond(
+                    {"registered": True, "registration": serializer.data},
+                    status.HTTP_201_CREATED
+                )
+            return self.respond(serializer.errors, status.HTTP_400_BAD_REQUEST)
+
+        if not await sync_to_async(serializer.is_valid)():
+            return self.respond(serializer.errors, status.HTTP_400_BAD_REQUEST)
+        try:
+            submission = await sync_to_async(enqueue_submission)(
+                request.user, serializer.validated_data
+            )
+        except AlreadyQueued:
+            return self.respond(
+                {"detail": "Your registration is already queued."},
+                status.HTTP_400_BAD_REQUEST
+            )
+        return self.respond(
+            {"registered": False, "submission": submission_status(submission)},
+            status.HTTP_202_ACCEPTED
+        )
+
+    async def put(self, request):
+        try:
+            reg = await ExamRegistration.objects.aget(user=request.user)
+        except ExamRegistration.DoesNotExist:
+            return self.respond(
+                {"detail": "No registration found to update."},
+                status.HTTP_404_NOT_FOUND
+            )
+
+        serializer = ExamRegistrationSerializer(reg, data=request.data, partial=True)
+        if await sync_to_async(_validate_and_save)(serializer):
+            return self.respond({"registered": True, "registration": serializer.data})
+        return self.respond(serializer.errors, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,91 @@
+"""
+Streaming exports of exam registrations.
+
+Rows are read with a chunked queryset iterator and encoded one at a time,
+so memory stays flat no matter how many registrations are exported.
+"""
+
+# Relative Path: student_manager/exports.py
+
+import csv
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+# Column order of every export, mirroring ExamRegistrationSerializer
+EXPORT_COLUMNS = (
+    ("id", "id"),
+    ("user", "user_id"),
+    ("full_name", "full_name"),
+    ("varsity_id", "varsity_id"),
+    ("session", "session"),
+    ("phone_number", "phone_number"),
+    ("payment_status", "payment_status"),
+    ("payment_slip", "payment_slip"),
+    ("student_status", "student_status"),
+    ("courses", "courses"),
+    ("hall_name", "hall_name"),
+    ("created_at", "created_at"),
+    ("updated_at", "updated_at"),
+)
+
+EXPORT_CHUNK_SIZE = 2000
+
+
+class _Echo:
+    """
+    File-like object whose write() hands the encoded line straight back,
+    letting csv.writer produce one chunk per row.
+    """
+
+    def write(self, value):
+        return value
+
+
+def iter_export_rows(queryset):
+    """
+    Yields registration rows as tuples in EXPORT_COLUMNS order.
+    """
+    fields = [field for _, field in EXPORT_COLUMNS]
+    return queryset.order_by("id").values_list(*fields).iterator(
+        chunk_size=EXPORT_CHUNK_SIZE
+    )
+
+
+def _csv_value(value):
+    """
+    Flattens a value for a CSV cell: course lists are comma-joined and
+    timestamps are written in ISO 8601.
+    """
+    if isinstance(value, list):
+        return ", ".join(str(item) for item in value)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def stream_csv(queryset):
+    """
+    Yields CSV lines; the header is sent before the query starts running.
+    """
+    writer = csv.writer(_Echo())
+    yield writer.writerow([name for name, _ in EXPORT_COLUMNS])
+    for row in iter_export_rows(queryset):
+        yield writer.writerow([_csv_value(value) for value in row])
+
+
+def stream_jsonl(queryset):
+    """
+    Yields one JSON object per line (JSON Lines).
+    """
+    names = [name for name, _ in EXPORT_COLUMNS]
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    for row in iter_export_rows(queryset):
+        yield encoder.encode(dict(zip(names, row))) + "\n"
+
+
+# Supported export formats: name -> (stream function, content type)
+EXPORT_FORMATS = {
+    "csv": (stream_csv, "text/csv; charset=utf-8"),
+    "jsonl": (stream_jsonl, "application/x-ndjson; charset=utf-8"),
+}
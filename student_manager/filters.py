@@ -0,0 +1,28 @@
+"""
+Query-string filters shared by the exam registration list endpoints.
+"""
+
+# Relative Path: student_manager/filters.py
+
+
+# Query parameters accepted by the summary and export endpoints,
+# mapped to the ExamRegistration field each one filters on.
+REGISTRATION_FILTERS = {
+    "hall": "hall_name",
+    "session": "session",
+    "payment_status": "payment_status",
+    "student_status": "student_status",
+}
+
+
+def filter_registrations(queryset, params):
+    """
+    Narrows an ExamRegistration queryset by the filters present in `params`.
+    Empty values are ignored so `?hall=` behaves like no filter at all.
+    """
+    lookups = {
+        field: params[param]
+        for param, field in REGISTRATION_FILTERS.items()
+        if params.get(param)
+    }
+    return queryset.filter(**lookups)
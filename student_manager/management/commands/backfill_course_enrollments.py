@@ -0,0 +1,61 @@
+"""
+Management command to (re)build the CourseEnrollment index from
+ExamRegistration.courses in batches.
+
+Usage:
+    python manage.py backfill_course_enrollments --batch-size 1000
+"""
+
+# Relative Path: student_manager/management/commands/backfill_course_enrollments.py
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from student_manager.models import CourseEnrollment, ExamRegistration, normalize_course_codes
+
+
+class Command(BaseCommand):
+    help = "Backfills the CourseEnrollment index from existing exam registrations."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of registrations processed per transaction (default: 1000).',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        last_id = 0
+        registrations = enrollments = 0
+
+        while True:
+            batch = list(
+                ExamRegistration.objects.filter(id__gt=last_id)
+                .order_by('id')
+                .values_list('id', 'courses')[:batch_size]
+            )
+            if not batch:
+                break
+            last_id = batch[-1][0]
+
+            rows = [
+                CourseEnrollment(registration_id=registration_id, course_code=code)
+                for registration_id, courses in batch
+                for code in normalize_course_codes(courses)
+            ]
+            with transaction.atomic():
+                CourseEnrollment.objects.filter(
+                    registration_id__in=[registration_id for registration_id, _ in batch]
+                ).delete()
+                CourseEnrollment.objects.bulk_create(rows, batch_size=batch_size)
+
+            registrations += len(batch)
+            enrollments += len(rows)
+            self.stdout.write(f'Processed {registrations} registration(s)...')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Indexed {enrollments} course enrollment(s) '
+            f'across {registrations} registration(s).'
+        ))
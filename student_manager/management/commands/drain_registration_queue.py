@@ -0,0 +1,69 @@
+"""
+Management command to turn queued registration submissions (surge mode)
+into exam registrations in batches.
+
+Usage:
+    python manage.py drain_registration_queue --batch-size 500
+    python manage.py drain_registration_queue --loop --interval 1
+"""
+
+# Relative Path: student_manager/management/commands/drain_registration_queue.py
+
+import logging
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, close_old_connections
+
+from student_manager.submission_queue import drain_submissions
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Writes pending registration submissions as exam registrations."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of submissions processed per transaction (default: 500).',
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep polling the queue instead of exiting once it is empty.',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=1.0,
+            help='Seconds to wait between polls with --loop (default: 1).',
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be at least 1.')
+
+        while True:
+            started = time.monotonic()
+            try:
+                result = drain_submissions(batch_size=options['batch_size'])
+            except DatabaseError:
+                if not options['loop']:
+                    raise
+                # The failed batch was rolled back and stays pending; retry next poll
+                logger.exception('Draining the registration queue failed')
+                result = None
+            if result is not None and (result.batches or not options['loop']):
+                self.stdout.write(self.style.SUCCESS(
+                    f'Accepted {result.accepted} and rejected {result.rejected} '
+                    f'submission(s) in {result.batches} batch(es), '
+                    f'{time.monotonic() - started:.2f}s.'
+                ))
+            if not options['loop']:
+                return
+            close_old_connections()
+            time.sleep(options['interval'])
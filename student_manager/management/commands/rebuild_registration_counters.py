@@ -0,0 +1,43 @@
+"""
+Management command to rebuild or verify the registration counters.
+
+Usage:
+    python manage.py rebuild_registration_counters          # rebuild from scratch
+    python manage.py rebuild_registration_counters --check  # report drift only
+"""
+
+# Relative Path: student_manager/management/commands/rebuild_registration_counters.py
+
+from django.core.management.base import BaseCommand, CommandError
+
+from student_manager.models import COUNTER_FIELDS, RegistrationCounter
+
+
+class Command(BaseCommand):
+    help = "Rebuilds RegistrationCounter rows from ExamRegistration, or checks them for drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Only compare stored counters with a fresh recount; exit non-zero on drift.',
+        )
+
+    def handle(self, *args, **options):
+        if options['check']:
+            drift = RegistrationCounter.objects.drift()
+            if not drift:
+                self.stdout.write(self.style.SUCCESS('Registration counters are consistent.'))
+                return
+            for key, (stored, expected) in sorted(drift.items()):
+                bucket = ', '.join(
+                    f'{field}={value!r}' for field, value in zip(COUNTER_FIELDS, key)
+                )
+                self.stdout.write(f'{bucket}: stored={stored} expected={expected}')
+            raise CommandError(f'{len(drift)} counter bucket(s) drifted.')
+
+        expected = RegistrationCounter.objects.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt {len(expected)} counter bucket(s) '
+            f'covering {sum(expected.values())} registration(s).'
+        ))
@@ -0,0 +1,63 @@
+"""
+Management command to copy current user data onto exam registration
+snapshots in chunked UPDATEs, e.g. after users were edited in bulk.
+
+Usage:
+    python manage.py resync_registration_snapshots --session 2024-25
+    python manage.py resync_registration_snapshots --batch-size 500
+"""
+
+# Relative Path: student_manager/management/commands/resync_registration_snapshots.py
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Q
+
+from student_manager.models import ExamRegistration
+
+
+class Command(BaseCommand):
+    help = "Refreshes exam registration snapshots (name, ID, session, phone) from their users."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--session',
+            help='Only registrations stored under, or whose user is now in, this session.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of users whose registrations are updated per UPDATE (default: 1000).',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError('--batch-size must be at least 1.')
+
+        registrations = ExamRegistration.objects.all()
+        if options['session']:
+            registrations = registrations.filter(
+                Q(session=options['session']) | Q(user__session=options['session'])
+            )
+
+        last_user_id = 0
+        users = updated = 0
+        while True:
+            user_ids = list(
+                registrations.filter(user_id__gt=last_user_id)
+                .order_by('user_id')
+                .values_list('user_id', flat=True)
+                .distinct()[:batch_size]
+            )
+            if not user_ids:
+                break
+            last_user_id = user_ids[-1]
+
+            updated += ExamRegistration.objects.sync_snapshots(user_ids)
+            users += len(user_ids)
+            self.stdout.write(f'Checked {users} user(s)...')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Updated {updated} registration snapshot(s) across {users} user(s).'
+        ))
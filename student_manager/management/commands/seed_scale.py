@@ -0,0 +1,95 @@
+"""
+Management command to generate a deterministic synthetic dataset of
+students and exam registrations for local scale testing.
+
+Usage:
+    python manage.py seed_scale --users 100000 --registrations 80000
+    python manage.py seed_scale --users 10000 --registrations 10000 --seed 7 --offset 100000
+"""
+
+# Relative Path: student_manager/management/commands/seed_scale.py
+
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+
+from student_manager.seeding import build_student, seed_dataset
+
+
+class Command(BaseCommand):
+    help = "Seeds N synthetic students and M exam registrations with bulk inserts."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, required=True, help='Students to create.')
+        parser.add_argument(
+            '--registrations',
+            type=int,
+            default=0,
+            help='How many of those students also get an exam registration (default: 0).',
+        )
+        parser.add_argument(
+            '--seed', type=int, default=0, help='Random seed; the same seed gives the same data.'
+        )
+        parser.add_argument(
+            '--offset',
+            type=int,
+            default=0,
+            help='Number of the first student, to extend an earlier seeded dataset (default: 0).',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=10000,
+            help='Students inserted per transaction (default: 10000).',
+        )
+        parser.add_argument(
+            '--password',
+            default='seed1234',
+            help='Password of every seeded student (hashed once).',
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be at least 1.')
+        if options['users'] < 1:
+            raise CommandError('--users must be at least 1.')
+        # Varsity IDs depend only on the student number, not on --seed
+        first = build_student(options['offset'], options['seed'], password_hash='')
+        if get_user_model().objects.filter(varsity_id=first.varsity_id).exists():
+            raise CommandError(
+                f'Varsity ID {first.varsity_id} already exists; seed into an empty '
+                f'database or pass --offset.'
+            )
+
+        started = time.monotonic()
+
+        def progress(result):
+            self.stdout.write(
+                f'{result.users} student(s), {result.registrations} registration(s)...'
+            )
+
+        try:
+            result = seed_dataset(
+                users=options['users'],
+                registrations=options['registrations'],
+                seed=options['seed'],
+                offset=options['offset'],
+                batch_size=options['batch_size'],
+                password=options['password'],
+                progress=progress,
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc))
+        except IntegrityError as exc:
+            # A later student number collided with an earlier dataset
+            raise CommandError(
+                f'Seeding stopped on an existing row ({exc}); batches written before '
+                f'it were kept. Pass an --offset past the existing students.'
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Seeded {result.users} student(s) and {result.registrations} '
+            f'registration(s) in {time.monotonic() - started:.2f}s.'
+        ))
@@ -0,0 +1,70 @@
+# Generated by Django 5.2 on 2026-10-17 02:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("student_manager", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="examregistration",
+            name="courses",
+            field=models.JSONField(help_text="List of course codes registered"),
+        ),
+        migrations.AlterField(
+            model_name="examregistration",
+            name="hall_name",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("Alaol Hall", "Alaol Hall"),
+                    ("A. F. Rahman Hall", "A. F. Rahman Hall"),
+                    ("Shahjalal Hall", "Shahjalal Hall"),
+                    ("Suhrawardy Hall", "Suhrawardy Hall"),
+                    ("Shah Amanat Hall", "Shah Amanat Hall"),
+                    ("Shamsun Nahar Hall", "Shamsun Nahar Hall"),
+                    ("Shaheed Abdur Rab Hall", "Shaheed Abdur Rab Hall"),
+                    ("Pritilata Hall", "Pritilata Hall"),
+                    (
+                        "Deshnetri Begum Khaleda Zia Hall",
+                        "Deshnetri Begum Khaleda Zia Hall",
+                    ),
+                    ("Masterda Surja Sen Hall", "Masterda Surja Sen Hall"),
+                    ("Shaheed Farhad Hossain Hall", "Shaheed Farhad Hossain Hall"),
+                    ("Bijoy 24 Hall", "Bijoy 24 Hall"),
+                    ("Nawab Faizunnesa Hall", "Nawab Faizunnesa Hall"),
+                    ("Atish Dipankar Hall", "Atish Dipankar Hall"),
+                    (
+                        "Shilpi Rashid Chowdhury Hostel",
+                        "Shilpi Rashid Chowdhury Hostel",
+                    ),
+                ],
+                help_text="Select the residential hall",
+                max_length=100,
+                null=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="examregistration",
+            name="payment_slip",
+            field=models.CharField(
+                blank=True,
+                help_text="Unique identifier for the payment slip",
+                max_length=255,
+                null=True,
+                unique=True,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="examregistration",
+            index=models.Index(
+                fields=["created_at", "id"], name="examreg_created_id_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.2 on 2026-10-17 02:49
+
+from django.db import migrations, models
+from django.db.models import Count
+
+COUNTER_FIELDS = ("hall_name", "session", "payment_status", "student_status")
+
+
+def populate_counters(apps, schema_editor):
+    """Seed the counters from the registrations that already exist."""
+    ExamRegistration = apps.get_model("student_manager", "ExamRegistration")
+    RegistrationCounter = apps.get_model("student_manager", "RegistrationCounter")
+    db = schema_editor.connection.alias
+
+    totals = {}
+    rows = (
+        ExamRegistration.objects.using(db)
+        .order_by()
+        .values(*COUNTER_FIELDS)
+        .annotate(total=Count("id"))
+    )
+    for row in rows:
+        key = tuple(row[field] or "" for field in COUNTER_FIELDS)
+        totals[key] = totals.get(key, 0) + row["total"]
+
+    RegistrationCounter.objects.using(db).bulk_create(
+        RegistrationCounter(count=total, **dict(zip(COUNTER_FIELDS, key)))
+        for key, total in totals.items()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("student_manager", "0002_examregistration_keyset_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RegistrationCounter",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("hall_name", models.CharField(blank=True, default="", max_length=100)),
+                ("session", models.CharField(blank=True, default="", max_length=7)),
+                ("payment_status", models.CharField(max_length=3)),
+                ("student_status", models.CharField(max_length=12)),
+                ("count", models.IntegerField(default=0)),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=(
+                            "hall_name",
+                            "session",
+                            "payment_status",
+                            "student_status",
+                        ),
+                        name="unique_registration_counter",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
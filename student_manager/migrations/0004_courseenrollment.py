@@ -0,0 +1,52 @@
+# Generated by Django 5.2 on 2026-10-17 02:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("student_manager", "0003_registrationcounter"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CourseEnrollment",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("course_code", models.CharField(max_length=32)),
+                (
+                    "registration",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="course_enrollments",
+                        to="student_manager.examregistration",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["course_code", "registration"],
+                        name="course_enrollment_code_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("registration", "course_code"),
+                        name="unique_course_enrollment",
+                    )
+                ],
+            },
+        ),
+    ]
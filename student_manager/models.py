@@ -2,13 +2,20 @@
 Models for the student_manager app in cupcp_backend.
 
 Defines the ExamRegistration model capturing exam details
-and student snapshots for integrity over time.
+and student snapshots for integrity over time, plus incrementally
+maintained registration counters, the course enrollment index and the
+queue of registration submissions accepted during surge mode.
 """
 
 # Relative Path: student_manager/models.py
 
+import uuid
+from collections import Counter
+
 from django.conf import settings
-from django.db import models
+from django.db import models, router, transaction
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.utils import timezone
 
 
 # -----------------------------------------------------------------------------
@@ -42,9 +49,238 @@ STUDENT_STATUS_CHOICES = (
 )
 
 
+# Fields of ExamRegistration that make up a RegistrationCounter bucket
+COUNTER_FIELDS = ('hall_name', 'session', 'payment_status', 'student_status')
+
+# Fields whose loaded values ExamRegistration.save() compares against
+TRACKED_FIELDS = COUNTER_FIELDS + ('courses',)
+
+# User fields copied onto each of the user's registrations
+SNAPSHOT_FIELDS = ('full_name', 'varsity_id', 'session', 'phone_number')
+
+COURSE_CODE_MAX_LENGTH = 32
+
+
+def normalize_course_codes(courses):
+    """
+    Returns the set of normalized course codes in a `courses` JSON value.
+    Codes are stripped and upper-cased; blanks, non-list values and codes
+    longer than COURSE_CODE_MAX_LENGTH are ignored.
+    """
+    if not isinstance(courses, list):
+        return set()
+    codes = set()
+    for course in courses:
+        code = str(course).strip().upper()
+        if code and len(code) <= COURSE_CODE_MAX_LENGTH:
+            codes.add(code)
+    return codes
+
+
+# -----------------------------------------------------------------------------
+# RegistrationCounter Model
+# -----------------------------------------------------------------------------
+class RegistrationCounterManager(models.Manager):
+    """
+    Manager for RegistrationCounter, applying deltas and rebuilding buckets.
+    """
+
+    def adjust(self, key, delta, using=None):
+        """
+        Atomically adds `delta` to the bucket identified by `key`,
+        creating the bucket on first use.
+        """
+        queryset = self.db_manager(using).filter(**key)
+        if queryset.update(count=F('count') + delta):
+            return
+        _, created = self.db_manager(using).get_or_create(
+            **key, defaults={'count': delta}
+        )
+        if not created:
+            queryset.update(count=F('count') + delta)
+
+    def expected(self, using=None):
+        """
+        Recounts every bucket from ExamRegistration with a single GROUP BY.
+        """
+        rows = (
+            ExamRegistration.objects.using(using or self.db)
+            .order_by()
+            .values(*COUNTER_FIELDS)
+            .annotate(total=Count('id'))
+        )
+        expected = Counter()
+        for row in rows:
+            expected[counter_key(row)] += row['total']
+        return expected
+
+    def drift(self, using=None):
+        """
+        Returns {bucket: (stored, expected)} for every bucket that disagrees
+        with a fresh recount.
+        """
+        expected = self.expected(using=using)
+        stored = {
+            tuple(row[field] for field in COUNTER_FIELDS): row['count']
+            for row in self.db_manager(using).values(*COUNTER_FIELDS, 'count')
+        }
+        drift = {}
+        for key in set(expected) | set(stored):
+            if stored.get(key, 0) != expected.get(key, 0):
+                drift[key] = (stored.get(key, 0), expected.get(key, 0))
+        return drift
+
+    def rebuild(self, using=None):
+        """
+        Replaces all buckets with a fresh recount inside one transaction.
+        """
+        using = using or self.db
+        with transaction.atomic(using=using):
+            expected = self.expected(using=using)
+            self.db_manager(using).all().delete()
+            self.db_manager(using).bulk_create(
+                self.model(count=total, **dict(zip(COUNTER_FIELDS, key)))
+                for key, total in expected.items()
+            )
+        return expected
+
+
+def counter_key(values):
+    """
+    Builds the bucket key from a registration or a dict of its values.
+    Missing halls and sessions are stored as empty strings so the unique
+    constraint holds on every database.
+    """
+    if isinstance(values, dict):
+        get = values.get
+    else:
+        def get(field):
+            return getattr(values, field)
+    return tuple(get(field) or '' for field in COUNTER_FIELDS)
+
+
+class RegistrationCounter(models.Model):
+    """
+    Number of exam registrations per (hall, session, payment status,
+    student status), kept in step with ExamRegistration writes so the
+    dashboard can read totals without scanning registrations.
+    """
+    hall_name = models.CharField(max_length=100, blank=True, default='')
+    session = models.CharField(max_length=7, blank=True, default='')
+    payment_status = models.CharField(max_length=3)
+    student_status = models.CharField(max_length=12)
+    count = models.IntegerField(default=0)
+
+    objects = RegistrationCounterManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=COUNTER_FIELDS, name='unique_registration_counter'),
+        ]
+
+    def __str__(self):
+        return f"{self.hall_name or '-'} / {self.session or '-'}: {self.count}"
+
+
 # -----------------------------------------------------------------------------
 # ExamRegistration Model
 # -----------------------------------------------------------------------------
+class ExamRegistrationManager(models.Manager):
+    """
+    Manager for ExamRegistration with a bulk insert that keeps the derived
+    data save() would maintain.
+    """
+
+    def bulk_register(self, registrations, using=None):
+        """
+        Inserts new registrations (with their users loaded) in bulk, then
+        updates the counters and course enrollments once for the whole set.
+        Returns the saved registrations with primary keys set.
+        """
+        using = using or self.db
+        for registration in registrations:
+            registration.refresh_user_snapshot()
+        with transaction.atomic(using=using):
+            created = self.db_manager(using).bulk_create(registrations)
+            for key, delta in Counter(counter_key(r) for r in created).items():
+                RegistrationCounter.objects.adjust(
+                    dict(zip(COUNTER_FIELDS, key)), delta, using=using
+                )
+            CourseEnrollment.objects.using(using).bulk_create(
+                [
+                    CourseEnrollment(registration=registration, course_code=code)
+                    for registration in created
+                    for code in normalize_course_codes(registration.courses)
+                ],
+                ignore_conflicts=True,
+            )
+        # Local import: summary_cache is imported by signals, which import models
+        from .summary_cache import invalidate_summaries
+        invalidate_summaries(using=using)
+        for registration in created:
+            registration._loaded_values = {
+                field: getattr(registration, field) for field in TRACKED_FIELDS
+            }
+        return created
+
+    def sync_snapshots(self, user_ids, sessions_changed=True, using=None):
+        """
+        Copies the snapshot fields from each user in `user_ids` onto all of
+        their stale registrations with a single UPDATE, moving the counters
+        of rows whose session changes. Pass sessions_changed=False when no
+        session can differ, to skip the counter query.
+        Returns the number of registrations updated.
+        """
+        using = using or self.db
+        stale = self.db_manager(using).filter(user_id__in=user_ids).exclude(
+            _snapshot_matches_user(*SNAPSHOT_FIELDS)
+        )
+        user = self.model._meta.get_field('user').related_model.objects.using(using)
+        values = {
+            field: Subquery(user.filter(pk=OuterRef('user_id')).values(field)[:1])
+            for field in SNAPSHOT_FIELDS
+        }
+        if not sessions_changed:
+            updated = stale.update(updated_at=timezone.now(), **values)
+        else:
+            with transaction.atomic(using=using):
+                rows = (
+                    stale.exclude(_snapshot_matches_user('session'))
+                    .order_by()
+                    .values(*COUNTER_FIELDS, 'user__session')
+                    .annotate(total=Count('id'))
+                )
+                moved = Counter()
+                for row in rows:
+                    moved[counter_key(row)] -= row['total']
+                    moved[counter_key({**row, 'session': row['user__session']})] += row['total']
+                updated = stale.update(updated_at=timezone.now(), **values)
+                for key, delta in moved.items():
+                    if delta:
+                        RegistrationCounter.objects.adjust(
+                            dict(zip(COUNTER_FIELDS, key)), delta, using=using
+                        )
+        if updated:
+            # Local import: summary_cache is imported by signals, which import models
+            from .summary_cache import invalidate_summaries
+            invalidate_summaries(using=using)
+        return updated
+
+
+def _snapshot_matches_user(*fields):
+    """
+    Q matching registrations whose `fields` equal the user's, treating two
+    NULLs as equal.
+    """
+    condition = Q()
+    for field in fields:
+        condition &= (
+            Q(**{field: F(f'user__{field}')})
+            | Q(**{f'{field}__isnull': True, f'user__{field}__isnull': True})
+        )
+    return condition
+
+
 class ExamRegistration(models.Model):
     """
     Stores exam registration details for a student, capturing a snapshot
@@ -85,17 +321,181 @@ class ExamRegistration(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ExamRegistrationManager()
+
+    class Meta:
+        indexes = [
+            # Keyset pagination of the teacher summary walks this index
+            models.Index(fields=['created_at', 'id'], name='examreg_created_id_idx'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remembers the tracked values the row was loaded with, so deleting it
+        decrements the counter bucket it was read from.
+        """
+        instance = super().from_db(db, field_names, values)
+        if all(field in field_names for field in TRACKED_FIELDS):
+            instance._loaded_values = {
+                field: getattr(instance, field) for field in TRACKED_FIELDS
+            }
+        return instance
+
     def save(self, *args, **kwargs):
         """
         Override save to refresh user snapshot before persisting.
         Ensures stored full_name, varsity_id, session, and phone_number
-        always reflect the current user state.
+        always reflect the current user state, and updates the registration
+        counters and course enrollments in the same transaction.
+
+        An update locks the row and re-reads its tracked values, so two
+        concurrent saves of one registration apply their changes in turn
+        instead of both diffing against the values they loaded.
         """
+        self.refresh_user_snapshot()
+
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            if self._state.adding:
+                previous = None
+            else:
+                previous = (
+                    type(self).objects.using(using).select_for_update()
+                    .values(*TRACKED_FIELDS)
+                    .filter(pk=self.pk).first()
+                )
+            super().save(*args, **kwargs)
+            self._update_counters(previous, using)
+            self._update_course_enrollments(previous, using)
+        self._loaded_values = {field: getattr(self, field) for field in TRACKED_FIELDS}
+
+    def refresh_user_snapshot(self):
+        """Copies the snapshot fields from the current user."""
         self.full_name = self.user.full_name
         self.varsity_id = self.user.varsity_id
         self.session = self.user.session
         self.phone_number = self.user.phone_number
-        super().save(*args, **kwargs)
+
+    def _update_counters(self, previous, using):
+        """
+        Moves the registration between counter buckets when its key changed.
+        """
+        old_key = counter_key(previous) if previous is not None else None
+        new_key = counter_key(self)
+        if new_key == old_key:
+            return
+        if old_key is not None:
+            RegistrationCounter.objects.adjust(
+                dict(zip(COUNTER_FIELDS, old_key)), -1, using=using
+            )
+        RegistrationCounter.objects.adjust(
+            dict(zip(COUNTER_FIELDS, new_key)), 1, using=using
+        )
+
+    def _update_course_enrollments(self, previous, using):
+        """
+        Applies the difference between the old and new course lists to the
+        CourseEnrollment index.
+        """
+        old_codes = normalize_course_codes(previous['courses']) if previous else set()
+        new_codes = normalize_course_codes(self.courses)
+        removed, added = old_codes - new_codes, new_codes - old_codes
+        if removed:
+            CourseEnrollment.objects.using(using).filter(
+                registration=self, course_code__in=removed
+            ).delete()
+        if added:
+            CourseEnrollment.objects.using(using).bulk_create(
+                [CourseEnrollment(registration=self, course_code=code) for code in added],
+                ignore_conflicts=True,
+            )
+
+    def __str__(self):
+        return f"Exam Registration for {self.user.full_name}"
+
+
+# -----------------------------------------------------------------------------
+# CourseEnrollment Model
+# -----------------------------------------------------------------------------
+class CourseEnrollment(models.Model):
+    """
+    Normalized (registration, course code) index of ExamRegistration.courses,
+    kept in sync by ExamRegistration.save() so per-course lookups are indexed
+    queries instead of scans of the JSON column.
+    """
+    registration = models.ForeignKey(
+        ExamRegistration,
+        on_delete=models.CASCADE,
+        related_name='course_enrollments',
+        db_index=False,  # covered by the unique (registration, course_code) index
+    )
+    course_code = models.CharField(max_length=COURSE_CODE_MAX_LENGTH)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['registration', 'course_code'],
+                name='unique_course_enrollment',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['course_code', 'registration'], name='course_enrollment_code_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.course_code} ({self.registration_id})"
+
+
+# -----------------------------------------------------------------------------
+# RegistrationSubmission Model
+# -----------------------------------------------------------------------------
+class RegistrationSubmission(models.Model):
+    """
+    A validated registration payload accepted in surge mode and waiting to
+    be written as an ExamRegistration by ``drain_registration_queue``.
+    The ticket lets the student follow it through the GET endpoint.
+    """
+    PENDING = 'pending'
+    ACCEPTED = 'accepted'
+    REJECTED = 'rejected'
+    STATUS_CHOICES = (
+        (PENDING, 'Pending'),
+        (ACCEPTED, 'Accepted'),
+        (REJECTED, 'Rejected'),
+    )
+
+    ticket = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='registration_submissions'
+    )
+    payload = models.JSONField(help_text='Validated registration data')
+    status = models.CharField(max_length=8, choices=STATUS_CHOICES, default=PENDING)
+    errors = models.JSONField(null=True, blank=True)
+    registration = models.ForeignKey(
+        ExamRegistration,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+'
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            # One submission in the queue per student
+            models.UniqueConstraint(
+                fields=['user'],
+                condition=Q(status='pending'),
+                name='unique_pending_submission',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['status', 'id'], name='submission_status_idx'),
+        ]
 
     def __str__(self):
-        return f"Exam Registration for {self.user.full_name}"
\ No newline at end of file
+        return f"Submission {self.ticket} ({self.status})"
@@ -0,0 +1,115 @@
+"""
+Pagination classes for the student_manager app.
+
+Provides keyset (cursor) pagination over ``(created_at, id)`` so that every
+page of the registration summary costs the same regardless of its depth.
+"""
+
+# Relative Path: student_manager/pagination.py
+
+import base64
+import binascii
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset pagination ordered by ``(created_at, id)``.
+
+    - The cursor is an opaque, URL-safe token encoding the last row of the
+      previous page, so pages stay stable while new rows are inserted.
+    - No COUNT(*) is issued; one extra row is fetched to detect a next page.
+    - ``page_size`` may be requested by the client but is capped at
+      ``max_page_size``.
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    page_size = 100
+    max_page_size = 500
+    invalid_cursor_message = 'Invalid cursor.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        position = self.decode_cursor(request)
+
+        queryset = queryset.order_by('created_at', 'id')
+        if position is not None:
+            created_at, pk = position
+            # The leading range predicate lets the (created_at, id) index
+            # seek straight to the cursor instead of scanning from the start.
+            queryset = queryset.filter(created_at__gte=created_at).filter(
+                Q(created_at__gt=created_at) | Q(id__gt=pk)
+            )
+
+        rows = list(queryset[:self.page_size + 1])
+        page = rows[:self.page_size]
+        if len(rows) > self.page_size:
+            self.next_position = self.get_position(page[-1])
+        else:
+            self.next_position = None
+        return page
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'results': data,
+        })
+
+    def get_page_size(self, request):
+        """Return the requested page size, falling back to and capped by the defaults."""
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def get_position(self, row):
+        """Return the ``(created_at, id)`` key of a row (instance or ``.values()`` dict)."""
+        if isinstance(row, dict):
+            return row['created_at'], row['id']
+        return row.created_at, row.pk
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.next_position)
+        )
+
+    # -------------------------------------------------------------------------
+    # Cursor encoding
+    # -------------------------------------------------------------------------
+    def encode_cursor(self, position):
+        created_at, pk = position
+        raw = f'{created_at.isoformat()}|{pk}'
+        return base64.urlsafe_b64encode(raw.encode('ascii')).decode('ascii').rstrip('=')
+
+    def decode_cursor(self, request):
+        """
+        Decode the cursor query parameter into a ``(created_at, id)`` tuple.
+        Returns None when no cursor is given and raises NotFound when it is malformed.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padded = encoded + '=' * (-len(encoded) % 4)
+            raw = base64.urlsafe_b64decode(padded.encode('ascii')).decode('ascii')
+            created_at, pk = raw.rsplit('|', 1)
+            created_at = parse_datetime(created_at)
+            pk = int(pk)
+        except (binascii.Error, UnicodeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if created_at is None:
+            raise NotFound(self.invalid_cursor_message)
+        return created_at, pk
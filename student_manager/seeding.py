@@ -0,0 +1,131 @@
+"""
+Deterministic synthetic students and exam registrations for scale testing.
+
+Row `i` is always generated from its own Random(seed, i), so the dataset
+is the same for a given seed regardless of batch size, and ``offset``
+extends an existing dataset without collisions. Students are spread
+evenly over SESSION_CHOICES and registrations over HALL_CHOICES; unique
+fields (email, varsity ID, phone, payment slip) are derived from `i`.
+
+Rows are written with bulk_create/bulk_register: no per-row save() or
+full_clean(), and every student shares one password hash computed up front.
+"""
+
+# Relative Path: student_manager/seeding.py
+
+import random
+from dataclasses import dataclass
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+
+from accounts.models import GENDER_CHOICES, SESSION_CHOICES
+
+from .models import HALL_CHOICES, ExamRegistration
+
+
+FIRST_NAMES = (
+    'Abdullah', 'Afsana', 'Anika', 'Arif', 'Ayesha', 'Farhan', 'Fatema', 'Habib',
+    'Imran', 'Jannat', 'Kamrul', 'Mahmuda', 'Mehedi', 'Mim', 'Nafis', 'Nusrat',
+    'Rafiq', 'Rakib', 'Sadia', 'Sabbir', 'Shamim', 'Sumaiya', 'Tahmid', 'Tanvir',
+)
+LAST_NAMES = (
+    'Ahmed', 'Akter', 'Alam', 'Chowdhury', 'Das', 'Hasan', 'Hossain', 'Islam',
+    'Khan', 'Mahmud', 'Miah', 'Rahman', 'Roy', 'Sarker', 'Sultana', 'Uddin',
+)
+DEPARTMENTS = ('CSE', 'EEE', 'PHY', 'MAT', 'CHE', 'STA', 'ECO', 'ENG')
+PHONE_OPERATORS = '3456789'  # 013..019
+
+# Varsity IDs are <session year><6-digit serial>
+MAX_STUDENTS = 1_000_000
+
+SESSIONS = [value for value, _ in SESSION_CHOICES]
+HALLS = [value for value, _ in HALL_CHOICES]
+GENDERS = [value for value, _ in GENDER_CHOICES]
+
+
+@dataclass
+class SeedResult:
+    users: int = 0
+    registrations: int = 0
+
+
+def _rng(seed, i):
+    return random.Random(seed * MAX_STUDENTS + i)
+
+
+def build_student(i, seed, password_hash):
+    """Unsaved student number `i`."""
+    rng = _rng(seed, i)
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    session = SESSIONS[i % len(SESSIONS)]
+    return get_user_model()(
+        email=f'{first}.{last}.{i}@seed.example.com'.lower(),
+        # save() would upper-case the name; bulk_create does not call it
+        full_name=f'{first} {last}'.upper(),
+        role='student',
+        phone_number=f'01{rng.choice(PHONE_OPERATORS)}{i:08d}',
+        varsity_id=f'{session[2:4]}{i:06d}',
+        session=session,
+        gender=rng.choice(GENDERS),
+        password=password_hash,
+    )
+
+
+def build_registration(i, seed, user):
+    """Unsaved registration of student number `i`."""
+    rng = _rng(seed, i)
+    rng.random()  # keep registration draws independent of the student's
+    department = rng.choice(DEPARTMENTS)
+    level = rng.randint(1, 4)
+    improvement = rng.random() < 0.15
+    paid = rng.random() < 0.9
+    courses = sorted(rng.sample(range(1, 13), rng.randint(1, 2) if improvement else rng.randint(3, 6)))
+    return ExamRegistration(
+        user=user,
+        payment_status='Yes' if paid else 'No',
+        payment_slip=f'CU{user.session[:4]}{i:07d}' if paid else None,
+        student_status='improvement' if improvement else 'regular',
+        courses=[f'{department}-{level}{course:02d}' for course in courses],
+        hall_name=HALLS[i % len(HALLS)],
+    )
+
+
+def seed_dataset(users, registrations, seed=0, offset=0, batch_size=10000,
+                 password='seed1234', progress=None):
+    """
+    Creates `users` students numbered from `offset`; the first
+    `registrations` of them also get an exam registration. Each batch is
+    one transaction; larger batches also mean fewer counter updates, since
+    bulk_register adjusts each counter bucket once per batch.
+    `progress(result)` is called after every batch.
+    Returns a SeedResult.
+    """
+    if registrations > users:
+        raise ValueError('Every registration needs its own student.')
+    if offset + users > MAX_STUDENTS:
+        raise ValueError(f'At most {MAX_STUDENTS} seeded students are supported.')
+
+    User = get_user_model()
+    password_hash = make_password(password)
+    result = SeedResult()
+    for start in range(offset, offset + users, batch_size):
+        stop = min(offset + users, start + batch_size)
+        with transaction.atomic():
+            created = User.objects.bulk_create(
+                [build_student(i, seed, password_hash) for i in range(start, stop)],
+                batch_size=batch_size,
+            )
+            registered = [
+                build_registration(i, seed, user)
+                for i, user in zip(range(start, stop), created)
+                if i < offset + registrations
+            ]
+            if registered:
+                ExamRegistration.objects.bulk_register(registered)
+        result.users += len(created)
+        result.registrations += len(registered)
+        if progress is not None:
+            progress(result)
+    return result
@@ -5,19 +5,160 @@ Handles validation and transformation of ExamRegistration data.
 
 # Relative Path: student_manager/serializers.py
 
+from functools import lru_cache
+from operator import itemgetter
+
+from django.db.models import QuerySet
+from django.db.models.query import ModelIterable
 from rest_framework import serializers
+from rest_framework.settings import api_settings
 from .models import ExamRegistration
 
 
+# -----------------------------------------------------------------------------
+# Values-based list serialization
+# -----------------------------------------------------------------------------
+# Fields whose to_representation() returns database values unchanged
+_PASSTHROUGH = {
+    serializers.CharField.to_representation,
+    serializers.IntegerField.to_representation,
+    serializers.BooleanField.to_representation,
+}
+
+
+def _iso_datetime(timezone):
+    def convert(value):
+        if not value:
+            return None
+        value = value.astimezone(timezone).isoformat()
+        if value.endswith("+00:00"):
+            value = value[:-6] + "Z"
+        return value
+    return convert
+
+
+def _generic(field):
+    def convert(value):
+        return None if value is None else field.to_representation(value)
+    return convert
+
+
+def _converter(field):
+    """
+    Returns None when `field` outputs database values unchanged, else a
+    function doing exactly what field.to_representation() would.
+    """
+    representation = type(field).to_representation
+    if representation in _PASSTHROUGH:
+        return None
+    if isinstance(field, serializers.PrimaryKeyRelatedField):
+        return None  # values() already yields the related primary key
+    if isinstance(field, serializers.ChoiceField) and all(
+        isinstance(key, str) for key in field.choice_strings_to_values.values()
+    ):
+        return None  # string choices map to themselves
+    if representation is serializers.JSONField.to_representation and not field.binary:
+        return None
+    if representation is serializers.DateTimeField.to_representation:
+        output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+        timezone = field.timezone if hasattr(field, "timezone") else field.default_timezone()
+        if output_format and output_format.lower() == "iso-8601" and timezone is not None:
+            return _iso_datetime(timezone)
+    return _generic(field)
+
+
+def _values_plan(serializer):
+    """[(output name, column, converter or None)], or None if unsupported."""
+    model = serializer.Meta.model
+    columns = {field.name: field for field in model._meta.concrete_fields}
+    plan = []
+    for field in serializer._readable_fields:
+        column = columns.get(field.source)
+        # A relation column yields the related key, which only a plain
+        # PrimaryKeyRelatedField outputs as is
+        if column is None or (column.is_relation and not (
+            isinstance(field, serializers.PrimaryKeyRelatedField)
+            and field.pk_field is None
+        )):
+            return None
+        plan.append((field.field_name, field.source, _converter(field)))
+    return plan
+
+
+def _values(queryset, plan):
+    if plan is None:
+        return queryset
+    return queryset.values(*dict.fromkeys(column for _, column, _ in plan))
+
+
+@lru_cache(maxsize=None)
+def _class_plan(serializer_class):
+    # Only the columns are used, so converters built here never go stale
+    return _values_plan(serializer_class())
+
+
+def values_rows(serializer_class, queryset):
+    """
+    `queryset` as ``.values()`` rows of the columns `serializer_class`
+    reads, to paginate before ``serializer_class(page, many=True)``.
+    Returned unchanged if the serializer cannot use ValuesListSerializer.
+    """
+    return _values(queryset, _class_plan(serializer_class))
+
+
+class ValuesListSerializer(serializers.ListSerializer):
+    """
+    Read-only fast path for ``many=True``: rows fetched with ``.values()``
+    are converted field by field with precompiled converters, without
+    building model instances or walking the serializer fields per row. The
+    output is the same as serializing the instances.
+
+    Pass a queryset, or rows from ``values_rows()``; lists of model
+    instances (and all writes) take the normal ListSerializer path. Only
+    fields that read a concrete model column directly are supported;
+    serializers with other fields always take the normal path.
+    """
+
+    def _plan(self):
+        if not hasattr(self, "_plan_cache"):
+            self._plan_cache = _values_plan(self.child)
+        return self._plan_cache
+
+    def to_representation(self, data):
+        if isinstance(data, QuerySet) and issubclass(data._iterable_class, ModelIterable):
+            data = _values(data, self._plan())
+        rows = list(data)
+        plan = self._plan()
+        if plan is None or not rows or not isinstance(rows[0], dict):
+            return super().to_representation(rows)
+        names = [name for name, _, _ in plan]
+        pick = itemgetter(*[column for _, column, _ in plan])
+        converted = [(name, convert) for name, _, convert in plan if convert is not None]
+        if len(plan) == 1:
+            return [self._convert({names[0]: pick(row)}, converted) for row in rows]
+        # Keys are filled in field order, then converted in place
+        return [self._convert(dict(zip(names, pick(row))), converted) for row in rows]
+
+    @staticmethod
+    def _convert(item, converted):
+        for name, convert in converted:
+            item[name] = convert(item[name])
+        return item
+
+
 class ExamRegistrationSerializer(serializers.ModelSerializer):
     """
     Serializer for ExamRegistration model.
     Ensures that critical user-related fields remain read-only and
     provides safe handling of registration data.
+
+    With ``many=True`` it serializes querysets and ``values_rows()`` rows
+    through ValuesListSerializer.
     """
 
     class Meta:
         model = ExamRegistration
+        list_serializer_class = ValuesListSerializer
         fields = [
             "id",
             "user",
@@ -0,0 +1,81 @@
+"""
+Signal handlers for the student_manager app.
+
+Keeps derived data (registration counters) in step with ExamRegistration
+rows removed outside of ExamRegistration.save(), e.g. cascading deletes,
+copies profile edits onto the user's registration snapshots, and
+invalidates the cached teacher summary on every relevant write.
+"""
+
+# Relative Path: student_manager/signals.py
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from .models import (
+    COUNTER_FIELDS,
+    SNAPSHOT_FIELDS,
+    ExamRegistration,
+    RegistrationCounter,
+    counter_key,
+)
+from .summary_cache import invalidate_summaries
+
+
+@receiver(post_delete, sender=ExamRegistration)
+def decrement_registration_counter(sender, instance, using, **kwargs):
+    """
+    Removes a deleted registration from its counter bucket. Runs inside the
+    deletion's transaction, so a rolled-back delete leaves counters untouched.
+    """
+    loaded = getattr(instance, '_loaded_values', None)
+    key = counter_key(loaded if loaded is not None else instance)
+    RegistrationCounter.objects.adjust(dict(zip(COUNTER_FIELDS, key)), -1, using=using)
+
+
+@receiver(post_init, sender=settings.AUTH_USER_MODEL)
+def remember_user_snapshot(sender, instance, **kwargs):
+    """
+    Records the snapshot values a user was loaded (or built) with, so
+    post_save can tell whether the registrations need updating.
+    """
+    instance._registration_snapshot = _snapshot(instance)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def propagate_user_snapshot(sender, instance, created, using, **kwargs):
+    """
+    Copies changed snapshot fields onto all of the user's registrations with
+    one UPDATE ... WHERE user_id=, in the user's save transaction.
+    """
+    current = _snapshot(instance)
+    previous = getattr(instance, '_registration_snapshot', None)
+    instance._registration_snapshot = current
+    if created or (current is not None and current == previous):
+        return
+    sessions_changed = (
+        current is None or previous is None or previous['session'] != current['session']
+    )
+    ExamRegistration.objects.sync_snapshots(
+        [instance.pk], sessions_changed=sessions_changed, using=using
+    )
+
+
+def _snapshot(user):
+    """The user's snapshot values, or None if any of them is deferred."""
+    # Read __dict__ so a deferred field is never loaded from the database
+    values = user.__dict__
+    if any(field not in values for field in SNAPSHOT_FIELDS):
+        return None
+    return {field: values[field] for field in SNAPSHOT_FIELDS}
+
+
+@receiver(post_save, sender=ExamRegistration)
+@receiver(post_delete, sender=ExamRegistration)
+def invalidate_summary_on_registration_change(sender, instance, using, **kwargs):
+    """
+    Also covers user changes: snapshot edits invalidate in sync_snapshots()
+    and deleted users cascade to their registrations.
+    """
+    invalidate_summaries(using=using)
@@ -0,0 +1,151 @@
+"""
+Write-behind queue for exam registration submissions.
+
+With ``settings.REGISTRATION_SURGE_MODE`` on, POST exam-registration/my/
+validates the payload, stores it as a RegistrationSubmission and answers
+202 with a ticket. ``drain_registration_queue`` then turns pending
+submissions into ExamRegistration rows in batches: one query each for
+users, existing registrations and taken payment slips, then a single
+bulk insert for the accepted ones. If that insert hits a unique
+constraint (another drainer took the same payment slip after the checks),
+the batch is retried row by row and only the conflicting submissions are
+rejected.
+"""
+
+# Relative Path: student_manager/submission_queue.py
+
+from dataclasses import dataclass
+
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .models import ExamRegistration, RegistrationSubmission
+
+
+ALREADY_REGISTERED = {"detail": "You have already registered."}
+SLIP_TAKEN = {"payment_slip": ["exam registration with this payment slip already exists."]}
+
+
+class AlreadyQueued(Exception):
+    """The student already has a pending submission."""
+
+
+@dataclass
+class DrainResult:
+    accepted: int = 0
+    rejected: int = 0
+    batches: int = 0
+
+
+def enqueue_submission(user, validated_data):
+    """
+    Stores a validated registration payload for `user` and returns the
+    RegistrationSubmission. Raises AlreadyQueued if one is still pending.
+    """
+    try:
+        with transaction.atomic():
+            return RegistrationSubmission.objects.create(user=user, payload=validated_data)
+    except IntegrityError:
+        raise AlreadyQueued()
+
+
+def submission_status(submission):
+    """The ticket section of the GET exam-registration/my/ response."""
+    return {
+        "ticket": str(submission.ticket),
+        "status": submission.status,
+        "errors": submission.errors,
+    }
+
+
+def drain_batch(batch_size=500):
+    """
+    Processes up to `batch_size` pending submissions in one transaction.
+    Returns (accepted, rejected), or None when the queue is empty.
+
+    Rows are claimed with SELECT ... FOR UPDATE SKIP LOCKED where the
+    database supports it, so several drainers can run side by side.
+    """
+    User = get_user_model()
+    now = timezone.now()
+    with transaction.atomic():
+        batch = list(
+            RegistrationSubmission.objects.select_for_update(skip_locked=True)
+            .filter(status=RegistrationSubmission.PENDING)
+            .order_by('id')[:batch_size]
+        )
+        if not batch:
+            return None
+
+        user_ids = {submission.user_id for submission in batch}
+        users = User.objects.in_bulk(user_ids)
+        registered = set(
+            ExamRegistration.objects.filter(user_id__in=user_ids)
+            .values_list('user_id', flat=True)
+        )
+        slips = {s.payload.get('payment_slip') for s in batch} - {None, ''}
+        taken_slips = set(
+            ExamRegistration.objects.filter(payment_slip__in=slips)
+            .values_list('payment_slip', flat=True)
+        )
+
+        accepted, registrations = [], []
+        for submission in batch:
+            slip = submission.payload.get('payment_slip') or None
+            submission.processed_at = now
+            if submission.user_id in registered:
+                submission.status = RegistrationSubmission.REJECTED
+                submission.errors = ALREADY_REGISTERED
+                continue
+            if slip is not None and slip in taken_slips:
+                submission.status = RegistrationSubmission.REJECTED
+                submission.errors = SLIP_TAKEN
+                continue
+            registered.add(submission.user_id)
+            if slip is not None:
+                taken_slips.add(slip)
+            accepted.append(submission)
+            registrations.append(
+                ExamRegistration(user=users[submission.user_id], **submission.payload)
+            )
+
+        try:
+            # bulk_register() runs in a savepoint, so a conflict leaves the batch usable
+            created = ExamRegistration.objects.bulk_register(registrations)
+        except IntegrityError:
+            accepted, created = _register_each(accepted, registrations)
+        for submission, registration in zip(accepted, created):
+            submission.status = RegistrationSubmission.ACCEPTED
+            submission.registration = registration
+        RegistrationSubmission.objects.bulk_update(
+            batch, ['status', 'errors', 'registration', 'processed_at']
+        )
+    return len(accepted), len(batch) - len(accepted)
+
+
+def _register_each(submissions, registrations):
+    """
+    Inserts `registrations` one at a time, rejecting the submissions whose
+    row violates a unique constraint. Returns (accepted, created).
+    """
+    accepted, created = [], []
+    for submission, registration in zip(submissions, registrations):
+        try:
+            created.extend(ExamRegistration.objects.bulk_register([registration]))
+        except IntegrityError:
+            submission.status = RegistrationSubmission.REJECTED
+            submission.errors = SLIP_TAKEN  # payment_slip is the only unique column
+            continue
+        accepted.append(submission)
+    return accepted, created
+
+
+def drain_submissions(batch_size=500):
+    """Drains the queue until no pending submission is left."""
+    result = DrainResult()
+    while (counts := drain_batch(batch_size)) is not None:
+        result.accepted += counts[0]
+        result.rejected += counts[1]
+        result.batches += 1
+    return result
@@ -0,0 +1,66 @@
+"""
+Generation-keyed cache of rendered teacher summary pages.
+
+Every summary page (per URL, so per filter set and cursor) is stored as
+encoded JSON bytes under the current generation. Any write that can change
+a summary replaces the generation, which orphans all cached pages at once;
+orphans simply expire after ``SUMMARY_CACHE['TTL']`` seconds.
+
+The generation is a random token rather than an incremented number, so two
+workers bumping at the same moment can never leave it unchanged. Writers
+bump immediately and again once their transaction commits, so a page
+rendered from pre-commit data is never kept under the final generation.
+"""
+
+# Relative Path: student_manager/summary_cache.py
+
+import hashlib
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+
+GENERATION_KEY = 'summary:generation'
+
+
+def _cache():
+    return caches['shared']
+
+
+def _ttl():
+    return getattr(settings, 'SUMMARY_CACHE', {}).get('TTL', 300)
+
+
+def current_generation():
+    """Returns the current generation token, creating one if needed."""
+    cache = _cache()
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        cache.add(GENERATION_KEY, uuid.uuid4().hex, timeout=None)
+        generation = cache.get(GENERATION_KEY)
+    return generation
+
+
+def bump_generation():
+    _cache().set(GENERATION_KEY, uuid.uuid4().hex, timeout=None)
+
+
+def invalidate_summaries(using=None):
+    """Drops every cached summary page, now and when the transaction commits."""
+    bump_generation()
+    transaction.on_commit(bump_generation, using=using)
+
+
+def page_key(generation, url):
+    digest = hashlib.sha256(url.encode('utf-8')).hexdigest()
+    return f'summary:{generation}:page:{digest}'
+
+
+def get_page(key):
+    return _cache().get(key)
+
+
+def set_page(key, content):
+    _cache().set(key, content, timeout=_ttl())
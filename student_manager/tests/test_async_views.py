@@ -0,0 +1,94 @@
+"""
+Tests for the async MyExamRegistration served under ASGI.
+
+Responses must match the synchronous view byte for byte.
+"""
+
+# Relative Path: student_manager/tests/test_async_views.py
+
+from asgiref.sync import sync_to_async
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts import authentication
+from accounts.models import User
+from student_manager.models import CourseEnrollment, ExamRegistration
+
+
+@override_settings(ROOT_URLCONF='cupcp_backend.asgi_urls')
+class AsyncMyExamRegistrationTests(TestCase):
+    def setUp(self):
+        caches['shared'].clear()
+        authentication._user_cache.clear()
+        self.user = User.objects.create_user(
+            email="async@example.com",
+            full_name="Async Student",
+            role="student",
+            phone_number="01911111111",
+            varsity_id="31111111",
+            session="2024-25",
+            gender="male",
+        )
+        token = RefreshToken.for_user(self.user).access_token
+        self.headers = {'Authorization': f'Bearer {token}'}
+        self.url = reverse('my-exam-registration')
+        self.payload = {
+            'payment_status': 'Yes',
+            'payment_slip': 'SLIP-ASYNC-1',
+            'student_status': 'regular',
+            'courses': ['cse101', 'CSE102'],
+            'hall_name': 'Alaol Hall',
+        }
+
+    async def test_create_then_get_matches_sync_view(self):
+        response = await self.async_client.post(
+            self.url, self.payload, content_type='application/json', headers=self.headers
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['registration']['full_name'], 'ASYNC STUDENT')
+        self.assertEqual(
+            await CourseEnrollment.objects.filter(registration__user=self.user).acount(), 2
+        )
+
+        async_get = await self.async_client.get(self.url, headers=self.headers)
+        sync_get = await self._sync_get()
+        self.assertEqual(async_get.status_code, 200)
+        self.assertEqual(async_get.content, sync_get.content)
+
+    async def test_duplicate_post_and_missing_put(self):
+        missing = await self.async_client.put(
+            self.url, {'hall_name': 'X'}, content_type='application/json', headers=self.headers
+        )
+        self.assertEqual(missing.status_code, 404)
+        await self.async_client.post(
+            self.url, self.payload, content_type='application/json', headers=self.headers
+        )
+        again = await self.async_client.post(
+            self.url, self.payload, content_type='application/json', headers=self.headers
+        )
+        self.assertEqual(again.status_code, 400)
+
+    async def test_update(self):
+        await self.async_client.post(
+            self.url, self.payload, content_type='application/json', headers=self.headers
+        )
+        response = await self.async_client.put(
+            self.url, {'courses': ['CSE201']}, content_type='application/json',
+            headers=self.headers
+        )
+        self.assertEqual(response.status_code, 200)
+        registration = await ExamRegistration.objects.aget(user=self.user)
+        self.assertEqual(registration.courses, ['CSE201'])
+
+    async def test_requires_authentication(self):
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response['WWW-Authenticate'], 'Bearer realm="api"')
+
+    async def _sync_get(self):
+        with override_settings(ROOT_URLCONF='cupcp_backend.urls'):
+            return await sync_to_async(self.client.get)(
+                self.url, HTTP_AUTHORIZATION=self.headers['Authorization']
+            )
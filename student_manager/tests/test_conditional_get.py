@@ -0,0 +1,103 @@
+"""
+Tests for ETag / If-None-Match on the profile, own-registration and
+summary endpoints.
+"""
+
+# Relative Path: student_manager/tests/test_conditional_get.py
+
+from django.core.cache import caches
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts import authentication
+from accounts.models import User
+from student_manager.models import ExamRegistration
+
+
+class ConditionalGetTests(APITestCase):
+    def setUp(self):
+        caches['shared'].clear()
+        authentication._user_cache.clear()
+        self.student = User.objects.create_user(
+            email="etag@example.com",
+            full_name="Etag Student",
+            role="student",
+            phone_number="01611112222",
+            varsity_id="11112222",
+            session="2024-25",
+            gender="female",
+        )
+        self.teacher = User.objects.create_user(
+            email="etagteacher@example.com",
+            full_name="Etag Teacher",
+            role="teacher",
+            phone_number="01611113333",
+        )
+        self.registration = ExamRegistration.objects.create(
+            user=self.student,
+            payment_status='Yes',
+            student_status='regular',
+            courses=['CSE101'],
+            hall_name='Alaol Hall',
+        )
+
+    def _get(self, url, user, etag=None):
+        headers = dict(self._auth(user))
+        if etag:
+            headers['HTTP_IF_NONE_MATCH'] = etag
+        return self.client.get(url, **headers)
+
+    def _auth(self, user):
+        token = RefreshToken.for_user(user).access_token
+        return {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+    def test_profile_304_without_queries(self):
+        url = reverse('user-profile')
+        first = self._get(url, self.student)
+        self.assertTrue(first['ETag'].startswith('W/"'))
+        headers = {**self._auth(self.student), 'HTTP_IF_NONE_MATCH': first['ETag']}
+        with self.assertNumQueries(0):
+            again = self.client.get(url, **headers)
+        self.assertEqual(again.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.student.full_name = 'Renamed'
+        self.student.save()
+        changed = self._get(url, self.student, first['ETag'])
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+
+    def test_registration_304_reads_only_version(self):
+        url = reverse('my-exam-registration')
+        first = self._get(url, self.student)
+        headers = {**self._auth(self.student), 'HTTP_IF_NONE_MATCH': first['ETag']}
+        with self.assertNumQueries(1):
+            again = self.client.get(url, **headers)
+        self.assertEqual(again.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.registration.hall_name = 'Shahjalal Hall'
+        self.registration.save()
+        changed = self._get(url, self.student, first['ETag'])
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(changed['ETag'], first['ETag'])
+
+    def test_summary_collection_etag(self):
+        url = reverse('exam-reg-summary')
+        first = self._get(url, self.teacher)
+        again = self._get(url, self.teacher, first['ETag'])
+        self.assertEqual(again.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.registration.delete()
+        changed = self._get(url, self.teacher, first['ETag'])
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertEqual(changed.data['results'], [])
+
+    def test_summary_revalidation_skips_the_database(self):
+        """The summary ETag comes from the cache generation, not an aggregate."""
+        url = reverse('exam-reg-summary')
+        first = self._get(url, self.teacher)
+        headers = {**self._auth(self.teacher), 'HTTP_IF_NONE_MATCH': first['ETag']}
+        self.client.get(url, **headers)  # warm the cached user
+        with self.assertNumQueries(0):
+            again = self.client.get(url, **headers)
+        self.assertEqual(again.status_code, status.HTTP_304_NOT_MODIFIED)
@@ -0,0 +1,104 @@
+"""
+Tests for the normalized CourseEnrollment index.
+
+Covers sync on registration create/update, the per-course roster and
+count endpoints, and the backfill_course_enrollments command.
+"""
+
+# Relative Path: student_manager/tests/test_course_enrollments.py
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import User
+from student_manager.models import CourseEnrollment, ExamRegistration
+
+
+class CourseEnrollmentTests(APITestCase):
+    """
+    Ensures the course index mirrors ExamRegistration.courses.
+    """
+
+    def setUp(self):
+        self.students = [
+            User.objects.create_user(
+                email=f"course{i}@example.com",
+                full_name=f"Course Student {i}",
+                role="student",
+                phone_number=f"0181111111{i}",
+                varsity_id=f"4111111{i}",
+                session="2024-25",
+                gender="male",
+            )
+            for i in range(2)
+        ]
+        teacher = User.objects.create_user(
+            email="courseteacher@example.com",
+            full_name="Course Teacher",
+            role="teacher",
+            phone_number="01822222222",
+        )
+        token = RefreshToken.for_user(teacher).access_token
+        self.teacher_header = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+    def _register(self, user, courses):
+        return ExamRegistration.objects.create(
+            user=user,
+            payment_status='Yes',
+            student_status='regular',
+            courses=courses,
+            hall_name='Alaol Hall',
+        )
+
+    def _codes(self, registration):
+        return set(
+            CourseEnrollment.objects.filter(registration=registration)
+            .values_list('course_code', flat=True)
+        )
+
+    def test_enrollments_follow_course_changes(self):
+        """
+        Codes are normalized on create and diffed on update.
+        """
+        reg = self._register(self.students[0], [' cse-311 ', 'PHYS-401', 'PHYS-401'])
+        self.assertEqual(self._codes(reg), {'CSE-311', 'PHYS-401'})
+
+        reg = ExamRegistration.objects.get(pk=reg.pk)
+        reg.courses = ['CSE-311', 'MATH-201']
+        reg.save()
+        self.assertEqual(self._codes(reg), {'CSE-311', 'MATH-201'})
+
+    def test_roster_and_count_endpoints(self):
+        """
+        Teachers can list and count the registrations for a course.
+        """
+        first = self._register(self.students[0], ['CSE-311'])
+        self._register(self.students[1], ['PHYS-401'])
+
+        response = self.client.get(
+            reverse('course-roster', args=['cse-311']), **self.teacher_header
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item['id'] for item in response.data['results']], [first.id])
+
+        response = self.client.get(
+            reverse('course-count', args=['CSE-311']), **self.teacher_header
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'course_code': 'CSE-311', 'registrations': 1})
+
+    def test_backfill_command_rebuilds_index(self):
+        """
+        The backfill restores enrollments for rows written around save().
+        """
+        reg = self._register(self.students[0], ['CSE-311'])
+        ExamRegistration.objects.filter(pk=reg.pk).update(courses=['EEE-101', 'CSE-311'])
+        CourseEnrollment.objects.all().delete()
+
+        call_command('backfill_course_enrollments', '--batch-size', '1', stdout=StringIO())
+        self.assertEqual(self._codes(reg), {'CSE-311', 'EEE-101'})
@@ -6,6 +6,9 @@ Covers student submission, retrieval, and teacher summary access with JWT authen
 
 # Relative Path: cupcp_backend/student_manager/tests/test_exam_registration_api.py
 
+import json
+from unittest import mock
+
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -13,6 +16,7 @@ from rest_framework_simplejwt.tokens import RefreshToken
 
 from accounts.models import User
 from student_manager.models import ExamRegistration
+from student_manager.pagination import KeysetPagination
 
 
 class ExamRegistrationAPITests(APITestCase):
@@ -196,8 +200,154 @@ class ExamRegistrationAPITests(APITestCase):
             **self.teacher_header
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIsInstance(response.data, list)
-        self.assertEqual(len(response.data), 2)
-        for item in response.data:
+        self.assertIsInstance(response.data['results'], list)
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertIsNone(response.data['next'])
+        for item in response.data['results']:
             self.assertIn('payment_status', item)
             self.assertIn('courses', item)
+
+    # ---------------------
+    # Summary Pagination Tests
+    # ---------------------
+
+    def _create_registrations(self, count):
+        """
+        Create `count` registrations directly, one student per registration.
+        """
+        for i in range(count):
+            student = User.objects.create_user(
+                email=f"bulk{i}@example.com",
+                full_name=f"Bulk Student {i}",
+                role="student",
+                phone_number=f"0170000{i:04d}",
+                varsity_id=f"2000{i:04d}",
+                session="2024-25",
+                gender="male",
+            )
+            ExamRegistration.objects.create(
+                user=student,
+                payment_status='Yes',
+                payment_slip=f'BULK{i}',
+                student_status='regular',
+                courses=['PHYS-401'],
+                hall_name='Alaol Hall',
+            )
+
+    def test_summary_cursor_walks_every_row_once(self):
+        """
+        Following `next` links visits every registration exactly once, in order.
+        """
+        self._create_registrations(5)
+
+        seen = []
+        url = f"{self.summary_url}?page_size=2"
+        while url:
+            response = self.client.get(url, format='json', **self.teacher_header)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data['results']), 2)
+            seen.extend(item['id'] for item in response.data['results'])
+            url = response.data['next']
+
+        expected = list(
+            ExamRegistration.objects.order_by('created_at', 'id').values_list('id', flat=True)
+        )
+        self.assertEqual(seen, expected)
+
+    def test_summary_page_size_is_capped(self):
+        """
+        Requested page sizes above the maximum are clamped.
+        """
+        self._create_registrations(3)
+        with mock.patch.object(KeysetPagination, 'max_page_size', 2):
+            response = self.client.get(
+                f"{self.summary_url}?page_size=1000",
+                format='json',
+                **self.teacher_header
+            )
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertIsNotNone(response.data['next'])
+
+    def test_summary_invalid_cursor(self):
+        """
+        A malformed cursor is rejected with 404.
+        """
+        response = self.client.get(
+            f"{self.summary_url}?cursor=not-a-cursor",
+            format='json',
+            **self.teacher_header
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    # ---------------------
+    # Summary Filter & Export Tests
+    # ---------------------
+
+    def test_summary_filters_by_hall(self):
+        """
+        The summary honours the ?hall= filter.
+        """
+        self._create_registrations(2)
+        ExamRegistration.objects.filter(payment_slip='BULK0').update(hall_name='Pritilata Hall')
+
+        response = self.client.get(
+            f"{self.summary_url}?hall=Pritilata Hall",
+            format='json',
+            **self.teacher_header
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item['payment_slip'] for item in response.data['results']],
+            ['BULK0']
+        )
+
+    def test_teacher_can_export_csv(self):
+        """
+        Teachers receive a streamed CSV with a header and one line per registration.
+        """
+        self._create_registrations(3)
+        response = self.client.get(
+            reverse('exam-reg-export', args=['csv']),
+            **self.teacher_header
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0].split(',')[:3], ['id', 'user', 'full_name'])
+        self.assertEqual(len(lines), 4)
+
+    def test_teacher_can_export_jsonl_with_filters(self):
+        """
+        JSON Lines export applies the same filters as the summary.
+        """
+        self._create_registrations(3)
+        ExamRegistration.objects.filter(payment_slip='BULK1').update(payment_status='No')
+
+        response = self.client.get(
+            reverse('exam-reg-export', args=['jsonl']) + '?payment_status=No',
+            **self.teacher_header
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rows = [
+            json.loads(line)
+            for line in b''.join(response.streaming_content).decode().splitlines()
+        ]
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['payment_slip'], 'BULK1')
+        self.assertEqual(rows[0]['courses'], ['PHYS-401'])
+
+    def test_export_rejects_students_and_unknown_formats(self):
+        """
+        Students get 403 and unsupported formats 404.
+        """
+        response = self.client.get(
+            reverse('exam-reg-export', args=['csv']),
+            **self.student_header
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        response = self.client.get(
+            reverse('exam-reg-export', args=['xlsx']),
+            **self.teacher_header
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
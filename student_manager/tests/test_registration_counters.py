@@ -0,0 +1,142 @@
+"""
+Tests for the incrementally maintained registration counters.
+
+Covers counter updates on create/update/delete, the teacher stats endpoint,
+and the rebuild_registration_counters management command.
+"""
+
+# Relative Path: student_manager/tests/test_registration_counters.py
+
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import User
+from student_manager.models import ExamRegistration, RegistrationCounter
+
+
+class RegistrationCounterTests(APITestCase):
+    """
+    Ensures counters track ExamRegistration writes and are served to teachers.
+    """
+
+    def setUp(self):
+        self.student = User.objects.create_user(
+            email="counter1@example.com",
+            full_name="Counter One",
+            role="student",
+            phone_number="01711111111",
+            varsity_id="31111111",
+            session="2024-25",
+            gender="female",
+        )
+        self.teacher = User.objects.create_user(
+            email="counterteacher@example.com",
+            full_name="Counter Teacher",
+            role="teacher",
+            phone_number="01722222222",
+        )
+        self.stats_url = reverse('exam-reg-stats')
+        token = RefreshToken.for_user(self.teacher).access_token
+        self.teacher_header = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+    def _register(self, **overrides):
+        data = {
+            'user': self.student,
+            'payment_status': 'Yes',
+            'student_status': 'regular',
+            'courses': ['PHYS-401'],
+            'hall_name': 'Alaol Hall',
+        }
+        data.update(overrides)
+        return ExamRegistration.objects.create(**data)
+
+    def _count(self, **key):
+        counter = RegistrationCounter.objects.filter(**key).first()
+        return counter.count if counter else 0
+
+    def test_create_update_delete_adjust_counters(self):
+        """
+        Counters follow a registration through create, bucket change and delete.
+        """
+        reg = self._register()
+        self.assertEqual(self._count(hall_name='Alaol Hall', payment_status='Yes'), 1)
+
+        reg = ExamRegistration.objects.get(pk=reg.pk)
+        reg.payment_status = 'No'
+        reg.save()
+        self.assertEqual(self._count(hall_name='Alaol Hall', payment_status='Yes'), 0)
+        self.assertEqual(self._count(hall_name='Alaol Hall', payment_status='No'), 1)
+
+        reg.delete()
+        self.assertEqual(self._count(hall_name='Alaol Hall', payment_status='No'), 0)
+
+    def test_saves_from_stale_copies_do_not_drift(self):
+        """
+        Two copies loaded before either saves (as in concurrent PUTs) each move
+        the registration from the bucket it is actually in.
+        """
+        reg = self._register()
+        first = ExamRegistration.objects.get(pk=reg.pk)
+        second = ExamRegistration.objects.get(pk=reg.pk)
+        first.hall_name = 'Shahjalal Hall'
+        first.courses = ['CSE-101']
+        first.save()
+        second.hall_name = 'Pritilata Hall'
+        second.courses = ['MAT-201']
+        second.save()
+
+        self.assertEqual(RegistrationCounter.objects.drift(), {})
+        self.assertEqual(self._count(hall_name='Pritilata Hall'), 1)
+        self.assertEqual(self._count(hall_name='Shahjalal Hall'), 0)
+        self.assertEqual(
+            list(reg.course_enrollments.values_list('course_code', flat=True)), ['MAT-201']
+        )
+
+    def test_cascade_delete_decrements_counter(self):
+        """
+        Deleting the user cascades to the registration and its counter.
+        """
+        self._register(hall_name=None)
+        self.assertEqual(self._count(hall_name=''), 1)
+        self.student.delete()
+        self.assertEqual(self._count(hall_name=''), 0)
+
+    def test_stats_endpoint(self):
+        """
+        Teachers read per-hall totals without touching registrations.
+        """
+        self._register(student_status='improvement')
+
+        with self.assertNumQueries(2):  # user lookup + counter read
+            response = self.client.get(self.stats_url, **self.teacher_header)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['totals']['registrations'], 1)
+        hall = response.data['by_hall']['Alaol Hall']
+        self.assertEqual(hall['payment_status'], {'Yes': 1})
+        self.assertEqual(hall['student_status'], {'improvement': 1})
+        self.assertEqual(response.data['by_session']['2024-25']['registrations'], 1)
+
+    def test_stats_forbidden_for_students(self):
+        token = RefreshToken.for_user(self.student).access_token
+        response = self.client.get(self.stats_url, HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_rebuild_command_detects_and_fixes_drift(self):
+        """
+        --check reports drift after a bulk update; a rebuild repairs it.
+        """
+        self._register()
+        ExamRegistration.objects.update(hall_name='Pritilata Hall')  # bypasses save()
+
+        with self.assertRaises(CommandError):
+            call_command('rebuild_registration_counters', '--check', stdout=StringIO())
+
+        call_command('rebuild_registration_counters', stdout=StringIO())
+        self.assertEqual(self._count(hall_name='Alaol Hall'), 0)
+        self.assertEqual(self._count(hall_name='Pritilata Hall'), 1)
+        call_command('rebuild_registration_counters', '--check', stdout=StringIO())
@@ -0,0 +1,141 @@
+"""
+Tests for surge mode: queued submissions, ticket polling and the
+drain_registration_queue command.
+"""
+
+# Relative Path: student_manager/tests/test_registration_queue.py
+
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import User
+from student_manager.models import (
+    CourseEnrollment,
+    ExamRegistration,
+    RegistrationCounter,
+    RegistrationSubmission,
+)
+
+
+@override_settings(REGISTRATION_SURGE_MODE=True)
+class RegistrationQueueTests(APITestCase):
+    def setUp(self):
+        self.students = [
+            User.objects.create_user(
+                email=f"surge{i}@example.com",
+                full_name=f"Surge Student {i}",
+                role="student",
+                phone_number=f"0171111111{i}",
+                varsity_id=f"2111111{i}",
+                session="2024-25",
+                gender="male",
+            )
+            for i in range(3)
+        ]
+        self.url = reverse('my-exam-registration')
+
+    def _auth(self, user):
+        token = RefreshToken.for_user(user).access_token
+        return {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+    def _submit(self, user, slip):
+        return self.client.post(
+            self.url,
+            {
+                'payment_status': 'Yes',
+                'payment_slip': slip,
+                'student_status': 'regular',
+                'courses': ['CSE101', 'cse102'],
+                'hall_name': 'Alaol Hall',
+            },
+            format='json',
+            **self._auth(user)
+        )
+
+    def _drain(self, *args):
+        out = StringIO()
+        call_command('drain_registration_queue', *args, stdout=out)
+        return out.getvalue()
+
+    def test_post_queues_and_get_reports_ticket(self):
+        response = self._submit(self.students[0], 'SURGE-1')
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        ticket = response.data['submission']['ticket']
+        self.assertFalse(ExamRegistration.objects.exists())
+
+        pending = self.client.get(self.url, **self._auth(self.students[0]))
+        self.assertFalse(pending.data['registered'])
+        self.assertEqual(pending.data['submission'], {
+            'ticket': ticket, 'status': 'pending', 'errors': None,
+        })
+
+        again = self._submit(self.students[0], 'SURGE-1B')
+        self.assertEqual(again.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_drain_writes_registrations_and_derived_rows(self):
+        for i, student in enumerate(self.students):
+            self._submit(student, f'SURGE-{i}')
+
+        output = self._drain('--batch-size', '2')
+        self.assertIn('Accepted 3 and rejected 0 submission(s) in 2 batch(es)', output)
+
+        registration = ExamRegistration.objects.get(user=self.students[0])
+        self.assertEqual(registration.full_name, 'SURGE STUDENT 0')
+        self.assertEqual(CourseEnrollment.objects.filter(course_code='CSE102').count(), 3)
+        self.assertEqual(RegistrationCounter.objects.get().count, 3)
+        self.assertEqual(RegistrationCounter.objects.drift(), {})
+
+        done = self.client.get(self.url, **self._auth(self.students[0]))
+        self.assertTrue(done.data['registered'])
+
+    def test_drain_rejects_conflicting_payment_slip(self):
+        self._submit(self.students[0], 'SURGE-SAME')
+        self._submit(self.students[1], 'SURGE-SAME')
+        self._drain()
+
+        rejected = RegistrationSubmission.objects.get(user=self.students[1])
+        self.assertEqual(rejected.status, RegistrationSubmission.REJECTED)
+        self.assertIn('payment_slip', rejected.errors)
+        response = self.client.get(self.url, **self._auth(self.students[1]))
+        self.assertEqual(response.data['submission']['status'], 'rejected')
+
+        # A rejected student may submit again
+        self.assertEqual(
+            self._submit(self.students[1], 'SURGE-OTHER').status_code,
+            status.HTTP_202_ACCEPTED
+        )
+
+    def test_drain_survives_slip_taken_by_another_drainer(self):
+        """A slip inserted after the batch's checks rejects only that submission."""
+        for i, student in enumerate(self.students[:2]):
+            self._submit(student, f'SURGE-{i}')
+        bulk_register = ExamRegistration.objects.bulk_register
+
+        def racing_bulk_register(registrations):
+            if not ExamRegistration.objects.filter(payment_slip='SURGE-0').exists():
+                # Another drainer commits the same slip first
+                bulk_register([ExamRegistration(
+                    user=self.students[2], payment_status='Yes', payment_slip='SURGE-0',
+                    student_status='regular', courses=['CSE101'], hall_name='Alaol Hall',
+                )])
+            return bulk_register(registrations)
+
+        with mock.patch.object(
+            ExamRegistration.objects, 'bulk_register', side_effect=racing_bulk_register
+        ):
+            output = self._drain()
+        self.assertIn('Accepted 1 and rejected 1 submission(s)', output)
+
+        rejected = RegistrationSubmission.objects.get(user=self.students[0])
+        self.assertEqual(rejected.status, RegistrationSubmission.REJECTED)
+        self.assertIn('payment_slip', rejected.errors)
+        accepted = RegistrationSubmission.objects.get(user=self.students[1])
+        self.assertEqual(accepted.registration.payment_slip, 'SURGE-1')
+        self.assertEqual(RegistrationCounter.objects.drift(), {})
@@ -0,0 +1,88 @@
+"""
+Tests for the seed_scale management command and the synthetic dataset.
+"""
+
+# Relative Path: student_manager/tests/test_seed_scale.py
+
+from collections import Counter
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from accounts.models import SESSION_CHOICES, User
+from student_manager.models import (
+    HALL_CHOICES,
+    CourseEnrollment,
+    ExamRegistration,
+    RegistrationCounter,
+    normalize_course_codes,
+)
+from student_manager.seeding import build_registration, build_student
+
+
+class SeedScaleTests(TestCase):
+    def _seed(self, *args):
+        out = StringIO()
+        call_command('seed_scale', *args, stdout=out)
+        return out.getvalue()
+
+    def test_seeds_users_and_registrations(self):
+        output = self._seed('--users', '60', '--registrations', '45', '--batch-size', '16')
+        self.assertIn('Seeded 60 student(s) and 45 registration(s)', output)
+        self.assertEqual(User.objects.filter(role='student').count(), 60)
+        self.assertEqual(ExamRegistration.objects.count(), 45)
+
+        # Even spread over halls and sessions
+        halls = Counter(ExamRegistration.objects.values_list('hall_name', flat=True))
+        self.assertEqual(set(halls), {value for value, _ in HALL_CHOICES})
+        self.assertLessEqual(max(halls.values()) - min(halls.values()), 1)
+        sessions = Counter(User.objects.values_list('session', flat=True))
+        self.assertEqual(set(sessions), {value for value, _ in SESSION_CHOICES})
+
+        # Derived data is in step and the rows pass model validation
+        self.assertEqual(RegistrationCounter.objects.drift(), {})
+        self.assertEqual(
+            CourseEnrollment.objects.count(),
+            sum(len(normalize_course_codes(r.courses)) for r in ExamRegistration.objects.all()),
+        )
+        student = User.objects.order_by('id').first()
+        student.full_clean()
+        self.assertTrue(student.check_password('seed1234'))
+        self.assertEqual(student.exam_registrations.get().full_name, student.full_name)
+
+    def test_same_seed_same_data_regardless_of_batching(self):
+        first = build_student(7, seed=3, password_hash='')
+        again = build_student(7, seed=3, password_hash='')
+        self.assertEqual(
+            (first.email, first.phone_number, first.gender),
+            (again.email, again.phone_number, again.gender),
+        )
+        self.assertEqual(
+            build_registration(7, 3, first).courses, build_registration(7, 3, again).courses
+        )
+
+        self._seed('--users', '10', '--registrations', '10', '--batch-size', '3', '--seed', '3')
+        stored = User.objects.get(email=first.email)
+        self.assertEqual(stored.varsity_id, first.varsity_id)
+
+    def test_offset_extends_dataset(self):
+        self._seed('--users', '5')
+        with self.assertRaises(CommandError):
+            self._seed('--users', '5')
+        self._seed('--users', '5', '--offset', '5')
+        self.assertEqual(User.objects.count(), 10)
+
+    def test_other_seed_over_existing_students_is_refused(self):
+        """Varsity IDs only depend on the student number, so the guard ignores --seed."""
+        self._seed('--users', '5')
+        with self.assertRaises(CommandError):
+            self._seed('--users', '5', '--seed', '7')
+        # A range that only overlaps further in fails cleanly as well
+        with self.assertRaises(CommandError):
+            self._seed('--users', '5', '--seed', '7', '--offset', '3', '--batch-size', '1')
+        self.assertEqual(User.objects.count(), 5)
+
+    def test_registrations_cannot_exceed_users(self):
+        with self.assertRaises(CommandError):
+            self._seed('--users', '2', '--registrations', '3')
@@ -0,0 +1,122 @@
+"""
+Tests for propagating user profile edits onto exam registration snapshots.
+
+Covers the post_save hook (one UPDATE per changed user, counters moved
+with the session) and the resync_registration_snapshots command.
+"""
+
+# Relative Path: student_manager/tests/test_snapshot_propagation.py
+
+from io import StringIO
+
+from django.core.cache import caches
+from django.core.management import CommandError, call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts import authentication
+from accounts.models import User
+from student_manager.models import ExamRegistration, RegistrationCounter
+
+
+class SnapshotPropagationTests(APITestCase):
+    def setUp(self):
+        caches['shared'].clear()
+        authentication._user_cache.clear()
+        self.student = User.objects.create_user(
+            email="snap@example.com",
+            full_name="Snap Student",
+            role="student",
+            phone_number="01788881111",
+            varsity_id="88881111",
+            session="2023-24",
+            gender="male",
+        )
+        self.registrations = [
+            ExamRegistration.objects.create(
+                user=self.student,
+                payment_status='Yes',
+                student_status=student_status,
+                courses=['CSE101'],
+                hall_name='Alaol Hall',
+            )
+            for student_status in ('regular', 'improvement')
+        ]
+
+    def _snapshots(self):
+        return list(
+            ExamRegistration.objects.order_by('id')
+            .values_list('full_name', 'session', 'phone_number')
+        )
+
+    def _count(self, **key):
+        return sum(RegistrationCounter.objects.filter(**key).values_list('count', flat=True))
+
+    def test_profile_edit_updates_all_registrations_in_one_query(self):
+        user = User.objects.get(pk=self.student.pk)
+        user.phone_number = '01788882222'
+        # SAVEPOINT, UPDATE user, UPDATE registrations, RELEASE
+        with self.assertNumQueries(4):
+            user.save()
+        self.assertEqual(
+            self._snapshots(), [('SNAP STUDENT', '2023-24', '01788882222')] * 2
+        )
+
+    def test_unchanged_snapshot_skips_update(self):
+        user = User.objects.get(pk=self.student.pk)
+        user.is_active = False
+        with self.assertNumQueries(3):
+            user.save()
+
+    def test_session_change_moves_counters(self):
+        user = User.objects.get(pk=self.student.pk)
+        user.session = '2024-25'
+        user.save()
+        self.assertEqual(self._snapshots()[0][1], '2024-25')
+        self.assertEqual(self._count(session='2023-24'), 0)
+        self.assertEqual(self._count(session='2024-25'), 2)
+        self.assertEqual(RegistrationCounter.objects.drift(), {})
+
+    def test_profile_put_refreshes_registration_etag(self):
+        headers = {
+            'HTTP_AUTHORIZATION': f'Bearer {RefreshToken.for_user(self.student).access_token}'
+        }
+        self.registrations[1].delete()
+        url = reverse('my-exam-registration')
+        before = self.client.get(url, **headers)
+        response = self.client.put(
+            reverse('user-profile'),
+            {'full_name': 'New Name', 'password': 'abc123', 'confirm_password': 'abc123'},
+            format='json',
+            **headers,
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        after = self.client.get(url, HTTP_IF_NONE_MATCH=before['ETag'], **headers)
+        self.assertEqual(after.status_code, status.HTTP_200_OK)
+        self.assertEqual(after.data['registration']['full_name'], 'NEW NAME')
+
+    def test_resync_command(self):
+        # Queryset updates bypass the hook and leave snapshots stale
+        User.objects.filter(pk=self.student.pk).update(
+            full_name='BULK RENAMED', session='2024-25'
+        )
+        out = StringIO()
+        call_command(
+            'resync_registration_snapshots', '--session', '2024-25',
+            '--batch-size', '1', stdout=out,
+        )
+        self.assertIn('Updated 2 registration snapshot(s)', out.getvalue())
+        self.assertEqual(
+            self._snapshots(), [('BULK RENAMED', '2024-25', '01788881111')] * 2
+        )
+        self.assertEqual(RegistrationCounter.objects.drift(), {})
+
+        out = StringIO()
+        call_command('resync_registration_snapshots', stdout=out)
+        self.assertIn('Updated 0 registration snapshot(s)', out.getvalue())
+
+    def test_resync_rejects_empty_batches(self):
+        with self.assertRaises(CommandError):
+            call_command('resync_registration_snapshots', '--batch-size', '0', stdout=StringIO())
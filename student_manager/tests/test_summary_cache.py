@@ -0,0 +1,112 @@
+"""
+Tests for the generation-keyed cache of teacher summary pages.
+"""
+
+# Relative Path: student_manager/tests/test_summary_cache.py
+
+from django.core.cache import caches
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts import authentication
+from accounts.models import User
+from student_manager import summary_cache
+from student_manager.models import ExamRegistration
+
+
+class SummaryCacheTests(APITestCase):
+    def setUp(self):
+        caches['shared'].clear()
+        authentication._user_cache.clear()
+        self.url = reverse('exam-reg-summary')
+        self.teacher = User.objects.create_user(
+            email="cacheteacher@example.com",
+            full_name="Cache Teacher",
+            role="teacher",
+            phone_number="01622223333",
+        )
+        self.student = User.objects.create_user(
+            email="cachestudent@example.com",
+            full_name="Cache Student",
+            role="student",
+            phone_number="01622224444",
+            varsity_id="22224444",
+            session="2024-25",
+            gender="male",
+        )
+        self.registration = ExamRegistration.objects.create(
+            user=self.student,
+            payment_status='Yes',
+            student_status='regular',
+            courses=['CSE101'],
+            hall_name='Alaol Hall',
+        )
+        token = RefreshToken.for_user(self.teacher).access_token
+        self.headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+    def _get(self, url=None):
+        return self.client.get(url or self.url, **self.headers)
+
+    def test_hit_serves_same_bytes_without_queries(self):
+        first = self._get()
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        # Warm the cached user so authentication is query-free as well
+        self._get()
+        with self.assertNumQueries(0):
+            again = self._get()
+        self.assertEqual(again.status_code, status.HTTP_200_OK)
+        self.assertEqual(again.content, first.content)
+        self.assertEqual(again['ETag'], first['ETag'])
+
+        revalidated = self.client.get(
+            self.url, HTTP_IF_NONE_MATCH=first['ETag'], **self.headers
+        )
+        self.assertEqual(revalidated.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_pages_are_cached_per_url(self):
+        self._get()
+        filtered = self._get(f"{self.url}?hall=Pritilata Hall")
+        self.assertEqual(filtered.json()['results'], [])
+
+    def test_registration_save_invalidates(self):
+        self._get()
+        self.registration.hall_name = 'Shahjalal Hall'
+        self.registration.save()
+        response = self._get()
+        self.assertEqual(response.json()['results'][0]['hall_name'], 'Shahjalal Hall')
+
+    def test_registration_delete_invalidates(self):
+        self._get()
+        self.registration.delete()
+        self.assertEqual(self._get().json()['results'], [])
+
+    def test_student_profile_change_invalidates(self):
+        before = summary_cache.current_generation()
+        self.student.full_name = 'Renamed Student'
+        self.student.save()
+        self.assertNotEqual(summary_cache.current_generation(), before)
+
+    def test_student_password_change_keeps_cache(self):
+        before = summary_cache.current_generation()
+        self.student.set_password('changed123')
+        self.student.save()
+        self.assertEqual(summary_cache.current_generation(), before)
+
+    def test_student_delete_invalidates(self):
+        self._get()
+        self.student.delete()
+        self.assertEqual(self._get().json()['results'], [])
+
+    def test_teacher_change_keeps_cache(self):
+        before = summary_cache.current_generation()
+        self.teacher.full_name = 'Renamed Teacher'
+        self.teacher.save()
+        self.assertEqual(summary_cache.current_generation(), before)
+
+    def test_generation_bumped_again_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.registration.save()
+            during = summary_cache.current_generation()
+        self.assertNotEqual(summary_cache.current_generation(), during)
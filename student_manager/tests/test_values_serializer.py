@@ -0,0 +1,58 @@
+"""
+Tests for ValuesListSerializer: the .values() list path renders the same
+bytes as serializing model instances.
+"""
+
+# Relative Path: student_manager/tests/test_values_serializer.py
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+
+from student_manager.models import ExamRegistration
+from student_manager.seeding import seed_dataset
+from student_manager.serializers import (
+    ExamRegistrationSerializer,
+    ValuesListSerializer,
+    values_rows,
+)
+
+
+def _instance_bytes(queryset):
+    return JSONRenderer().render([ExamRegistrationSerializer(reg).data for reg in queryset])
+
+
+class ValuesListSerializerTests(TestCase):
+    def setUp(self):
+        seed_dataset(users=30, registrations=30, batch_size=30)
+        # Unpaid registrations have no slip
+        self.assertTrue(ExamRegistration.objects.filter(payment_slip=None).exists())
+        self.queryset = ExamRegistration.objects.order_by('created_at', 'id')
+
+    def test_same_bytes_as_instance_serialization(self):
+        serializer = ExamRegistrationSerializer(self.queryset, many=True)
+        self.assertIsInstance(serializer, ValuesListSerializer)
+        with self.assertNumQueries(1):
+            rendered = JSONRenderer().render(serializer.data)
+        self.assertEqual(rendered, _instance_bytes(self.queryset))
+
+    def test_values_rows_in_another_timezone(self):
+        with timezone.override('Asia/Dhaka'):
+            rows = list(values_rows(ExamRegistrationSerializer, self.queryset))
+            rendered = JSONRenderer().render(ExamRegistrationSerializer(rows, many=True).data)
+            self.assertIn(b'+06:00', rendered)
+            self.assertEqual(rendered, _instance_bytes(self.queryset))
+
+    def test_unsupported_fields_use_the_instance_path(self):
+        class WithMethodField(ExamRegistrationSerializer):
+            hall_upper = serializers.SerializerMethodField()
+
+            class Meta(ExamRegistrationSerializer.Meta):
+                fields = ExamRegistrationSerializer.Meta.fields + ['hall_upper']
+
+            def get_hall_upper(self, registration):
+                return registration.hall_name.upper()
+
+        data = WithMethodField(self.queryset, many=True).data
+        self.assertEqual(data[0]['hall_upper'], self.queryset.first().hall_name.upper())
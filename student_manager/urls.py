@@ -6,7 +6,14 @@ Maps exam registration-related views to their endpoints.
 # Relative Path: student_manager/urls.py
 
 from django.urls import path
-from .views import MyExamRegistration, ExamRegistrationSummary
+from .views import (
+    MyExamRegistration,
+    ExamRegistrationSummary,
+    ExamRegistrationExport,
+    ExamRegistrationStats,
+    CourseRoster,
+    CourseRegistrationCount,
+)
 
 urlpatterns = [
     path(
@@ -19,4 +26,24 @@ urlpatterns = [
         ExamRegistrationSummary.as_view(),
         name="exam-reg-summary"
     ),
+    path(
+        "exam-registration-export/<str:export_format>/",
+        ExamRegistrationExport.as_view(),
+        name="exam-reg-export"
+    ),
+    path(
+        "exam-registration-stats/",
+        ExamRegistrationStats.as_view(),
+        name="exam-reg-stats"
+    ),
+    path(
+        "courses/<str:course_code>/roster/",
+        CourseRoster.as_view(),
+        name="course-roster"
+    ),
+    path(
+        "courses/<str:course_code>/count/",
+        CourseRegistrationCount.as_view(),
+        name="course-count"
+    ),
 ]
@@ -1,19 +1,42 @@
 """
 Views for handling exam registration-related actions:
 - Students can view, create, and update their exam registration.
-- Teachers can view a summary of all registrations.
+- Teachers can view a summary of all registrations, export them,
+  read aggregate registration counts, and look up per-course rosters.
 """
 
 # Relative Path: student_manager/views.py
 
-
+from django.conf import settings
+from django.http import Http404, HttpResponse, StreamingHttpResponse
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .models import ExamRegistration
-from .serializers import ExamRegistrationSerializer
+from cupcp_backend.conditional import not_modified, wants_revalidation, weak_etag, with_etag
+
+from . import summary_cache
+from .exports import EXPORT_FORMATS
+from .filters import filter_registrations
+from .models import (
+    CourseEnrollment,
+    ExamRegistration,
+    RegistrationCounter,
+    RegistrationSubmission,
+)
+from .pagination import KeysetPagination
+from .permissions import IsTeacher
+from .serializers import ExamRegistrationSerializer, values_rows
+from .submission_queue import AlreadyQueued, enqueue_submission, submission_status
+
+
+def registration_etag(user, *version):
+    """
+    ETag of a student's GET exam-registration/my/ response: the user
+    snapshot plus the version of the registration or submission shown.
+    """
+    return weak_etag(user.pk, user.updated_at, *version)
 
 
 class MyExamRegistration(APIView):
@@ -22,13 +45,32 @@ class MyExamRegistration(APIView):
     - GET: View their current exam registration (if exists)
     - POST: Submit a new exam registration (once only)
     - PUT: Update their existing registration
+
+    In surge mode (settings.REGISTRATION_SURGE_MODE) POST only queues the
+    validated payload and returns 202 with a ticket; GET reports the
+    ticket status until the registration exists.
     """
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
         """
         Returns the student's registration status and user snapshot.
+        Sends a weak ETag; a matching If-None-Match is answered with 304
+        after reading only the registration's id and updated_at.
         """
+        if wants_revalidation(request):
+            row = (
+                ExamRegistration.objects.filter(user=request.user)
+                .values("id", "updated_at").first()
+            )
+            if row is not None:
+                response = not_modified(
+                    request,
+                    registration_etag(request.user, "registration", row["id"], row["updated_at"])
+                )
+                if response is not None:
+                    return response
+
         user_data = {
             "full_name": request.user.full_name,
             "varsity_id": request.user.varsity_id,
@@ -39,16 +81,31 @@ class MyExamRegistration(APIView):
         try:
             reg = ExamRegistration.objects.get(user=request.user)
             serialized = ExamRegistrationSerializer(reg)
-            return Response({
-                "registered": True,
-                "registration": serialized.data,
-                "user": user_data,
-            })
+            return with_etag(
+                Response({
+                    "registered": True,
+                    "registration": serialized.data,
+                    "user": user_data,
+                }),
+                registration_etag(request.user, "registration", reg.id, reg.updated_at)
+            )
         except ExamRegistration.DoesNotExist:
-            return Response({
+            data = {
                 "registered": False,
                 "user": user_data,
-            })
+            }
+            submission = (
+                RegistrationSubmission.objects.filter(user=request.user)
+                .order_by("-id").first()
+            )
+            if submission is None:
+                etag = registration_etag(request.user)
+            else:
+                data["submission"] = submission_status(submission)
+                etag = registration_etag(
+                    request.user, "submission", submission.id, submission.status
+                )
+            return not_modified(request, etag) or with_etag(Response(data), etag)
 
     def post(self, request):
         """
@@ -61,15 +118,34 @@ class MyExamRegistration(APIView):
             )
 
         serializer = ExamRegistrationSerializer(data=request.data)
-        if serializer.is_valid():
-            # Auto-link to user so snapshot fields populate
-            serializer.save(user=request.user)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        if settings.REGISTRATION_SURGE_MODE:
+            return self._enqueue(request, serializer.validated_data)
+
+        # Auto-link to user so snapshot fields populate
+        serializer.save(user=request.user)
+        return Response(
+            {"registered": True, "registration": serializer.data},
+            status=status.HTTP_201_CREATED
+        )
+
+    def _enqueue(self, request, validated_data):
+        """
+        Queues a validated registration and returns 202 with its ticket.
+        """
+        try:
+            submission = enqueue_submission(request.user, validated_data)
+        except AlreadyQueued:
             return Response(
-                {"registered": True, "registration": serializer.data},
-                status=status.HTTP_201_CREATED
+                {"detail": "Your registration is already queued."},
+                status=status.HTTP_400_BAD_REQUEST
             )
-
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        return Response(
+            {"registered": False, "submission": submission_status(submission)},
+            status=status.HTTP_202_ACCEPTED
+        )
 
     def put(self, request):
         """
@@ -96,13 +172,22 @@ class MyExamRegistration(APIView):
 
 class ExamRegistrationSummary(APIView):
     """
-    Returns all exam registrations — restricted to teacher users.
+    Returns exam registrations page by page — restricted to teacher users.
     """
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
 
     def get(self, request):
         """
         Allows teachers to view a summary of all student registrations.
+        Results are keyset-paginated; follow the ``next`` link to continue.
+        Supports ?hall=, ?session=, ?payment_status= and ?student_status= filters.
+        The ETag is the summary generation plus the URL, so revalidation
+        never scans the registrations.
+
+        JSON pages are cached per URL under the summary generation (see
+        summary_cache.py); hits are served as stored bytes with no query and
+        no serialization.
         """
         if request.user.role != "teacher":
             return Response(
@@ -110,6 +195,128 @@ class ExamRegistrationSummary(APIView):
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        registrations = ExamRegistration.objects.select_related("user").all()
-        serialized = ExamRegistrationSerializer(registrations, many=True)
-        return Response(serialized.data, status=status.HTTP_200_OK)
+        # Read the generation before the data, so a concurrent write can only
+        # orphan this page and its ETag, never leave them stale under a live one
+        generation = summary_cache.current_generation()
+        etag = weak_etag(
+            generation, request.accepted_renderer.format, request.get_full_path()
+        )
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+
+        cacheable = request.accepted_renderer.format == "json"
+        if cacheable:
+            key = summary_cache.page_key(generation, request.build_absolute_uri())
+            content = summary_cache.get_page(key)
+            if content is not None:
+                return with_etag(HttpResponse(content, content_type="application/json"), etag)
+
+        queryset = filter_registrations(ExamRegistration.objects.all(), request.query_params)
+        paginator = self.pagination_class()
+        # Rows are fetched as .values() dicts; see ValuesListSerializer
+        page = paginator.paginate_queryset(
+            values_rows(ExamRegistrationSerializer, queryset), request, view=self
+        )
+        serialized = ExamRegistrationSerializer(page, many=True)
+        response = with_etag(paginator.get_paginated_response(serialized.data), etag)
+        if cacheable:
+            response.add_post_render_callback(
+                lambda rendered: summary_cache.set_page(key, rendered.content)
+            )
+        return response
+
+
+class ExamRegistrationExport(APIView):
+    """
+    Streams all exam registrations as CSV or JSON Lines — teachers only.
+    Accepts the same filters as ExamRegistrationSummary.
+    """
+    permission_classes = [IsAuthenticated, IsTeacher]
+
+    def get(self, request, export_format):
+        """
+        Streams the export; rows are encoded as they are read from the database.
+        """
+        try:
+            stream, content_type = EXPORT_FORMATS[export_format]
+        except KeyError:
+            raise Http404("Unsupported export format.")
+
+        registrations = filter_registrations(
+            ExamRegistration.objects.all(), request.query_params
+        )
+        response = StreamingHttpResponse(stream(registrations), content_type=content_type)
+        response["Content-Disposition"] = (
+            f'attachment; filename="exam-registrations.{export_format}"'
+        )
+        return response
+
+
+class ExamRegistrationStats(APIView):
+    """
+    Returns registration counts by hall, session, payment and student
+    status — teachers only. Reads the maintained counters, so the cost
+    does not depend on the number of registrations.
+    """
+    permission_classes = [IsAuthenticated, IsTeacher]
+
+    def get(self, request):
+        """
+        Returns overall totals plus per-hall and per-session breakdowns.
+        Registrations without a hall or session are grouped under "".
+        """
+        def empty_group():
+            return {"registrations": 0, "payment_status": {}, "student_status": {}}
+
+        def add(group, bucket):
+            group["registrations"] += bucket.count
+            for field in ("payment_status", "student_status"):
+                value = getattr(bucket, field)
+                group[field][value] = group[field].get(value, 0) + bucket.count
+
+        totals, by_hall, by_session = empty_group(), {}, {}
+        for bucket in RegistrationCounter.objects.filter(count__gt=0):
+            add(totals, bucket)
+            add(by_hall.setdefault(bucket.hall_name, empty_group()), bucket)
+            add(by_session.setdefault(bucket.session, empty_group()), bucket)
+
+        return Response(
+            {"totals": totals, "by_hall": by_hall, "by_session": by_session},
+            status=status.HTTP_200_OK
+        )
+
+
+class CourseRoster(APIView):
+    """
+    Lists the registrations that include a course — teachers only.
+    Served from the CourseEnrollment index and keyset-paginated like the summary.
+    """
+    permission_classes = [IsAuthenticated, IsTeacher]
+    pagination_class = KeysetPagination
+
+    def get(self, request, course_code):
+        paginator = self.pagination_class()
+        registrations = ExamRegistration.objects.filter(
+            course_enrollments__course_code=course_code.strip().upper()
+        )
+        page = paginator.paginate_queryset(
+            values_rows(ExamRegistrationSerializer, registrations), request, view=self
+        )
+        serialized = ExamRegistrationSerializer(page, many=True)
+        return paginator.get_paginated_response(serialized.data)
+
+
+class CourseRegistrationCount(APIView):
+    """
+    Returns how many registrations include a course — teachers only.
+    """
+    permission_classes = [IsAuthenticated, IsTeacher]
+
+    def get(self, request, course_code):
+        course_code = course_code.strip().upper()
+        count = CourseEnrollment.objects.filter(course_code=course_code).count()
+        return Response(
+            {"course_code": course_code, "registrations": count},
+            status=status.HTTP_200_OK
+        )